@@ -1,11 +1,11 @@
 # *** submodules *** #
 
-from matrix import constants, decompositions, errors, approximation, nearest
+from matrix import constants, decompositions, errors, approximation, nearest, validation
 
 # *** functions *** #
 
 from matrix.calculate import (is_positive_semidefinite, is_positive_definite, is_invertible,
-                              decompose, solve)
+                              decompose, analyze, solve)
 
 # *** constants *** #
 
@@ -16,7 +16,8 @@ from matrix.constants import (
     NO_PERMUTATION_METHOD,
     DECREASING_DIAGONAL_VALUES_PERMUTATION_METHOD, INCREASING_DIAGONAL_VALUES_PERMUTATION_METHOD,
     DECREASING_ABSOLUTE_DIAGONAL_VALUES_PERMUTATION_METHOD,
-    INCREASING_ABSOLUTE_DIAGONAL_VALUES_PERMUTATION_METHOD)
+    INCREASING_ABSOLUTE_DIAGONAL_VALUES_PERMUTATION_METHOD,
+    VALIDATION_LEVELS, PARANOID_VALIDATION_LEVEL, FAST_VALIDATION_LEVEL)
 
 DECOMPOSITION_TYPES = DECOMPOSITION_TYPES
 """ Supported types of decompositions. """
@@ -24,6 +25,8 @@ UNIVERSAL_PERMUTATION_METHODS = UNIVERSAL_PERMUTATION_METHODS
 """ Supported permutation methods for decompose dense and sparse matrices. """
 SPARSE_ONLY_PERMUTATION_METHODS = SPARSE_ONLY_PERMUTATION_METHODS
 """ Supported permutation methods only for sparse matrices. """
+VALIDATION_LEVELS = VALIDATION_LEVELS
+""" Supported validation levels of internal consistency checks. """
 
 
 # *** version *** #
@@ -1,7 +1,11 @@
 import math
 import cmath
+
+import numpy as np
 import scipy.special
 
+import matrix.validation
+
 _SQRT_THREE = math.sqrt(3)
 
 
@@ -66,3 +70,87 @@ def solver_depressed_cubic(p, q, include_complex_values=True):
     # return
     assert all(cmath.isclose(x**3 + p * x + q, 0, abs_tol=1e-08) for x in roots)
     return roots
+
+
+def solver_depressed_cubics(p, q):
+    """
+    Calculates the real roots of several depressed cubics `x**3 + p * x + q` at once.
+
+    Parameters
+    ----------
+    p : numpy.ndarray
+        The linear coefficients of the depressed cubics.
+    q : numpy.ndarray
+        The constant coefficients of the depressed cubics.
+        It has to be broadcastable to `p`.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape `(k, 3)` where `k` is the number of depressed cubics.
+        The `i`-th row contains the real roots of the `i`-th depressed cubic.
+        Unused entries are padded with NaN.
+    """
+
+    # prepare coefficients
+    p, q = np.broadcast_arrays(np.asanyarray(p), np.asanyarray(q))
+    dtype = np.result_type(p, q, np.float64)
+    p = p.reshape(-1).astype(dtype, copy=False)
+    q = q.reshape(-1).astype(dtype, copy=False)
+    paranoid = matrix.validation.is_paranoid()
+    assert not paranoid or np.all(np.isfinite(p))
+    assert not paranoid or np.all(np.isfinite(q))
+    roots = np.full((len(p), 3), np.nan, dtype=dtype)
+
+    # scale cubics with powers of two to avoid overflow (x = s * y)
+    s = np.maximum(np.sqrt(np.abs(p)), np.cbrt(np.abs(q)))
+    s = np.ldexp(np.ones_like(s), np.frexp(s)[1])
+    p = p / s / s
+    q = q / s / s / s
+
+    # compute discriminant
+    D = (p / 3)**3 + (q / 2)**2
+
+    # one real root and two complex roots (Cardano)
+    mask = D > 0
+    if np.any(mask):
+        p_mask = p[mask]
+        q_mask = q[mask]
+        D_sqrt = np.sqrt(D[mask])
+        u = np.cbrt(- 0.5 * q_mask - np.where(q_mask >= 0, D_sqrt, - D_sqrt))
+        v = - p_mask / (3 * u)
+        # x = u + v = - q / (u**2 - u * v + v**2) avoids cancellation
+        roots[mask, 0] = - q_mask / (u**2 + p_mask / 3 + v**2)
+
+    # three real roots (trigonometric)
+    mask = D < 0
+    if np.any(mask):
+        p_mask = p[mask]
+        q_mask = q[mask]
+        r = 2 * np.sqrt(- p_mask / 3)
+        phi = np.arccos(np.clip(1.5 * q_mask / p_mask * np.sqrt(- 3 / p_mask), -1, 1)) / 3
+        x = r[:, np.newaxis] * np.cos(phi[:, np.newaxis] - np.arange(3) * (2 * np.pi / 3))
+        # root with smallest magnitude by x1 * x2 * x3 = - q avoids cancellation
+        is_smallest = np.arange(3) == np.argmin(np.abs(x), axis=1)[:, np.newaxis]
+        x_others = np.prod(np.where(is_smallest, 1, x), axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_smallest = np.where(x_others != 0, - q_mask / x_others, 0)
+        x[is_smallest] = x_smallest
+        roots[mask] = x
+
+    # one or two real roots
+    mask = D == 0
+    if np.any(mask):
+        p_mask = p[mask]
+        q_mask = q[mask]
+        # zero is triple root
+        is_triple = p_mask == 0
+        # single real root and double real root
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x1 = np.where(is_triple, 0, 3 * q_mask / p_mask)
+        roots[mask, 0] = x1
+        roots[mask, 1] = np.where(is_triple, np.nan, - 0.5 * x1)
+
+    # return
+    roots *= s[:, np.newaxis]
+    return roots
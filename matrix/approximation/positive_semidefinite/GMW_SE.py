@@ -1,74 +1,448 @@
 import numpy as np
+import scipy.sparse
 
+import matrix
+import matrix.constants
 import matrix.decompositions
+import matrix.dense.util
+import matrix.validation
+import matrix.sparse.constants
+import matrix.sparse.permute
+import matrix.sparse.symbolic
+import matrix.sparse.util
 
 
-def _modified_LDLt(A, choose_d, choose_d_state=None, overwrite_A=False):
+MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD = 'maximal_absolute_diagonal_value'
+""" Permutation method supported by the GMW and SE algorithms. """
+GERSHGORIN_PERMUTATION_METHOD = 'gershgorin'
+""" Permutation method supported by the GMW and SE algorithms. """
+GMW_SE_PERMUTATION_METHODS = (matrix.constants.NO_PERMUTATION_METHOD, MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD, GERSHGORIN_PERMUTATION_METHOD)
+""" Permutation methods supported by the GMW and SE algorithms. """
+
+
+_BLOCK_SIZE = 64
+""" Number of columns of a panel in the blocked modified LDL^T decomposition. """
+
+
+def _modified_LDLt(A, choose_d, choose_d_state=None, choose_pivot=None, overwrite_A=False,
+                   block_size=None):
+    """
+    Computes a modified :math:`LDL^T` decomposition of a symmetric matrix.
+
+    The decomposition is calculated in place in a single working array of which only the
+    lower triangle is used. The columns of a panel are calculated from the previous columns
+    of the panel. The trailing lower triangle is updated once per panel by rank-k updates.
+
+    Parameters
+    ----------
+    A : numpy.ndarray
+        The matrix that should be decomposed. Only its lower triangle is used.
+    choose_d : callable
+        Chooses the value of `D` for the current column. It is called with the current
+        diagonal value `a`, the positions `c_indices` and the values `c_values` of the
+        entries of the current column below the diagonal, the current diagonal `A_diagonal`
+        of the remaining matrix, a function without arguments which returns the remaining
+        matrix (only its lower triangle is valid) and `choose_d_state`. Here the whole column
+        is passed, so `c_indices` is `slice(None)`. It has to return the value of `D` and
+        `choose_d_state`.
+    choose_d_state : dict
+        The state passed to `choose_d`.
+        optional, default: An empty dict.
+    choose_pivot : callable
+        Chooses the pivot of the current iteration. It is called with the current diagonal
+        `A_diagonal` of the remaining matrix, a function without arguments which returns
+        the remaining matrix (only its lower triangle is valid) and `choose_d_state`.
+        It has to return the position of the pivot relative to the current position.
+        optional, default: No pivoting is applied.
+    overwrite_A : bool
+        Whether it is allowed to overwrite `A`. Enabling may result in performance gain.
+        optional, default: False
+    block_size : int
+        The number of columns of a panel.
+        optional, default: :const:`_BLOCK_SIZE`
+
+    Returns
+    -------
+    matrix.decompositions.LDL_Decomposition
+        The modified decomposition including the permutation vector `p`. The changes of the
+        diagonal values of `A` are stored in its attribute `delta`.
+    """
+
+    paranoid = matrix.validation.is_paranoid()
     choose_d_state = choose_d_state if choose_d_state is not None else {}
-    A = A if overwrite_A else A.copy()
-    # decompose
-    n = len(A)
+    if block_size is None:
+        block_size = _BLOCK_SIZE
+
+    # init working array which contains L in its strict lower triangle at the end
+    W = np.array(A, dtype=np.float64, order='F', copy=not overwrite_A)
+    n = len(W)
     p = np.arange(n)
-    L = np.eye(n)
     d = np.empty(n)
     delta = np.empty(n)
+    A_diagonal = W.diagonal().copy()
+    column_buffer = np.empty(n)
+    panel_buffer = np.empty(block_size)
+
+    # first column whose update is not applied to the trailing matrix yet
+    panel_start = 0
+
+    def update_trailing_matrix(k, panel_end):
+        # apply updates of the columns panel_start, ..., panel_end - 1 to W[k:, k:]
+        nonlocal panel_start
+        if panel_start < panel_end:
+            L_panel = W[k:, panel_start:panel_end]
+            LD_panel = L_panel * d[panel_start:panel_end]
+            for j in range(k, n, block_size):
+                j_end = min(j + block_size, n)
+                W[j:, j:j_end] -= LD_panel[j - k:] @ L_panel[j - k:j_end - k].T
+            panel_start = panel_end
+
     for k in range(n):
-        # pivot diagonal element of maximum magnitude
-        j = np.argmax(np.abs(np.diag(A)))
-        j = 0
-        p[k], p[k + j] = p[k + j], p[k]
-        A[0, :], A[j, :] = A[j, :], A[0, :].copy()
-        A[:, 0], A[:, j] = A[:, j], A[:, 0].copy()
-        # update L and d
-        a = A[0, 0]
-        c = A[1:, 0]
-        A = A[1:, 1:]
-        d[k], choose_d_state = choose_d(a, c, A, choose_d_state)
+        # choose pivot and swap positions
+        if choose_pivot is not None:
+            def remaining_matrix():
+                update_trailing_matrix(k, k)
+                return W[k:, k:]
+
+            j = k + choose_pivot(A_diagonal[k:], remaining_matrix, choose_d_state)
+            assert k <= j < n
+            if j != k:
+                p[k], p[j] = p[j], p[k]
+                A_diagonal[k], A_diagonal[j] = A_diagonal[j], A_diagonal[k]
+                W[[k, j], :k] = W[[j, k], :k]
+                matrix.dense.util.swap_symmetric_lower(W, k, j)
+
+        # get current diagonal value and column
+        m = n - k - 1
+        a = A_diagonal[k]
+        c = W[k + 1:, k]
+
+        # apply updates of the previous columns of the panel to the current column
+        if panel_start < k:
+            panel = panel_buffer[:k - panel_start]
+            np.multiply(d[panel_start:k], W[k, panel_start:k], out=panel)
+            c_update = column_buffer[:m]
+            np.dot(W[k + 1:, panel_start:k], panel, out=c_update)
+            c -= c_update
+
+        # choose d
+        def trailing_matrix():
+            update_trailing_matrix(k + 1, k)
+            return W[k + 1:, k + 1:]
+
+        d[k], choose_d_state = choose_d(a, slice(None), c, A_diagonal[k + 1:], trailing_matrix,
+                                        choose_d_state)
         assert d[k] >= 0
         delta[p[k]] = d[k] - a
-        L[k + 1:, k] = c / d[k]
-        A -= np.outer(c, c) / d[k]
+
+        # update diagonal of remaining matrix and calculate column of L
+        c_squared = column_buffer[:m]
+        np.multiply(c, c, out=c_squared)
+        c_squared /= d[k]
+        A_diagonal[k + 1:] -= c_squared
+        c /= d[k]
+
+        # update trailing matrix at end of panel
+        if k + 1 - panel_start >= block_size:
+            update_trailing_matrix(k + 1, k + 1)
+
+    # make L unit lower triangular
+    for k in range(n):
+        W[k, k] = 1
+        W[:k, k] = 0
+
     # return
+    decomposition = matrix.decompositions.LDL_Decomposition(L=W, d=d, p=p)
+    assert not paranoid or decomposition.is_positive_definite()
+    decomposition.delta = delta
+    return decomposition
+
+
+def _modified_LDLt_sparse(A, choose_d, choose_d_state=None, p=None):
+    """
+    Computes a modified :math:`LDL^T` decomposition of a symmetric sparse matrix.
+
+    A left-looking algorithm is used. The strict lower triangle of `L` is stored column by
+    column in growable compressed sparse column arrays whose capacity is preallocated with
+    the column counts of the symbolic factorization. The positions of the entries of each
+    row are additionally stored contiguously in a growable row index so that the columns
+    contributing to the current column are found with one slice.
+
+    Parameters
+    ----------
+    A : scipy.sparse.spmatrix
+        The matrix that should be decomposed. Only its lower triangle is used.
+    choose_d : callable
+        Chooses the value of `D` for the current column. It is called with the same
+        arguments as in :func:`_modified_LDLt`. Only the stored entries of the current
+        column are passed and `c_indices` are their positions below the diagonal. The
+        function returning the remaining matrix returns a sparse matrix.
+    choose_d_state : dict
+        The state passed to `choose_d`.
+        optional, default: An empty dict.
+    p : numpy.ndarray
+        The permutation vector which is applied symmetrically to `A`.
+        optional, default: No permutation is applied.
+
+    Returns
+    -------
+    matrix.decompositions.LDL_Decomposition
+        The modified decomposition with a sparse matrix `L` in CSC format. The changes of the
+        diagonal values of `A` are stored in its attribute `delta`.
+    """
+
+    paranoid = matrix.validation.is_paranoid()
+    choose_d_state = choose_d_state if choose_d_state is not None else {}
+    n = A.shape[0]
+    p = np.arange(n) if p is None else np.asarray(p, dtype=np.int64)
+
+    # permute A and split it in its diagonal and its strict lower triangle
+    A = scipy.sparse.csc_matrix(A, dtype=np.float64)[p][:, p]
+    A_diagonal = A.diagonal()
+    A_lower = scipy.sparse.tril(A, -1, format='csc')
+    A_lower.sort_indices()
+    d = np.empty(n)
+    delta = np.empty(n)
+
+    # growable compressed sparse column arrays of L
+    capacity = max(int(np.sum(matrix.sparse.symbolic.column_counts(A_lower)) - n), 1)
+    L_indptr = np.zeros(n + 1, dtype=np.int64)
+    L_indices = np.empty(capacity, dtype=np.int64)
+    L_data = np.empty(capacity)
+
+    # growable row index of L, the positions of the entries of each row are stored in a
+    # contiguous slot whose capacity is initially the number of entries in the row of A
+    L_row_counts = np.zeros(n, dtype=np.int64)
+    L_row_capacities = np.bincount(A_lower.indices, minlength=n).astype(np.int64) + 1
+    L_row_starts = np.concatenate(([0], np.cumsum(L_row_capacities[:-1]))).astype(np.int64)
+    L_row_positions = np.empty(int(np.sum(L_row_capacities)), dtype=np.int64)
+
+    def L_strict_lower(k):
+        # the already calculated columns 0, ..., k - 1 of L
+        nnz = L_indptr[k]
+        indptr = np.concatenate((L_indptr[:k + 1], np.full(n - k, nnz)))
+        return scipy.sparse.csc_matrix((L_data[:nnz], L_indices[:nnz], indptr), shape=(n, n))
+
+    for k in range(n):
+        a = A_diagonal[k]
+
+        # get entries of k-th row of L
+        L_row_k_start = L_row_starts[k]
+        L_row_k_positions = L_row_positions[L_row_k_start:L_row_k_start + L_row_counts[k]]
+
+        # get k-th column of A below the diagonal
+        A_column_k_indices = A_lower.indices[A_lower.indptr[k]:A_lower.indptr[k + 1]]
+        A_column_k = A_lower.data[A_lower.indptr[k]:A_lower.indptr[k + 1]]
+
+        # subtract contributions of previous columns, their entries below the k-th row follow
+        # the entry in the k-th row because the row indices of each column are sorted
+        if len(L_row_k_positions) > 0:
+            L_row_k_columns = np.searchsorted(L_indptr[:k + 1], L_row_k_positions, side='right') - 1
+            L_row_k_mul_d = L_data[L_row_k_positions] * d[L_row_k_columns]
+            starts = L_row_k_positions + 1
+            lengths = L_indptr[L_row_k_columns + 1] - starts
+            positions = (np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+                         + np.arange(lengths.sum()))
+            contributions = L_data[positions] * np.repeat(L_row_k_mul_d, lengths)
+            c_indices, inverse = np.unique(np.concatenate((A_column_k_indices, L_indices[positions])),
+                                           return_inverse=True)
+            c_values = np.bincount(inverse, weights=np.concatenate((A_column_k, -contributions)),
+                                   minlength=len(c_indices))
+        else:
+            c_indices = A_column_k_indices
+            c_values = A_column_k
+        assert not paranoid or np.all(c_indices > k)
+
+        # choose d
+        def trailing_matrix():
+            L = L_strict_lower(k)[k + 1:, :k]
+            return A[k + 1:, k + 1:] - L @ scipy.sparse.diags(d[:k]) @ L.T
+
+        d[k], choose_d_state = choose_d(a, c_indices - (k + 1), c_values, A_diagonal[k + 1:],
+                                        trailing_matrix, choose_d_state)
+        assert d[k] >= 0
+        delta[p[k]] = d[k] - a
+
+        # update diagonal of remaining matrix and calculate column of L
+        A_diagonal[c_indices] -= c_values**2 / d[k]
+        non_zero_mask = c_values != 0
+        c_indices = c_indices[non_zero_mask]
+        c_values = c_values[non_zero_mask] / d[k]
+
+        # ensure capacity of L
+        start = L_indptr[k]
+        stop = start + len(c_indices)
+        if stop > len(L_indices):
+            capacity = max(2 * len(L_indices), stop)
+            L_indices = np.resize(L_indices, capacity)
+            L_data = np.resize(L_data, capacity)
+
+        # ensure capacity of row index of L, all rows get twice their needed capacity
+        L_row_counts[c_indices] += 1
+        if np.any(L_row_counts[c_indices] > L_row_capacities[c_indices]):
+            L_row_counts[c_indices] -= 1
+            needed_capacities = L_row_counts.copy()
+            needed_capacities[c_indices] += 1
+            L_row_capacities = 2 * needed_capacities + 1
+            L_row_starts_new = np.concatenate(([0], np.cumsum(L_row_capacities[:-1]))).astype(np.int64)
+            rows = np.repeat(np.arange(n), L_row_counts)
+            offsets = np.arange(len(rows)) - np.repeat(np.cumsum(L_row_counts) - L_row_counts, L_row_counts)
+            L_row_positions_new = np.empty(int(np.sum(L_row_capacities)), dtype=np.int64)
+            L_row_positions_new[L_row_starts_new[rows] + offsets] = L_row_positions[L_row_starts[rows] + offsets]
+            L_row_positions = L_row_positions_new
+            L_row_starts = L_row_starts_new
+            L_row_counts[c_indices] += 1
+
+        # store k-th column of L and update row index of L
+        L_indices[start:stop] = c_indices
+        L_data[start:stop] = c_values
+        L_row_positions[L_row_starts[c_indices] + L_row_counts[c_indices] - 1] = np.arange(start, stop)
+        L_indptr[k + 1] = stop
+
+    # return
+    L = L_strict_lower(n) + scipy.sparse.identity(n, format='csc')
+    L.sort_indices()
     decomposition = matrix.decompositions.LDL_Decomposition(L=L, d=d, p=p)
-    assert decomposition.is_positive_definite()
+    assert not paranoid or decomposition.is_positive_definite()
     decomposition.delta = delta
     return decomposition
 
 
-def _modified_A(A, choose_d, choose_d_state=None, min_diag_B=None, max_diag_B=None, overwrite_A=False):
+def _abs_strict_lower_triangle(S):
+    """
+    Returns the absolute values of the strict lower triangle of a dense or sparse matrix.
+    """
+
+    if matrix.sparse.util.is_sparse(S):
+        return abs(scipy.sparse.tril(S, -1))
+    else:
+        return np.abs(np.tril(S, -1))
+
+
+def _abs_off_diagonal_row_sums(S):
+    """
+    Returns the sums of the absolute values of the off-diagonal entries of each row of a symmetric matrix.
+
+    Only the strict lower triangle of the matrix is used.
+    """
+
+    abs_S = _abs_strict_lower_triangle(S)
+    return np.asarray(abs_S.sum(axis=0)).ravel() + np.asarray(abs_S.sum(axis=1)).ravel()
+
+
+def _diagonal_scaling(diag_B, min_diag_B=None, max_diag_B=None):
+    """
+    Returns the diagonal values of a diagonal matrix `S` so that `S B S` has diagonal values between `min_diag_B` and `max_diag_B`.
+    """
+
+    paranoid = matrix.validation.is_paranoid()
+    min_diag_B = -np.inf if min_diag_B is None else min_diag_B
+    max_diag_B = np.inf if max_diag_B is None else max_diag_B
+    assert not paranoid or np.all(diag_B > 0)
+    diag_B_new = np.minimum(np.maximum(diag_B, min_diag_B), max_diag_B)
+    assert not paranoid or np.all(min_diag_B <= diag_B_new)
+    assert not paranoid or np.all(max_diag_B >= diag_B_new)
+    return (diag_B_new / diag_B)**0.5, diag_B_new
+
+
+def _modified_decomposition(A, choose_d, choose_d_state=None, choose_pivot=None, p=None, min_diag_B=None, max_diag_B=None, overwrite_A=False):
+    paranoid = matrix.validation.is_paranoid()
+    is_sparse = matrix.sparse.util.is_sparse(A)
+    diag_A = A.diagonal().copy()
     # calculate modified LDL decomposition
-    decomposition = _modified_LDLt(A, choose_d, choose_d_state=choose_d_state, overwrite_A=False)
+    if is_sparse:
+        decomposition = _modified_LDLt_sparse(A, choose_d, choose_d_state=choose_d_state, p=p)
+    else:
+        decomposition = _modified_LDLt(A, choose_d, choose_d_state=choose_d_state, choose_pivot=choose_pivot, overwrite_A=overwrite_A)
+    delta = decomposition.delta
+    # scale decomposition so that S B S = (S L S^-1) (S D S) (S^-1 L^T S)
+    if min_diag_B is not None or max_diag_B is not None:
+        L = decomposition.L
+        d = decomposition.d
+        p = decomposition.p
+        s, diag_B_new = _diagonal_scaling(diag_A + delta, min_diag_B=min_diag_B, max_diag_B=max_diag_B)
+        s = s[p]
+        if is_sparse:
+            L = (scipy.sparse.diags(s) @ L @ scipy.sparse.diags(1 / s)).tocsc()
+            L.setdiag(1)
+            L_squared = L.multiply(L)
+        else:
+            L *= s[:, np.newaxis]
+            L /= s[np.newaxis, :]
+            L[np.diag_indices(len(L))] = 1
+            L_squared = L**2
+        d = d * s**2
+        decomposition = matrix.decompositions.LDL_Decomposition(L=L, d=d, p=p)
+        decomposition.delta = delta
+        assert not paranoid or np.allclose(L_squared @ d, diag_B_new[p])
+    # return
+    assert not paranoid or np.all(decomposition.d > 0)
+    return decomposition
+
+
+def _modified_A(A, choose_d, choose_d_state=None, choose_pivot=None, p=None, min_diag_B=None, max_diag_B=None, overwrite_A=False):
+    paranoid = matrix.validation.is_paranoid()
+    is_sparse = matrix.sparse.util.is_sparse(A)
+    # calculate modified LDL decomposition
+    decomposition = _modified_decomposition(A, choose_d, choose_d_state=choose_d_state, choose_pivot=choose_pivot, p=p, overwrite_A=False)
     delta = decomposition.delta
     # calculate B
-    B = A if overwrite_A else A.copy()
-    n = len(A)
-    for i in range(n):
-        B[i, i] += delta[i]
-    assert np.allclose(decomposition.composed_matrix, B)
+    n = A.shape[0]
+    if is_sparse:
+        B = (A + scipy.sparse.diags(delta)).asformat(A.format)
+    else:
+        B = A if overwrite_A else A.copy()
+        B[np.diag_indices(n)] += delta
+    assert not paranoid or matrix.util.is_almost_equal(decomposition.composed_matrix, B)
     # set diagonal diagonal values
     if min_diag_B is not None or max_diag_B is not None:
-        min_diag_B = -np.inf if min_diag_B is None else min_diag_B
-        max_diag_B = np.inf if max_diag_B is None else max_diag_B
-        diag_B_old = B.diagonal()
-        assert np.all(diag_B_old > 0)
-        diag_B_new = np.minimum(np.maximum(diag_B_old, min_diag_B), max_diag_B)
-        S = np.diag((diag_B_new / diag_B_old)**0.5)
-        B = S @ B @ S
-        for i in range(n):
-            B[i, i] = diag_B_new[i]
-        assert np.all(min_diag_B <= B.diagonal())
-        assert np.all(max_diag_B >= B.diagonal())
+        s, diag_B_new = _diagonal_scaling(B.diagonal(), min_diag_B=min_diag_B, max_diag_B=max_diag_B)
+        if is_sparse:
+            S = scipy.sparse.diags(s)
+            B = (S @ B @ S).asformat(A.format)
+            B.setdiag(diag_B_new)
+        else:
+            B = B * s[:, np.newaxis] * s[np.newaxis, :]
+            B[np.diag_indices(n)] = diag_B_new
     # return
-    assert matrix.calculate.is_positive_definite(B)
+    assert not paranoid or is_sparse or matrix.calculate.is_positive_definite(B)
     return B
 
 
-def _approximate(A, choose_d, init_choose_d_state, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=False, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=None):
+def _approximate(A, choose_d, init_choose_d_state, min_diag_B=None, max_diag_B=None, min_diag_D=None, permutation_method=None, overwrite_A=False, return_type=None, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=None):
+    paranoid = matrix.validation.is_paranoid()
     # check input
-    A = np.asarray(A)
-    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+    is_sparse = matrix.sparse.util.is_sparse(A)
+    if is_sparse:
+        A = matrix.sparse.util.convert_to_csc(A, sort_indices=True, overwrite_A=overwrite_A)
+        supported_permutation_methods = (matrix.constants.NO_PERMUTATION_METHOD,) + matrix.sparse.constants.FILL_REDUCE_PERMUTATION_METHODS
+        if permutation_method is None:
+            permutation_method = matrix.sparse.constants.DEFAULT_FILL_REDUCE_PERMUTATION_METHOD
+    else:
+        A = np.asarray(A)
+        supported_permutation_methods = GMW_SE_PERMUTATION_METHODS
+        if permutation_method is None:
+            permutation_method = matrix.constants.NO_PERMUTATION_METHOD
+    if len(A.shape) != 2 or A.shape[0] != A.shape[1]:
         raise matrix.errors.MatrixNotSquareError(A)
-    assert np.all(A == A.T)
+    assert not paranoid or matrix.util.is_equal(A, A.T)
+
+    if permutation_method not in supported_permutation_methods:
+        error = ValueError(f'Permutation method {permutation_method} is unknown. Only the '
+                           f'following methods are supported {supported_permutation_methods}.')
+        matrix.logger.error(error)
+        raise error
+    if is_sparse:
+        p = matrix.sparse.permute.fill_reducing_permutation_vector(A, permutation_method=permutation_method)
+    else:
+        p = None
+
+    supported_return_types = matrix.constants.DECOMPOSITION_TYPES
+    if return_type is not None and return_type not in supported_return_types:
+        error = ValueError(f'Unkown return type {return_type}. Only values in '
+                           f'{supported_return_types} are supported.')
+        matrix.logger.error(error)
+        raise error
 
     if min_diag_D is None:
         dtype = np.float64
@@ -79,7 +453,6 @@ def _approximate(A, choose_d, init_choose_d_state, min_diag_B=None, max_diag_B=N
     # init phase
     phase = 1 if use_two_phases else 1.5
     if phase == 1:
-        n = len(A)
         if revisited_version_mu is not None:
             max_abs_diag_A = np.abs(A.diagonal()).max()
             phase_1_min_d_next = -revisited_version_mu * max_abs_diag_A
@@ -90,21 +463,23 @@ def _approximate(A, choose_d, init_choose_d_state, min_diag_B=None, max_diag_B=N
 
     # init choose_d_state
     choose_d_state = {'phase': phase, 'previous_delta': 0}
+    use_gershgorin_bounds = permutation_method == GERSHGORIN_PERMUTATION_METHOD
 
     # define how to choose d
-    def choose_d_both_phases(a, c, A, choose_d_state):
+    def choose_d_both_phases(a, c_indices, c_values, A_diagonal, trailing_matrix, choose_d_state):
         if choose_d_state['phase'] == 1:
-            if a >= min_diag_D and np.all(A.diagonal() - c**2 / a >= phase_1_min_d_next) and np.all(A.diagonal() >= phase_1_min_d_factor * a):
+            # the diagonal values without entries in the column are not changed
+            if a >= min_diag_D and np.all(A_diagonal[c_indices] - c_values**2 / a >= phase_1_min_d_next) and np.all(A_diagonal >= phase_1_min_d_next) and np.all(A_diagonal >= phase_1_min_d_factor * a):
                 d = a
             else:
                 choose_d_state['phase'] = 1.5
 
         if choose_d_state['phase'] == 1.5:
-            choose_d_state = init_choose_d_state(A, choose_d_state)
+            choose_d_state = init_choose_d_state(A_diagonal, trailing_matrix, choose_d_state)
             choose_d_state['phase'] = 2
 
         if choose_d_state['phase'] == 2:
-            d, choose_d_state = choose_d(a, c, A, choose_d_state)
+            d, choose_d_state = choose_d(a, c_values, A_diagonal, choose_d_state)
             d = max(d, min_diag_D)
             a_changed = np.abs(a) if use_abs else a
             if nondecreasing_startegy:
@@ -112,49 +487,83 @@ def _approximate(A, choose_d, init_choose_d_state, min_diag_B=None, max_diag_B=N
             d = max(d, a_changed)
             choose_d_state['previous_delta'] = d - a
 
+            # update sums of absolute off-diagonal values of the rows of the remaining matrix
+            if use_gershgorin_bounds:
+                abs_c = np.abs(c_values)
+                try:
+                    abs_row_sums = choose_d_state['abs_row_sums'][1:]
+                    abs_row_sums[c_indices] -= abs_c
+                except KeyError:
+                    abs_row_sums = _abs_off_diagonal_row_sums(trailing_matrix())
+                abs_row_sums[c_indices] += abs_c * ((abs_c.sum() - abs_c) / d)
+                choose_d_state['abs_row_sums'] = abs_row_sums
+
         return d, choose_d_state
 
+    # define how to choose the pivot
+    if permutation_method == MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD:
+        def choose_pivot(A_diagonal, remaining_matrix, choose_d_state):
+            return np.argmax(np.abs(A_diagonal))
+    elif permutation_method == GERSHGORIN_PERMUTATION_METHOD:
+        def choose_pivot(A_diagonal, remaining_matrix, choose_d_state):
+            if choose_d_state['phase'] == 1:
+                return np.argmax(A_diagonal)
+            else:
+                try:
+                    abs_row_sums = choose_d_state['abs_row_sums']
+                except KeyError:
+                    abs_row_sums = _abs_off_diagonal_row_sums(remaining_matrix())
+                    choose_d_state['abs_row_sums'] = abs_row_sums
+                j = np.argmax(A_diagonal - abs_row_sums)
+                abs_row_sums[0], abs_row_sums[j] = abs_row_sums[j], abs_row_sums[0]
+                return j
+    else:
+        choose_pivot = None
+
+    # calculate decomposition
+    if return_type is not None:
+        decomposition = _modified_decomposition(A, choose_d_both_phases, choose_d_state=choose_d_state, choose_pivot=choose_pivot, p=p, min_diag_B=min_diag_B, max_diag_B=max_diag_B, overwrite_A=overwrite_A)
+        delta = decomposition.delta
+        decomposition = decomposition.as_type(return_type)
+        decomposition.delta = delta
+        return decomposition
+
     # calculate B
-    B = _modified_A(A, choose_d_both_phases, choose_d_state=choose_d_state, min_diag_B=min_diag_B, max_diag_B=max_diag_B, overwrite_A=overwrite_A)
+    B = _modified_A(A, choose_d_both_phases, choose_d_state=choose_d_state, choose_pivot=choose_pivot, p=p, min_diag_B=min_diag_B, max_diag_B=max_diag_B, overwrite_A=overwrite_A)
     return B
 
 
-def _GMW(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=False, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=0.75):
+def _GMW(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, permutation_method=None, overwrite_A=False, return_type=None, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=0.75):
     # calculate beta squared
-    def init_choose_d_state(A, choose_d_state):
+    def init_choose_d_state(A_diagonal, trailing_matrix, choose_d_state):
         dtype = np.float64
         eps = np.finfo(dtype).eps
-        m = len(A)
+        m = len(A_diagonal)
         if m > 1:
-            max_abs_diag_A = 0
-            max_abs_off_diag_A = 0
-            for i in range(len(A)):
-                max_abs_diag_A = max(max_abs_diag_A, np.abs(A[i, i]))
-                for j in range(i):
-                    max_abs_off_diag_A = max(max_abs_off_diag_A, np.abs(A[i, j]))
+            max_abs_diag_A = np.abs(A_diagonal).max()
+            max_abs_off_diag_A = _abs_strict_lower_triangle(trailing_matrix()).max()
             if use_abs:
                 x = m**2 - 1
             else:
                 x = m**2 - m
             beta_squared = max(eps, max_abs_diag_A, max_abs_off_diag_A / x**0.5)
         elif m == 1:
-            beta_squared = max(eps, np.abs(A))
+            beta_squared = max(eps, np.abs(A_diagonal[0]))
         else:
             beta_squared = eps
         choose_d_state['beta_squared'] = beta_squared
         return choose_d_state
 
     # define how to choose d
-    def choose_d(a, c, A, choose_d_state):
+    def choose_d(a, c_values, A_diagonal, choose_d_state):
         beta_squared = choose_d_state['beta_squared']
-        d = np.linalg.norm(c, ord=np.inf)**2 / beta_squared if len(c) > 0 else 0
+        d = np.linalg.norm(c_values, ord=np.inf)**2 / beta_squared if len(c_values) > 0 else 0
         return d, choose_d_state
 
-    B = _approximate(A, choose_d, init_choose_d_state, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, overwrite_A=overwrite_A, use_two_phases=use_two_phases, nondecreasing_startegy=nondecreasing_startegy, use_abs=use_abs, revisited_version_mu=revisited_version_mu)
-    return B
+    return _approximate(A, choose_d, init_choose_d_state, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, permutation_method=permutation_method, overwrite_A=overwrite_A, return_type=return_type, use_two_phases=use_two_phases, nondecreasing_startegy=nondecreasing_startegy, use_abs=use_abs, revisited_version_mu=revisited_version_mu)
 
 
-def _SE(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=False, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=0.1):
+def _SE(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, permutation_method=None, overwrite_A=False, return_type=None, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=0.1):
     dtype = np.float64
     eps = np.finfo(dtype).eps
     if revisited_version_mu is not None:
@@ -162,22 +571,23 @@ def _SE(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=False,
     else:
         tau = eps**(1 / 3)
 
-    def init_choose_d_state(A, choose_d_state):
-        if len(A) > 0:
-            max_abs_diag_A = np.abs(A.diagonal()).max()
+    def init_choose_d_state(A_diagonal, trailing_matrix, choose_d_state):
+        if len(A_diagonal) > 0:
+            max_abs_diag_A = np.abs(A_diagonal).max()
         else:
             max_abs_diag_A = 0
         choose_d_state['tau_max_abs_diag_A'] = tau * max_abs_diag_A
         return choose_d_state
 
-    def choose_d(a, c, A, choose_d_state):
-        m = len(c)
+    def choose_d(a, c_values, A_diagonal, choose_d_state):
+        m = len(A_diagonal)
         # more than two iterations left
         if m > 1:
-            d = max(np.linalg.norm(c, ord=1), choose_d_state['tau_max_abs_diag_A'])
+            d = max(np.linalg.norm(c_values, ord=1), choose_d_state['tau_max_abs_diag_A'])
         # two iterations left
         elif m == 1:
-            lambda_1, lambda_2 = np.sort(np.linalg.eigvalsh(np.array([[a, c], [c, A]], dtype=dtype)))
+            c_0 = c_values[0] if len(c_values) > 0 else 0
+            lambda_1, lambda_2 = np.sort(np.linalg.eigvalsh(np.array([[a, c_0], [c_0, A_diagonal[0]]], dtype=dtype)))
             d = a - lambda_1 + max(tau * (lambda_2 - lambda_1) / (1 - tau), choose_d_state['tau_max_abs_diag_A'])
             if use_abs:
                 d = max(d, a - 2 * lambda_1)
@@ -190,11 +600,10 @@ def _SE(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=False,
                 d = max((- eps**(1 / 3) * a) / (1 - eps**(1 / 3)), choose_d_state['tau_max_abs_diag_A'])
         return d, choose_d_state
 
-    B = _approximate(A, choose_d, init_choose_d_state, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, overwrite_A=overwrite_A, use_two_phases=use_two_phases, nondecreasing_startegy=nondecreasing_startegy, use_abs=use_abs, revisited_version_mu=revisited_version_mu)
-    return B
+    return _approximate(A, choose_d, init_choose_d_state, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, permutation_method=permutation_method, overwrite_A=overwrite_A, return_type=return_type, use_two_phases=use_two_phases, nondecreasing_startegy=nondecreasing_startegy, use_abs=use_abs, revisited_version_mu=revisited_version_mu)
 
 
-def GMW_81(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=False):
+def GMW_81(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, permutation_method=None, overwrite_A=False, return_type=None):
     """
     Computes a positive definite approximation of `A`.
 
@@ -203,9 +612,10 @@ def GMW_81(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fal
 
     Parameters
     ----------
-    A : numpy.ndarray
+    A : numpy.ndarray or scipy.sparse.spmatrix
         The matrix that should be approximated.
         `A` must be symmetric.
+        If `A` is sparse, the CSC format is preferred.
     min_diag_B : numpy.ndarray or float
         Each component of the diagonal of the returned matrix
         is forced to be greater or equal to `min_diag_B`.
@@ -219,19 +629,45 @@ def GMW_81(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fal
         of the returned matrix is forced to be greater or equal to `min_diag_D`.
         `min_diag_D` must be positive.
         optional, default : Is chosen by the algorithm.
+    permutation_method : str
+        The symmetric permutation method that is applied to the matrix during the decomposition.
+        It has to be a value in
+        :const:`matrix.approximation.positive_semidefinite.GMW_SE_PERMUTATION_METHODS`.
+        If it is :const:`matrix.approximation.positive_semidefinite.MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD`,
+        the remaining diagonal value with maximal absolute value is used as pivot.
+        If it is :const:`matrix.approximation.positive_semidefinite.GERSHGORIN_PERMUTATION_METHOD`,
+        the maximal remaining diagonal value is used as pivot as long as no changes of the
+        diagonal are needed and afterwards the maximal lower Gershgorin bound of the remaining
+        matrix. The Gershgorin bounds are estimated and updated in each iteration as
+        described by Schnabel and Eskow.
+        If `A` is sparse, it has to be :const:`matrix.NO_PERMUTATION_METHOD` or a value in
+        :const:`matrix.SPARSE_ONLY_PERMUTATION_METHODS`.
+        optional, default: no permutation if `A` is dense and
+        :const:`matrix.sparse.constants.DEFAULT_FILL_REDUCE_PERMUTATION_METHOD` if `A` is sparse
     overwrite_A : bool
         Whether it is allowed to overwrite `A`. Enabling may result in performance gain.
         optional, default: False
+    return_type : str
+        If passed, a decomposition of the approximation of this type is returned instead of
+        the approximation itself. The approximation is not calculated in this case.
+        It has to be a value in :const:`matrix.DECOMPOSITION_TYPES`.
+        The changes of the diagonal values of `A`, before the diagonal values are restricted
+        by `min_diag_B` and `max_diag_B`, are stored in the attribute `delta` of the
+        decomposition.
+        optional, default : The approximation is returned.
 
     Returns
     -------
-    B : numpy.ndarray
-        An approximation of `A` which is positive definite.
+    B : numpy.ndarray or scipy.sparse.spmatrix or matrix.decompositions.DecompositionBase
+        An approximation of `A` which is positive definite or its decomposition
+        if `return_type` is passed. It is sparse if `A` is sparse.
 
     Raises
     ------
     matrix.errors.MatrixNotSquareError
         If `A` is not a square matrix.
+    ValueError
+        If `permutation_method` or `return_type` is unknown.
 
     Notes
     -----
@@ -250,10 +686,10 @@ def GMW_81(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fal
         Mathematical Programming, 2008, 115, 319-349
     """
 
-    return _GMW(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, overwrite_A=overwrite_A, use_two_phases=False, nondecreasing_startegy=False, use_abs=True, revisited_version_mu=None)
+    return _GMW(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, permutation_method=permutation_method, overwrite_A=overwrite_A, return_type=return_type, use_two_phases=False, nondecreasing_startegy=False, use_abs=True, revisited_version_mu=None)
 
 
-def GMW_T1(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=False):
+def GMW_T1(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, permutation_method=None, overwrite_A=False, return_type=None):
     """
     Computes a positive definite approximation of `A`.
 
@@ -262,9 +698,10 @@ def GMW_T1(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fal
 
     Parameters
     ----------
-    A : numpy.ndarray
+    A : numpy.ndarray or scipy.sparse.spmatrix
         The matrix that should be approximated.
         `A` must be symmetric.
+        If `A` is sparse, the CSC format is preferred.
     min_diag_B : numpy.ndarray or float
         Each component of the diagonal of the returned matrix
         is forced to be greater or equal to `min_diag_B`.
@@ -278,19 +715,45 @@ def GMW_T1(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fal
         of the returned matrix is forced to be greater or equal to `min_diag_D`.
         `min_diag_D` must be positive.
         optional, default : Is chosen by the algorithm.
+    permutation_method : str
+        The symmetric permutation method that is applied to the matrix during the decomposition.
+        It has to be a value in
+        :const:`matrix.approximation.positive_semidefinite.GMW_SE_PERMUTATION_METHODS`.
+        If it is :const:`matrix.approximation.positive_semidefinite.MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD`,
+        the remaining diagonal value with maximal absolute value is used as pivot.
+        If it is :const:`matrix.approximation.positive_semidefinite.GERSHGORIN_PERMUTATION_METHOD`,
+        the maximal remaining diagonal value is used as pivot as long as no changes of the
+        diagonal are needed and afterwards the maximal lower Gershgorin bound of the remaining
+        matrix. The Gershgorin bounds are estimated and updated in each iteration as
+        described by Schnabel and Eskow.
+        If `A` is sparse, it has to be :const:`matrix.NO_PERMUTATION_METHOD` or a value in
+        :const:`matrix.SPARSE_ONLY_PERMUTATION_METHODS`.
+        optional, default: no permutation if `A` is dense and
+        :const:`matrix.sparse.constants.DEFAULT_FILL_REDUCE_PERMUTATION_METHOD` if `A` is sparse
     overwrite_A : bool
         Whether it is allowed to overwrite `A`. Enabling may result in performance gain.
         optional, default: False
+    return_type : str
+        If passed, a decomposition of the approximation of this type is returned instead of
+        the approximation itself. The approximation is not calculated in this case.
+        It has to be a value in :const:`matrix.DECOMPOSITION_TYPES`.
+        The changes of the diagonal values of `A`, before the diagonal values are restricted
+        by `min_diag_B` and `max_diag_B`, are stored in the attribute `delta` of the
+        decomposition.
+        optional, default : The approximation is returned.
 
     Returns
     -------
-    B : numpy.ndarray
-        An approximation of `A` which is positive definite.
+    B : numpy.ndarray or scipy.sparse.spmatrix or matrix.decompositions.DecompositionBase
+        An approximation of `A` which is positive definite or its decomposition
+        if `return_type` is passed. It is sparse if `A` is sparse.
 
     Raises
     ------
     matrix.errors.MatrixNotSquareError
         If `A` is not a square matrix.
+    ValueError
+        If `permutation_method` or `return_type` is unknown.
 
     Notes
     -----
@@ -309,10 +772,10 @@ def GMW_T1(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fal
         Academic press, 1981
     """
 
-    return _GMW(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, overwrite_A=overwrite_A, use_two_phases=True, nondecreasing_startegy=True, use_abs=True, revisited_version_mu=0.75)
+    return _GMW(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, permutation_method=permutation_method, overwrite_A=overwrite_A, return_type=return_type, use_two_phases=True, nondecreasing_startegy=True, use_abs=True, revisited_version_mu=0.75)
 
 
-def GMW_T2(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=False):
+def GMW_T2(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, permutation_method=None, overwrite_A=False, return_type=None):
     """
     Computes a positive definite approximation of `A`.
 
@@ -321,9 +784,10 @@ def GMW_T2(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fal
 
     Parameters
     ----------
-    A : numpy.ndarray
+    A : numpy.ndarray or scipy.sparse.spmatrix
         The matrix that should be approximated.
         `A` must be symmetric.
+        If `A` is sparse, the CSC format is preferred.
     min_diag_B : numpy.ndarray or float
         Each component of the diagonal of the returned matrix
         is forced to be greater or equal to `min_diag_B`.
@@ -337,19 +801,45 @@ def GMW_T2(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fal
         of the returned matrix is forced to be greater or equal to `min_diag_D`.
         `min_diag_D` must be positive.
         optional, default : Is chosen by the algorithm.
+    permutation_method : str
+        The symmetric permutation method that is applied to the matrix during the decomposition.
+        It has to be a value in
+        :const:`matrix.approximation.positive_semidefinite.GMW_SE_PERMUTATION_METHODS`.
+        If it is :const:`matrix.approximation.positive_semidefinite.MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD`,
+        the remaining diagonal value with maximal absolute value is used as pivot.
+        If it is :const:`matrix.approximation.positive_semidefinite.GERSHGORIN_PERMUTATION_METHOD`,
+        the maximal remaining diagonal value is used as pivot as long as no changes of the
+        diagonal are needed and afterwards the maximal lower Gershgorin bound of the remaining
+        matrix. The Gershgorin bounds are estimated and updated in each iteration as
+        described by Schnabel and Eskow.
+        If `A` is sparse, it has to be :const:`matrix.NO_PERMUTATION_METHOD` or a value in
+        :const:`matrix.SPARSE_ONLY_PERMUTATION_METHODS`.
+        optional, default: no permutation if `A` is dense and
+        :const:`matrix.sparse.constants.DEFAULT_FILL_REDUCE_PERMUTATION_METHOD` if `A` is sparse
     overwrite_A : bool
         Whether it is allowed to overwrite `A`. Enabling may result in performance gain.
         optional, default: False
+    return_type : str
+        If passed, a decomposition of the approximation of this type is returned instead of
+        the approximation itself. The approximation is not calculated in this case.
+        It has to be a value in :const:`matrix.DECOMPOSITION_TYPES`.
+        The changes of the diagonal values of `A`, before the diagonal values are restricted
+        by `min_diag_B` and `max_diag_B`, are stored in the attribute `delta` of the
+        decomposition.
+        optional, default : The approximation is returned.
 
     Returns
     -------
-    B : numpy.ndarray
-        An approximation of `A` which is positive definite.
+    B : numpy.ndarray or scipy.sparse.spmatrix or matrix.decompositions.DecompositionBase
+        An approximation of `A` which is positive definite or its decomposition
+        if `return_type` is passed. It is sparse if `A` is sparse.
 
     Raises
     ------
     matrix.errors.MatrixNotSquareError
         If `A` is not a square matrix.
+    ValueError
+        If `permutation_method` or `return_type` is unknown.
 
     Notes
     -----
@@ -368,10 +858,10 @@ def GMW_T2(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fal
         Academic press, 1981
     """
 
-    return _GMW(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, overwrite_A=overwrite_A, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=0.75)
+    return _GMW(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, permutation_method=permutation_method, overwrite_A=overwrite_A, return_type=return_type, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=0.75)
 
 
-def SE_90(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=False):
+def SE_90(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, permutation_method=None, overwrite_A=False, return_type=None):
     """
     Computes a positive definite approximation of `A`.
 
@@ -380,9 +870,10 @@ def SE_90(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fals
 
     Parameters
     ----------
-    A : numpy.ndarray
+    A : numpy.ndarray or scipy.sparse.spmatrix
         The matrix that should be approximated.
         `A` must be symmetric.
+        If `A` is sparse, the CSC format is preferred.
     min_diag_B : numpy.ndarray or float
         Each component of the diagonal of the returned matrix
         is forced to be greater or equal to `min_diag_B`.
@@ -396,19 +887,45 @@ def SE_90(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fals
         of the returned matrix is forced to be greater or equal to `min_diag_D`.
         `min_diag_D` must be positive.
         optional, default : Is chosen by the algorithm.
+    permutation_method : str
+        The symmetric permutation method that is applied to the matrix during the decomposition.
+        It has to be a value in
+        :const:`matrix.approximation.positive_semidefinite.GMW_SE_PERMUTATION_METHODS`.
+        If it is :const:`matrix.approximation.positive_semidefinite.MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD`,
+        the remaining diagonal value with maximal absolute value is used as pivot.
+        If it is :const:`matrix.approximation.positive_semidefinite.GERSHGORIN_PERMUTATION_METHOD`,
+        the maximal remaining diagonal value is used as pivot as long as no changes of the
+        diagonal are needed and afterwards the maximal lower Gershgorin bound of the remaining
+        matrix. The Gershgorin bounds are estimated and updated in each iteration as
+        described by Schnabel and Eskow.
+        If `A` is sparse, it has to be :const:`matrix.NO_PERMUTATION_METHOD` or a value in
+        :const:`matrix.SPARSE_ONLY_PERMUTATION_METHODS`.
+        optional, default: no permutation if `A` is dense and
+        :const:`matrix.sparse.constants.DEFAULT_FILL_REDUCE_PERMUTATION_METHOD` if `A` is sparse
     overwrite_A : bool
         Whether it is allowed to overwrite `A`. Enabling may result in performance gain.
         optional, default: False
+    return_type : str
+        If passed, a decomposition of the approximation of this type is returned instead of
+        the approximation itself. The approximation is not calculated in this case.
+        It has to be a value in :const:`matrix.DECOMPOSITION_TYPES`.
+        The changes of the diagonal values of `A`, before the diagonal values are restricted
+        by `min_diag_B` and `max_diag_B`, are stored in the attribute `delta` of the
+        decomposition.
+        optional, default : The approximation is returned.
 
     Returns
     -------
-    B : numpy.ndarray
-        An approximation of `A` which is positive definite.
+    B : numpy.ndarray or scipy.sparse.spmatrix or matrix.decompositions.DecompositionBase
+        An approximation of `A` which is positive definite or its decomposition
+        if `return_type` is passed. It is sparse if `A` is sparse.
 
     Raises
     ------
     matrix.errors.MatrixNotSquareError
         If `A` is not a square matrix.
+    ValueError
+        If `permutation_method` or `return_type` is unknown.
 
     Notes
     -----
@@ -427,10 +944,10 @@ def SE_90(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fals
         Mathematical Programming, 2008, 115, 319-349
     """
 
-    return _SE(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, overwrite_A=overwrite_A, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=None)
+    return _SE(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, permutation_method=permutation_method, overwrite_A=overwrite_A, return_type=return_type, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=None)
 
 
-def SE_99(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=False):
+def SE_99(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, permutation_method=None, overwrite_A=False, return_type=None):
     """
     Computes a positive definite approximation of `A`.
 
@@ -439,9 +956,10 @@ def SE_99(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fals
 
     Parameters
     ----------
-    A : numpy.ndarray
+    A : numpy.ndarray or scipy.sparse.spmatrix
         The matrix that should be approximated.
         `A` must be symmetric.
+        If `A` is sparse, the CSC format is preferred.
     min_diag_B : numpy.ndarray or float
         Each component of the diagonal of the returned matrix
         is forced to be greater or equal to `min_diag_B`.
@@ -455,19 +973,45 @@ def SE_99(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fals
         of the returned matrix is forced to be greater or equal to `min_diag_D`.
         `min_diag_D` must be positive.
         optional, default : Is chosen by the algorithm.
+    permutation_method : str
+        The symmetric permutation method that is applied to the matrix during the decomposition.
+        It has to be a value in
+        :const:`matrix.approximation.positive_semidefinite.GMW_SE_PERMUTATION_METHODS`.
+        If it is :const:`matrix.approximation.positive_semidefinite.MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD`,
+        the remaining diagonal value with maximal absolute value is used as pivot.
+        If it is :const:`matrix.approximation.positive_semidefinite.GERSHGORIN_PERMUTATION_METHOD`,
+        the maximal remaining diagonal value is used as pivot as long as no changes of the
+        diagonal are needed and afterwards the maximal lower Gershgorin bound of the remaining
+        matrix. The Gershgorin bounds are estimated and updated in each iteration as
+        described by Schnabel and Eskow.
+        If `A` is sparse, it has to be :const:`matrix.NO_PERMUTATION_METHOD` or a value in
+        :const:`matrix.SPARSE_ONLY_PERMUTATION_METHODS`.
+        optional, default: no permutation if `A` is dense and
+        :const:`matrix.sparse.constants.DEFAULT_FILL_REDUCE_PERMUTATION_METHOD` if `A` is sparse
     overwrite_A : bool
         Whether it is allowed to overwrite `A`. Enabling may result in performance gain.
         optional, default: False
+    return_type : str
+        If passed, a decomposition of the approximation of this type is returned instead of
+        the approximation itself. The approximation is not calculated in this case.
+        It has to be a value in :const:`matrix.DECOMPOSITION_TYPES`.
+        The changes of the diagonal values of `A`, before the diagonal values are restricted
+        by `min_diag_B` and `max_diag_B`, are stored in the attribute `delta` of the
+        decomposition.
+        optional, default : The approximation is returned.
 
     Returns
     -------
-    B : numpy.ndarray
-        An approximation of `A` which is positive definite.
+    B : numpy.ndarray or scipy.sparse.spmatrix or matrix.decompositions.DecompositionBase
+        An approximation of `A` which is positive definite or its decomposition
+        if `return_type` is passed. It is sparse if `A` is sparse.
 
     Raises
     ------
     matrix.errors.MatrixNotSquareError
         If `A` is not a square matrix.
+    ValueError
+        If `permutation_method` or `return_type` is unknown.
 
     Notes
     -----
@@ -490,10 +1034,10 @@ def SE_99(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fals
         SIAM Journal on Scientific and Statistical Computing, 1990, 11, 1136-1158
     """
 
-    return _SE(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, overwrite_A=overwrite_A, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=0.1)
+    return _SE(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, permutation_method=permutation_method, overwrite_A=overwrite_A, return_type=return_type, use_two_phases=True, nondecreasing_startegy=True, use_abs=False, revisited_version_mu=0.1)
 
 
-def SE_T1(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=False):
+def SE_T1(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, permutation_method=None, overwrite_A=False, return_type=None):
     """
     Computes a positive definite approximation of `A`.
 
@@ -502,9 +1046,10 @@ def SE_T1(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fals
 
     Parameters
     ----------
-    A : numpy.ndarray
+    A : numpy.ndarray or scipy.sparse.spmatrix
         The matrix that should be approximated.
         `A` must be symmetric.
+        If `A` is sparse, the CSC format is preferred.
     min_diag_B : numpy.ndarray or float
         Each component of the diagonal of the returned matrix
         is forced to be greater or equal to `min_diag_B`.
@@ -518,19 +1063,45 @@ def SE_T1(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fals
         of the returned matrix is forced to be greater or equal to `min_diag_D`.
         `min_diag_D` must be positive.
         optional, default : Is chosen by the algorithm.
+    permutation_method : str
+        The symmetric permutation method that is applied to the matrix during the decomposition.
+        It has to be a value in
+        :const:`matrix.approximation.positive_semidefinite.GMW_SE_PERMUTATION_METHODS`.
+        If it is :const:`matrix.approximation.positive_semidefinite.MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD`,
+        the remaining diagonal value with maximal absolute value is used as pivot.
+        If it is :const:`matrix.approximation.positive_semidefinite.GERSHGORIN_PERMUTATION_METHOD`,
+        the maximal remaining diagonal value is used as pivot as long as no changes of the
+        diagonal are needed and afterwards the maximal lower Gershgorin bound of the remaining
+        matrix. The Gershgorin bounds are estimated and updated in each iteration as
+        described by Schnabel and Eskow.
+        If `A` is sparse, it has to be :const:`matrix.NO_PERMUTATION_METHOD` or a value in
+        :const:`matrix.SPARSE_ONLY_PERMUTATION_METHODS`.
+        optional, default: no permutation if `A` is dense and
+        :const:`matrix.sparse.constants.DEFAULT_FILL_REDUCE_PERMUTATION_METHOD` if `A` is sparse
     overwrite_A : bool
         Whether it is allowed to overwrite `A`. Enabling may result in performance gain.
         optional, default: False
+    return_type : str
+        If passed, a decomposition of the approximation of this type is returned instead of
+        the approximation itself. The approximation is not calculated in this case.
+        It has to be a value in :const:`matrix.DECOMPOSITION_TYPES`.
+        The changes of the diagonal values of `A`, before the diagonal values are restricted
+        by `min_diag_B` and `max_diag_B`, are stored in the attribute `delta` of the
+        decomposition.
+        optional, default : The approximation is returned.
 
     Returns
     -------
-    B : numpy.ndarray
-        An approximation of `A` which is positive definite.
+    B : numpy.ndarray or scipy.sparse.spmatrix or matrix.decompositions.DecompositionBase
+        An approximation of `A` which is positive definite or its decomposition
+        if `return_type` is passed. It is sparse if `A` is sparse.
 
     Raises
     ------
     matrix.errors.MatrixNotSquareError
         If `A` is not a square matrix.
+    ValueError
+        If `permutation_method` or `return_type` is unknown.
 
     Notes
     -----
@@ -552,7 +1123,7 @@ def SE_T1(A, min_diag_B=None, max_diag_B=None, min_diag_D=None, overwrite_A=Fals
         SIAM Journal on Scientific and Statistical Computing, 1990, 11, 1136-1158
     """
 
-    return _SE(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, overwrite_A=overwrite_A, use_two_phases=True, nondecreasing_startegy=False, use_abs=True, revisited_version_mu=0.1)
+    return _SE(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D, permutation_method=permutation_method, overwrite_A=overwrite_A, return_type=return_type, use_two_phases=True, nondecreasing_startegy=False, use_abs=True, revisited_version_mu=0.1)
 
 
 SE_T2 = SE_99
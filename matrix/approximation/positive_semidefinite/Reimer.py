@@ -1,16 +1,21 @@
+import logging
 import math
-import cmath
 import warnings
 
 import numpy as np
 import scipy.sparse
 
 import matrix
+import matrix.calculate
 import matrix.constants
 import matrix.decompositions
+import matrix.dense.util
 import matrix.errors
 import matrix.permute
+import matrix.sparse.symbolic
 import matrix.sparse.util
+import matrix.util
+import matrix.validation
 import matrix._util.roots
 
 
@@ -21,6 +26,114 @@ MAXIMAL_STABILITY_PERMUTATION_METHOD = 'maximal_stability'
 APPROXIMATION_ONLY_PERMUTATION_METHODS = (MINIMAL_DIFFERENCE_PERMUTATION_METHOD, MAXIMAL_STABILITY_PERMUTATION_METHOD)
 """ Permutation methods supported only by the decomposition and the positive_semidefinite_matrix algorithm. """
 
+_WORKING_DTYPES = (np.float32, np.float64, np.longdouble)
+""" Data types, ordered by increasing precision, which are used if the working precision is not sufficient. """
+
+
+class _WorkingPrecisionExceededError(Exception):
+    """ Raised if an overflow occurs in the working precision of the approximation algorithm. """
+
+
+TRACE_DTYPE = np.dtype([('iteration', np.int64), ('index', np.int64), ('d', np.float64),
+                        ('omega', np.float64), ('delta', np.float64), ('f_value', np.float64)])
+""" Data type of the records of a :class:`Trace`. """
+
+
+class Trace():
+    """
+    Collects a record for each iteration of the approximation algorithms.
+
+    Each record consists of the iteration, the index of the row and column of `A` which is
+    used in this iteration and the values `d`, `omega`, `delta` and `f_value`
+    (the additional approximation error) chosen for this index.
+
+    Examples
+    --------
+    >>> trace = matrix.approximation.positive_semidefinite.Trace()
+    >>> B = matrix.approximation.positive_semidefinite.positive_semidefinite_matrix(A, trace=trace)
+    >>> trace.records().f_value.sum()
+    """
+
+    def __init__(self):
+        self._records = []
+
+    def __len__(self):
+        return len(self._records)
+
+    def append(self, iteration, index, d, omega, delta, f_value):
+        """
+        Appends a record.
+
+        Parameters
+        ----------
+        iteration : int
+            The iteration of the algorithm.
+        index : int
+            The index of the row and column of `A` which is used in this iteration.
+        d : float
+            The value of the diagonal of `D` in this iteration.
+        omega : float
+            The scaling factor of the row and column with this index.
+        delta : float
+            The change of the diagonal value with this index.
+        f_value : float
+            The additional approximation error caused by this iteration.
+        """
+
+        self._records.append((iteration, index, d, omega, delta, f_value))
+
+    def _truncate(self, length):
+        del self._records[length:]
+
+    def clear(self):
+        """
+        Removes all records.
+        """
+
+        self._records.clear()
+
+    def records(self):
+        """
+        Returns all records.
+
+        Returns
+        -------
+        numpy.recarray
+            The records in the order in which they were appended with the data type
+            :const:`TRACE_DTYPE`.
+        """
+
+        return np.rec.array(np.array(self._records, dtype=TRACE_DTYPE))
+
+
+def _working_dtypes(working_dtype=None):
+    """
+    Returns the working data types which should be tried one after another.
+
+    The first one is `working_dtype`. Each following one is more precise than its predecessor.
+    """
+
+    if working_dtype is None:
+        working_dtype = _WORKING_DTYPES[-1]
+    try:
+        working_dtype = np.dtype(working_dtype)
+    except TypeError as original_error:
+        error = ValueError(f'working_dtype must be a data type but it is {working_dtype}.')
+        matrix.logger.error(error)
+        raise error from original_error
+    if not np.issubdtype(working_dtype, np.floating):
+        error = ValueError(f'working_dtype must be a real floating point data type but it is '
+                           f'{working_dtype}.')
+        matrix.logger.error(error)
+        raise error
+
+    working_dtypes = [working_dtype]
+    for dtype in _WORKING_DTYPES:
+        dtype = np.dtype(dtype)
+        if np.finfo(dtype).bits > np.finfo(working_dtypes[-1]).bits:
+            working_dtypes.append(dtype)
+    return tuple(working_dtypes)
+
 
 def _difference_frobenius_norm(d, omega, alpha, beta, gamma):
     try:
@@ -42,10 +155,12 @@ def _difference_frobenius_norm(d, omega, alpha, beta, gamma):
 def _minimal_change(alpha, beta, gamma, min_diag_D, max_diag_D=math.inf,
                     min_diag_B=-math.inf, max_diag_B=math.inf, min_abs_value_D=0):
     # debug info
-    matrix.logger.debug(f'Searching best value for '
-                        f'alpha {alpha}, beta {beta}, gamma {gamma}, min_diag_D {min_diag_D}, '
-                        f'max_diag_D {max_diag_D}, min_abs_value_D {min_abs_value_D}, '
-                        f'min_diag_B {min_diag_B}, max_diag_B {max_diag_B}.')
+    is_debug_logging = matrix.logger.isEnabledFor(logging.DEBUG)
+    if is_debug_logging:
+        matrix.logger.debug(f'Searching best value for '
+                            f'alpha {alpha}, beta {beta}, gamma {gamma}, min_diag_D {min_diag_D}, '
+                            f'max_diag_D {max_diag_D}, min_abs_value_D {min_abs_value_D}, '
+                            f'min_diag_B {min_diag_B}, max_diag_B {max_diag_B}.')
 
     # check input
     assert math.isfinite(alpha) or alpha == math.inf
@@ -160,7 +275,8 @@ def _minimal_change(alpha, beta, gamma, min_diag_D, max_diag_D=math.inf,
         (d, omega, f_value) = min(C_with_f_value, key=lambda x: (x[2], -x[0], x[1]))
 
     # debug info
-    matrix.logger.debug(f'Best value is d {d}, omega {omega} with f {f_value}.')
+    if is_debug_logging:
+        matrix.logger.debug(f'Best value is d {d}, omega {omega} with f {f_value}.')
 
     # return value
     assert min_diag_D <= d <= max_diag_D
@@ -176,10 +292,611 @@ def _minimal_change(alpha, beta, gamma, min_diag_D, max_diag_D=math.inf,
     return (d, omega, f_value)
 
 
+def _difference_frobenius_norms(d, omega, alpha, beta, gamma):
+    with np.errstate(over='ignore', invalid='ignore'):
+        f_value = (d + omega**2 * alpha - gamma)**2 + (omega - 1)**2 * beta
+        f_value = np.where(omega == 0, (d - gamma)**2 + beta, f_value)  # for case alpha == inf
+        f_value = np.where(omega == 1, (d + alpha - gamma)**2, f_value)  # for case beta == inf
+    f_value[np.isnan(f_value)] = math.inf
+    return f_value
+
+
+def _minimal_changes(alpha, beta, gamma, min_diag_D, max_diag_D=math.inf,
+                     min_diag_B=-math.inf, max_diag_B=math.inf, min_abs_value_D=0):
+    """
+    Calculates the same values as :func:`_minimal_change` for several indices at once.
+
+    All arguments can be scalars or vectors. They are broadcasted against each other.
+    The returned values `d`, `omega` and `f_value` are vectors.
+    """
+
+    paranoid = matrix.validation.is_paranoid()
+
+    # prepare input
+    alpha, beta, gamma, min_diag_D, max_diag_D, min_diag_B, max_diag_B = np.broadcast_arrays(
+        *(np.atleast_1d(value) for value in (alpha, beta, gamma, min_diag_D, max_diag_D,
+                                             min_diag_B, max_diag_B)))
+    m = len(alpha)
+
+    # debug info
+    if matrix.logger.isEnabledFor(logging.DEBUG):
+        matrix.logger.debug(f'Searching best values for {m} indices.')
+
+    # check input
+    assert not paranoid or np.all(np.logical_or(np.isfinite(alpha), alpha == math.inf))
+    assert not paranoid or np.all(np.logical_or(np.isfinite(beta), beta == math.inf))
+    assert not paranoid or np.all(np.isfinite(gamma))
+    assert not paranoid or np.all(np.isfinite(min_diag_D))
+    assert math.isfinite(min_abs_value_D)
+    assert not paranoid or np.all(alpha >= 0)
+    assert not paranoid or np.all(beta >= 0)
+    assert not paranoid or np.all(np.logical_or(beta != 0, alpha == 0))
+    assert not paranoid or np.all(min_diag_D >= 0)
+    assert min_abs_value_D > 0
+    assert not paranoid or np.all(np.maximum(np.maximum(min_diag_D, min_abs_value_D), min_diag_B)
+                                  <= np.minimum(max_diag_D, max_diag_B))
+
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        # global solution
+        min_diag_D_without_zero = np.maximum(min_diag_D, min_abs_value_D)
+        a = np.maximum(min_diag_D_without_zero, min_diag_B - alpha)
+        b = np.minimum(max_diag_D, max_diag_B - alpha)
+        d_global = gamma - alpha
+        is_global = np.logical_and(a <= d_global, d_global <= b)
+        is_not_global = np.logical_not(is_global)
+
+        # prepare candidate set
+        C_d = []
+        C_omega = []
+        C_mask = []
+
+        def add_candidates(d, omega, mask):
+            C_d.append(np.broadcast_to(d, (m,)))
+            C_omega.append(np.broadcast_to(omega, (m,)))
+            C_mask.append(mask)
+
+        # alpha is finite
+        is_alpha_finite = np.isfinite(alpha)
+        is_beta_finite = np.isfinite(beta)
+        mask = is_not_global & is_alpha_finite & (a <= b)
+        add_candidates(a, 1, mask & (d_global < a))
+        add_candidates(b, 1, mask & (d_global > b))
+
+        # alpha and beta are finite and alpha is not zero
+        mask = is_not_global & is_alpha_finite & is_beta_finite & (alpha != 0)
+        add_best_d_omega_zero = is_not_global & np.logical_not(is_alpha_finite & is_beta_finite)
+        is_alpha_squared_infinite = np.zeros(m, dtype=bool)
+        d_values = ((min_diag_D_without_zero, min_diag_B - alpha <= min_diag_D_without_zero),
+                    (max_diag_D, np.isfinite(max_diag_D) & (max_diag_D <= max_diag_B)))
+        for d, d_mask in d_values:
+            d_mask = mask & d_mask
+            # ensure that coefficients are finite
+            q = (- 0.5 * beta / alpha) / alpha
+            p = (d - gamma) / alpha - q
+            d_overflow_mask = d_mask & np.logical_not(np.isfinite(p) & np.isfinite(q))
+            is_alpha_squared_infinite |= d_overflow_mask
+            d_mask &= np.logical_not(d_overflow_mask)
+            # get roots
+            omegas = np.full((m, 3), np.nan, dtype=np.result_type(p, q))
+            omegas[d_mask] = matrix._util.roots.solver_depressed_cubics(p[d_mask], q[d_mask])
+            # calculate bounds
+            omega_lower = (np.maximum(min_diag_B - d, 0) / alpha)**0.5
+            omega_upper = np.minimum(((max_diag_B - d) / alpha)**0.5, 1)
+            assert not paranoid or np.all(np.logical_or(np.logical_not(d_mask),
+                                                        (0 <= omega_lower) & (omega_lower <= omega_upper)
+                                                        & (omega_lower <= 1)))
+            # apply bounds and add to candidate list
+            is_root = d_mask[:, np.newaxis] & np.logical_not(np.isnan(omegas))
+            is_below = is_root & (omegas <= omega_lower[:, np.newaxis])
+            is_above = is_root & np.logical_not(is_below) & (omegas >= omega_upper[:, np.newaxis])
+            is_inside = is_root & np.logical_not(is_below | is_above)
+            for k in range(omegas.shape[1]):
+                add_candidates(d, omegas[:, k], is_inside[:, k])
+            add_candidates(d, omega_lower, np.any(is_below, axis=1))
+            add_candidates(d, omega_upper, np.any(is_above, axis=1))
+        add_best_d_omega_zero |= is_alpha_squared_infinite
+
+        # warnings
+        if np.any(is_not_global & np.logical_not(is_alpha_finite)):
+            matrix.logger.warning(('Alpha is infinity. Maybe the datatype should be changed to '
+                                   'a more accurate one.'))
+        if np.any(is_not_global & is_alpha_finite & np.logical_not(is_beta_finite)):
+            matrix.logger.warning(('Beta is infinity. Maybe the datatype should be changed to '
+                                   'a more accurate one.'))
+        if np.any(is_alpha_squared_infinite):
+            matrix.logger.warning(('Alpha squared is infinity. Maybe the datatype should be '
+                                   'changed to a more accurate one.'))
+
+        # add (d, 0) where d is best if omega is zero
+        d = np.maximum(np.maximum(min_diag_D_without_zero, min_diag_B),
+                       np.minimum(np.minimum(gamma, max_diag_D), max_diag_B))
+        add_candidates(d, 0, add_best_d_omega_zero)
+
+        # add (0, 0)
+        add_candidates(0, 0, (is_not_global & (min_diag_D == 0) & (min_diag_B <= 0)
+                              & (2 * gamma <= min_abs_value_D)))
+
+        # calculate function values for candidates
+        C_d = np.stack(C_d, axis=1)
+        C_omega = np.stack(C_omega, axis=1)
+        C_mask = np.stack(C_mask, axis=1)
+        assert not paranoid or np.all(is_global | np.any(C_mask, axis=1))
+        C_f_value = np.full(C_d.shape, math.inf, dtype=np.result_type(C_d, alpha, beta, gamma))
+        C_index = np.nonzero(C_mask)
+        C_f_value[C_index] = _difference_frobenius_norms(
+            C_d[C_index], C_omega[C_index],
+            alpha[C_index[0]], beta[C_index[0]], gamma[C_index[0]])
+
+    # choose best values
+    C_index = _argmin_lexicographic(C_f_value, -C_d, C_omega, mask=C_mask, axis=1)
+    C_index = (np.arange(m), C_index)
+    d = np.where(is_global, d_global, C_d[C_index])
+    omega = np.where(is_global, 1, C_omega[C_index])
+    f_value = np.where(is_global, 0, C_f_value[C_index])
+
+    # return value
+    assert not paranoid or np.all(min_diag_D <= d) and np.all(d <= max_diag_D)
+    assert not paranoid or np.all(np.logical_or(d >= min_abs_value_D, (d == 0) & (min_diag_D <= 0) & (max_diag_D >= 0)))
+    assert not paranoid or np.all(0 <= omega) and np.all(omega <= 1)
+    assert not paranoid or np.all(np.logical_or(d != 0, omega == 0))
+    assert not paranoid or np.all(f_value >= 0)
+    assert not paranoid or np.all(np.logical_or(alpha != math.inf, omega == 0))
+    return d, omega, f_value
+
+
+def _argmin_lexicographic(*keys, mask=None, axis=None):
+    """
+    Returns the index of the lexicographic minimum of `keys`.
+
+    The first key is compared first. Ties are resolved by the following keys and
+    afterwards by the lowest index. Only entries where `mask` is true are considered.
+    """
+
+    keys = np.broadcast_arrays(*keys)
+    if mask is None:
+        mask = np.ones(keys[0].shape, dtype=bool)
+    else:
+        mask = np.array(mask, dtype=bool)
+    for key in keys:
+        key_min = np.min(np.where(mask, key, math.inf), axis=axis, keepdims=True)
+        mask &= key == key_min
+    return np.argmax(mask, axis=axis)
+
+
+_DENSE_BLOCK_SIZE = 64
+""" Number of columns of a panel in the blocked calculation for dense matrices. """
+
+
+def _dense_decomposition(A, L, p, alpha, beta, d, next_minimal_change, update_d_omega_delta,
+                         min_abs_value_L, overwrite_A=False, block_size=None):
+    """
+    Calculates `L`, `d`, `p` and the auxiliary values of an approximative decomposition of a dense matrix.
+
+    A blocked right-looking algorithm is used. The columns of `L` are calculated panel by panel.
+    The contributions of the finished panels are accumulated by matrix-matrix products in the
+    not yet calculated strict lower triangle of `L`. Inside a panel the columns are calculated one
+    by one using these accumulated contributions and the contributions of the preceding columns
+    of the same panel.
+
+    Parameters
+    ----------
+    A : numpy.ndarray
+        The matrix that should be approximated by a decomposition.
+    L : numpy.ndarray
+        The matrix where `L` of the decomposition is stored.
+        It is `A` if `overwrite_A` is true and a zero matrix otherwise.
+    p : numpy.ndarray
+        The permutation vector. It is updated inplace if pivoting is used.
+    alpha : numpy.ndarray
+        Auxiliary vector. It is updated inplace.
+    beta : numpy.ndarray
+        Auxiliary vector. It is updated inplace.
+    d : numpy.ndarray
+        Diagonal of matrix `D` of the decomposition. It is updated inplace.
+    next_minimal_change : callable
+        Returns for an iteration `i` the position `j` in `p` which should be used next
+        together with the values of `d`, `omega` and the approximation error.
+    update_d_omega_delta : callable
+        Stores the values of `d`, `omega` and `delta` for an iteration.
+    min_abs_value_L : float
+        Absolute values below `min_abs_value_L` are considered as zero in the matrix `L`.
+    overwrite_A : bool
+        Whether `L` is `A`. In this case only the upper triangle of `A` is used as input.
+        optional, default: False
+    block_size : int
+        The number of columns of a panel.
+        optional, default: :const:`_DENSE_BLOCK_SIZE`
+    """
+
+    paranoid = matrix.validation.is_paranoid()
+
+    n = len(p)
+    if block_size is None:
+        block_size = _DENSE_BLOCK_SIZE
+    L_real_dtype = np.finfo(L.dtype).dtype
+    d_L = np.zeros(n, dtype=L_real_dtype)
+    is_finite_row = np.ones(n, dtype=bool)
+
+    # the not yet calculated strict lower triangle of L accumulates the contributions of panels
+    if overwrite_A:
+        for i in range(n):
+            L[i + 1:, i] = 0
+
+    for k0 in range(0, n, block_size):
+        k1 = min(k0 + block_size, n)
+
+        # calculate columns of panel
+        for i in range(k0, k1):
+
+            # determine next value for p, d, omega
+            (j, d_i, omega_i, f_value_i) = next_minimal_change(i)
+            if j != i:
+                # swap p[i] and p[j]
+                p_i = p[j]
+                p[j] = p[i]
+                p[i] = p_i
+                # swap L[i, :i] and L[j, :i]
+                L_j = L[j, :i].copy()
+                L[j, :i] = L[i, :i]
+                L[i, :i] = L_j
+                # swap accumulated contributions
+                matrix.dense.util.swap_symmetric_lower(L, i, j)
+                is_finite_row_j = is_finite_row[j]
+                is_finite_row[j] = is_finite_row[i]
+                is_finite_row[i] = is_finite_row_j
+            p_i = p[i]
+
+            # update d, omega and delta
+            update_d_omega_delta(i, p_i, d_i, omega_i, f_value_i)
+            d_L[i] = d_i
+            omega_i_L = L_real_dtype.type(omega_i)
+            calculate_column_i = d_i != 0
+
+            # get i-th column of A
+            p_after_i = p[i + 1:]
+            if not overwrite_A:
+                A_column_i = A[p_after_i, p_i]
+            else:
+                A_column_i = np.concatenate([A[:p_i, p_i], A[p_i, p_i:].conjugate()])[p_after_i]
+            assert not paranoid or np.all(np.isfinite(A_column_i))
+
+            # update beta, an overflow is detected by next_minimal_change
+            with np.errstate(over='ignore'):
+                beta_add = 2 * A_column_i * A_column_i.conjugate()
+                assert not paranoid or np.all(np.isreal(beta_add))
+                beta[p_after_i] += beta_add.real
+
+            # sum contributions of previous columns with unscaled i-th row of L
+            use_previous_columns = calculate_column_i and omega_i != 0 and i > 0
+            if use_previous_columns:
+                L_row_i_mul_d = L[i, k0:i].conjugate() * d_L[k0:i]
+                S_column_i = L[i + 1:, i] + L[i + 1:, k0:i] @ L_row_i_mul_d
+
+            # update i-th row of L with omega
+            if i > 0:
+                if omega_i != 0:
+                    L_row_i = L[i, :i]
+                    if omega_i != 1:
+                        L_row_i *= omega_i_L
+                    L_row_i_small_mask = np.abs(L_row_i) < min_abs_value_L
+                    L_row_i_removed_indices = np.where(np.logical_and(L_row_i_small_mask,
+                                                                      L_row_i != 0))[0]
+                    L_row_i_removed_values = L_row_i[L_row_i_removed_indices]
+                    L_row_i[L_row_i_small_mask] = 0
+                else:
+                    L[i, :i] = 0
+                assert not paranoid or np.all(np.isfinite(L[i, :i]))
+
+            # calculate i-th column of L
+            if calculate_column_i:
+                if use_previous_columns:
+                    L_column_i = omega_i_L * S_column_i
+                    # remove contributions of entries set to zero in i-th row of L
+                    if len(L_row_i_removed_indices) > 0:
+                        L_column_i -= (L[i + 1:, L_row_i_removed_indices]
+                                       @ (d_L[L_row_i_removed_indices]
+                                          * L_row_i_removed_values.conjugate()))
+                    L_column_i = A_column_i - L_column_i
+
+                    # recalculate values in rows with infinite values
+                    # (inf * 0 is nan and should be 0)
+                    not_finite_rows = np.where(~is_finite_row[i + 1:])[0]
+                    if len(not_finite_rows) > 0:
+                        L_row_i_mul_d = L[i, :i].conjugate() * d_L[:i]
+                        L_row_i_mul_d_non_zero_mask = L_row_i_mul_d != 0
+                        L_below_row_i = L[i + 1 + not_finite_rows, :i][:, L_row_i_mul_d_non_zero_mask]
+                        L_column_i[not_finite_rows] = (
+                            A_column_i[not_finite_rows]
+                            - L_below_row_i @ L_row_i_mul_d[L_row_i_mul_d_non_zero_mask])
+                else:
+                    L_column_i = A_column_i
+                assert not paranoid or np.all(np.logical_or(np.isfinite(L_column_i), np.isinf(L_column_i)))
+
+                # devide by d_i
+                assert math.isfinite(d_i)
+                L_column_i = L_column_i / d_L[i]
+                assert not paranoid or np.all(np.logical_or(np.isfinite(L_column_i), np.isinf(L_column_i)))
+
+                # update i-th column of L
+                L[i + 1:, i] = L_column_i
+                is_finite_row[i + 1:] &= np.isfinite(L_column_i)
+
+                # update alpha, an overflow is detected by next_minimal_change
+                with np.errstate(over='ignore'):
+                    alpha_add = L_column_i * L_column_i.conjugate() * d_i
+                    assert not paranoid or np.all(np.isreal(alpha_add))
+                    alpha_add = alpha_add.real
+                    assert not paranoid or np.all(np.logical_or(np.isfinite(alpha_add), alpha_add == math.inf))
+                    alpha_add[L_column_i == math.inf] = math.inf
+                    alpha[p_after_i] += alpha_add
+                assert not paranoid or np.all(np.logical_or(np.isfinite(alpha), alpha == math.inf))
+                assert not paranoid or np.all(np.logical_or(np.isfinite(L_column_i), alpha[p_after_i] == math.inf))
+            else:
+                L[i + 1:, i] = 0
+
+        # add contributions of panel to trailing lower triangle
+        if k1 < n:
+            L_panel = L[k1:, k0:k1]
+            L_panel_mul_d = L_panel * d_L[k0:k1]
+            for c0 in range(k1, n, block_size):
+                c1 = min(c0 + block_size, n)
+                m = c1 - c0
+                S_update = L_panel_mul_d[c0 - k1:] @ L_panel[c0 - k1:c1 - k1].conjugate().T
+                rows, columns = np.tril_indices(m, -1)
+                L[c0 + rows, c0 + columns] += S_update[rows, columns]
+                L[c1:, c0:c1] += S_update[m:]
+
+
+def _sparse_decomposition(A, L_dtype, p, alpha, beta, d, next_minimal_change, update_d_omega_delta,
+                          min_abs_value_L, L_column_counts=None):
+    """
+    Calculates `L`, `d`, `p` and the auxiliary values of an approximative decomposition of a sparse matrix.
+
+    A left-looking algorithm is used. The strict lower triangle of `L` is stored column by
+    column in growable compressed sparse column arrays. Their row indices refer to the rows of
+    `A` (and not to the positions in `p`), so swapping positions does not require to change
+    already calculated columns. The positions of the entries of each row are additionally
+    stored contiguously in a growable row index so that a row is gathered with one slice. The updates of a column are accumulated sparsely by
+    sorting their row indices and summing the values with equal row index.
+
+    The parameters are the same as for :func:`_dense_decomposition` except that `A` is a
+    sparse matrix and that `L_dtype`, the data type of `L`, is passed instead of `L`.
+    Additionally, upper bounds `L_column_counts` for the number of entries in each column
+    of the strict lower triangle of `L` can be passed. In this case `L` is preallocated
+    and never grows.
+
+    Returns
+    -------
+    L : scipy.sparse.csc_matrix
+        The strict lower triangle of the matrix `L` of the decomposition.
+    """
+
+    paranoid = matrix.validation.is_paranoid()
+
+    n = len(p)
+    if A.format not in ('csc', 'csr'):
+        A = A.tocsc(copy=False)
+    A_is_csr = A.format == 'csr'
+
+    # position of each row of A in p
+    q = matrix.permute.invert_permutation_vector(p)
+
+    # growable compressed sparse column arrays of L
+    if L_column_counts is not None:
+        L_capacity = int(np.sum(L_column_counts))
+    else:
+        L_capacity = max(A.nnz, n)
+    L_indptr = np.zeros(n + 1, dtype=np.int64)
+    L_indices = np.empty(L_capacity, dtype=np.int64)
+    L_data = np.empty(len(L_indices), dtype=L_dtype)
+
+    # growable row index of L, the positions of the entries of each row are stored in a
+    # contiguous slot whose capacity is initially the number of entries in the row of A
+    L_row_counts = np.zeros(n, dtype=np.int64)
+    L_row_capacities = np.diff(A.indptr).astype(np.int64) + 1
+    L_row_starts = np.concatenate(([0], np.cumsum(L_row_capacities[:-1]))).astype(np.int64)
+    L_row_positions = np.empty(int(np.sum(L_row_capacities)), dtype=np.int64)
+
+    L_real_dtype = np.finfo(L_dtype).dtype
+
+    for i in range(n):
+
+        # determine next value for p, d, omega
+        (j, d_i, omega_i, f_value_i) = next_minimal_change(i)
+        if j != i:
+            # swap p[i] and p[j]
+            p_i = p[j]
+            p[j] = p[i]
+            p[i] = p_i
+            q[p[i]] = i
+            q[p[j]] = j
+        p_i = p[i]
+
+        # update d, omega and delta
+        update_d_omega_delta(i, p_i, d_i, omega_i, f_value_i)
+
+        # get entries of i-th row of L
+        L_row_i_start = L_row_starts[p_i]
+        L_row_i_positions = L_row_positions[L_row_i_start:L_row_i_start + L_row_counts[p_i]]
+
+        # update i-th row of L with omega
+        L_row_i = L_data[L_row_i_positions]
+        if omega_i != 0:
+            if omega_i != 1:
+                L_row_i *= L_real_dtype.type(omega_i)
+            L_row_i[np.abs(L_row_i) < min_abs_value_L] = 0
+        else:
+            L_row_i[:] = 0
+        assert not paranoid or np.all(np.isfinite(L_row_i))
+        L_data[L_row_i_positions] = L_row_i
+
+        # get i-th column of A below the i-th position
+        A_column_i_indices = A.indices[A.indptr[p_i]:A.indptr[p_i + 1]]
+        A_column_i = A.data[A.indptr[p_i]:A.indptr[p_i + 1]]
+        if A_is_csr:
+            A_column_i = A_column_i.conjugate()
+        A_column_i_mask = q[A_column_i_indices] > i
+        A_column_i_indices = A_column_i_indices[A_column_i_mask]
+        A_column_i = A_column_i[A_column_i_mask]
+        assert not paranoid or np.all(np.isfinite(A_column_i))
+
+        # update beta, an overflow is detected by next_minimal_change
+        with np.errstate(over='ignore'):
+            beta_add = 2 * A_column_i * A_column_i.conjugate()
+            assert not paranoid or np.all(np.isreal(beta_add))
+            beta[A_column_i_indices] += beta_add.real
+
+        # update alpha and i-th column of L
+        if d_i != 0:
+            # calculate i-th column of L
+            L_column_i_indices = A_column_i_indices
+            L_column_i = A_column_i
+
+            # subtract contributions of previous columns
+            L_row_i_non_zero_mask = L_row_i != 0
+            if np.any(L_row_i_non_zero_mask):
+                L_row_i_positions = L_row_i_positions[L_row_i_non_zero_mask]
+                L_row_i_columns = np.searchsorted(L_indptr[:i + 1], L_row_i_positions,
+                                                  side='right') - 1
+                L_row_i_mul_d = (L_row_i[L_row_i_non_zero_mask].conjugate()
+                                 * d[L_row_i_columns].astype(L_real_dtype))
+                assert not paranoid or np.all(np.isfinite(L_row_i_mul_d))
+
+                # positions of the entries of the columns of the non zero entries of i-th row
+                column_starts = L_indptr[L_row_i_columns]
+                column_lengths = L_indptr[L_row_i_columns + 1] - column_starts
+                positions = (np.repeat(column_starts - np.cumsum(column_lengths)
+                                       + column_lengths, column_lengths)
+                             + np.arange(column_lengths.sum()))
+                # (entries set to zero are skipped since inf * 0 is nan and should be 0)
+                contributions_indices = L_indices[positions]
+                contributions_mask = np.logical_and(q[contributions_indices] > i,
+                                                    L_data[positions] != 0)
+                positions = positions[contributions_mask]
+                contributions_indices = contributions_indices[contributions_mask]
+                contributions = L_data[positions] * np.repeat(L_row_i_mul_d,
+                                                              column_lengths)[contributions_mask]
+
+                # sum values with same row index
+                if len(contributions) > 0:
+                    L_column_i_indices = np.concatenate((L_column_i_indices,
+                                                         contributions_indices))
+                    L_column_i = np.concatenate((L_column_i, - contributions))
+                    order = np.argsort(L_column_i_indices, kind='stable')
+                    L_column_i_indices = L_column_i_indices[order]
+                    L_column_i = L_column_i[order]
+                    starts = np.flatnonzero(np.concatenate((
+                        [True], L_column_i_indices[1:] != L_column_i_indices[:-1])))
+                    L_column_i_indices = L_column_i_indices[starts]
+                    L_column_i = np.add.reduceat(L_column_i, starts)
+            assert not paranoid or np.all(np.logical_or(np.isfinite(L_column_i), np.isinf(L_column_i)))
+
+            # remove zero entries
+            L_column_i_non_zero_mask = L_column_i != 0
+            L_column_i = L_column_i[L_column_i_non_zero_mask]
+            L_column_i_indices = L_column_i_indices[L_column_i_non_zero_mask]
+
+            # devide by d_i
+            assert math.isfinite(d_i)
+            assert d_i != 0
+            L_column_i = L_column_i / L_real_dtype.type(d_i)
+            assert not paranoid or np.all(np.logical_or(np.isfinite(L_column_i), np.isinf(L_column_i)))
+
+            # ensure capacity of L
+            assert L_column_counts is None or len(L_column_i) <= L_column_counts[i]
+            start = L_indptr[i]
+            stop = start + len(L_column_i)
+            if stop > len(L_indices):
+                capacity = max(2 * len(L_indices), stop)
+                L_indices = np.resize(L_indices, capacity)
+                L_data = np.resize(L_data, capacity)
+
+            # ensure capacity of row index of L, all rows get twice their needed capacity
+            L_row_counts[L_column_i_indices] += 1
+            if np.any(L_row_counts[L_column_i_indices] > L_row_capacities[L_column_i_indices]):
+                L_row_counts[L_column_i_indices] -= 1
+                needed_capacities = L_row_counts.copy()
+                needed_capacities[L_column_i_indices] += 1
+                L_row_capacities = 2 * needed_capacities + 1
+                L_row_starts_new = np.concatenate(([0], np.cumsum(L_row_capacities[:-1]))).astype(np.int64)
+                rows = np.repeat(np.arange(n), L_row_counts)
+                offsets = np.arange(len(rows)) - np.repeat(np.cumsum(L_row_counts) - L_row_counts, L_row_counts)
+                L_row_positions_new = np.empty(int(np.sum(L_row_capacities)), dtype=np.int64)
+                L_row_positions_new[L_row_starts_new[rows] + offsets] = L_row_positions[L_row_starts[rows] + offsets]
+                L_row_positions = L_row_positions_new
+                L_row_starts = L_row_starts_new
+                L_row_counts[L_column_i_indices] += 1
+
+            # update i-th column of L and row index of L
+            L_indices[start:stop] = L_column_i_indices
+            L_data[start:stop] = L_column_i
+            L_row_positions[L_row_starts[L_column_i_indices] + L_row_counts[L_column_i_indices] - 1] = np.arange(start, stop)
+            L_indptr[i + 1] = stop
+
+            # update alpha, an overflow is detected by next_minimal_change
+            with np.errstate(over='ignore'):
+                alpha_add = L_column_i * L_column_i.conjugate() * d_i
+                assert not paranoid or np.all(np.isreal(alpha_add))
+                alpha_add = alpha_add.real
+                assert not paranoid or np.all(np.logical_or(np.isfinite(alpha_add), alpha_add == math.inf))
+                alpha_add[L_column_i == math.inf] = math.inf
+                alpha[L_column_i_indices] += alpha_add
+            assert not paranoid or np.all(np.logical_or(np.isfinite(alpha), alpha == math.inf))
+            assert not paranoid or np.all(np.logical_or(np.isfinite(L_column_i),
+                                                        alpha[L_column_i_indices] == math.inf))
+        else:
+            L_indptr[i + 1] = L_indptr[i]
+
+    # create L with rows ordered by positions
+    nnz = L_indptr[n]
+    L = scipy.sparse.csc_matrix((L_data[:nnz], q[L_indices[:nnz]], L_indptr), shape=(n, n))
+    L.eliminate_zeros()
+    L.sort_indices()
+    return L
+
+
+def _exact_decomposition(A, p):
+    """
+    Calculates the :math:`LDL^H` decomposition of a matrix if it is positive definite.
+
+    Parameters
+    ----------
+    A : numpy.ndarray or scipy.sparse.spmatrix
+        The matrix that should be decomposed.
+        `A` must be Hermitian.
+    p : numpy.ndarray
+        The permutation vector which is applied symmetrically to `A`.
+
+    Returns
+    -------
+    matrix.decompositions.LDL_Decomposition or None
+        The decomposition of `A` or None if `A` is not positive definite or if no suitable
+        decomposition algorithm is available.
+    """
+
+    matrix.logger.debug('Calculating exact decomposition.')
+    try:
+        decomposition = matrix.calculate.decompose(
+            A, permutation=p, return_type=matrix.constants.LDL_DECOMPOSITION_TYPE,
+            check_finite=True, overwrite_A=False)
+    except (matrix.errors.NoDecompositionPossibleError, matrix.errors.MatrixNotFiniteError) as e:
+        matrix.logger.debug(f'Exact decomposition is not possible: {e}')
+        return None
+    except ImportError as e:
+        matrix.logger.debug(f'Exact decomposition is not available: {e}')
+        return None
+    else:
+        if not np.array_equal(decomposition.p, p):
+            matrix.logger.debug('Exact decomposition uses a different permutation vector.')
+            return None
+        return decomposition
+
+
 def _decomposition(
         A, min_diag_B=None, max_diag_B=None, min_diag_D=None, max_diag_D=None,
         min_abs_value_D=None, min_abs_value_L=None, permutation=None, overwrite_A=False,
-        strict_lower_triangular_only_L=False):
+        strict_lower_triangular_only_L=False, working_dtype=None, check_positive_definite=False,
+        trace=None):
     """
     Computes an (approximative) :math:`LDL^H` decomposition of a matrix with the specified properties.
 
@@ -234,10 +951,24 @@ def _decomposition(
         decomposition should be computed. If this is true, its upper triangular matrix
         may contain arbitrary values. Enabling may result in performance gain.
         optional, default : False
+    working_dtype : numpy.dtype
+        The real floating point data type used for the auxiliary values of the algorithm.
+        `d`, `omega` and `delta` are stored with at least double precision.
+        If an overflow occurs, the calculation is repeated with a more precise data type.
+        optional, default : numpy.longdouble
+    check_positive_definite : bool
+        Whether to calculate first an exact :math:`LDL^H` decomposition of `A`. If `A` is
+        positive definite and this decomposition has the specified properties, it is returned
+        without approximating. If a permutation method with pivoting is used, the exact
+        decomposition is calculated with the permutation vector without pivoting.
+        optional, default : False
+    trace : Trace
+        If passed, a record of each iteration of the algorithm is appended to it.
+        optional, default : No records are collected.
 
     Returns
     -------
-    L : numpy.ndarray or scipy.sparse.spmatrix (same type as A)
+    L : numpy.ndarray or scipy.sparse.csc_matrix (dense if A is dense and sparse otherwise)
         Matrix `L` of the decomposition.
     d : numpy.ndarray
         Diagonal of matrix `D` of the decomposition.
@@ -256,13 +987,17 @@ def _decomposition(
         If `A` has complex diagonal values.
     """
 
+    paranoid = matrix.validation.is_paranoid()
+
     # debug info
     matrix.logger.debug(f'Calculating approximated LDL decomposition with passed values: '
                         f'min_diag_B {min_diag_B}, max_diag_B {max_diag_B}, '
                         f'min_diag_D {min_diag_D}, max_diag_D {max_diag_D}, '
                         f'min_abs_value_D {min_abs_value_D}, min_abs_value_L {min_abs_value_L}, '
                         f'permutation {permutation}, overwrite_A {overwrite_A}, '
-                        f'strict_lower_triangular_only_L {strict_lower_triangular_only_L}.')
+                        f'strict_lower_triangular_only_L {strict_lower_triangular_only_L}, '
+                        f'working_dtype {working_dtype}, '
+                        f'check_positive_definite {check_positive_definite}.')
 
     # raise error at overflow
     with warnings.catch_warnings():
@@ -380,28 +1115,21 @@ def _decomposition(
             matrix.logger.debug(f'A has an integer dtype ({A.dtype}) which can not be used to store '
                                 f'the values of L. Thus L is not overwritten.')
 
-        # init L
-        if overwrite_A:
-            L = A
-        else:
-            L_dtype = np.promote_types(A.dtype, np.float64)
-            if is_dense:
-                L = np.zeros((n, n), dtype=L_dtype)
-            else:
-                L = scipy.sparse.lil_matrix((n, n), dtype=L_dtype)
-                L_rows = L.rows
-                L_data = L.data
+        # check working_dtype
+        working_dtypes = _working_dtypes(working_dtype)
 
         # check min_abs_value_D and min_abs_value_L
-        DTYPE = np.float128
-
-        d_eps = np.finfo(DTYPE).eps
+        d_eps = np.finfo(working_dtypes[0]).eps
         min_abs_value_D = check_float_scalar(min_abs_value_D, f_name='min_abs_value_D',
                                              default_value=d_eps**0.5, lower_bound=0,
                                              minus_inf_okay=False, plus_inf_okay=False)
         min_abs_value_D = max(min_abs_value_D, d_eps)
 
-        L_eps = np.finfo(L.dtype).eps
+        if overwrite_A:
+            L_dtype = A.dtype
+        else:
+            L_dtype = np.promote_types(A.dtype, np.float64)
+        L_eps = np.finfo(L_dtype).eps
         min_abs_value_L = check_float_scalar(min_abs_value_L, f_name='min_abs_value_L',
                                              default_value=L_eps, lower_bound=0, upper_bound=1,
                                              minus_inf_okay=False, plus_inf_okay=False)
@@ -456,75 +1184,137 @@ def _decomposition(
                 matrix.logger.error(error)
                 raise error
 
-        # init other values
-        alpha = np.zeros(n, dtype=DTYPE)
-        beta = np.zeros(n, dtype=DTYPE)
-        delta = np.empty(n, dtype=DTYPE)
-        omega = np.empty(n, dtype=DTYPE)
-        d = np.empty(n, dtype=DTYPE)
-        L_below_row_i = scipy.sparse.lil_matrix((1, 1), dtype=L.dtype)
-
         # debug info
         matrix.logger.debug(f'Using the following values: '
                             f'min_diag_B {min_diag_B}, max_diag_B {max_diag_B}, '
                             f'min_diag_D {min_diag_D}, max_diag_D {max_diag_D}, '
                             f'min_abs_value_D {min_abs_value_D} '
                             f'permutation {permutation}, overwrite_A {overwrite_A}, '
-                            f'strict_lower_triangular_only_L {strict_lower_triangular_only_L}.')
-
-        # calculate values iteratively
-        for i in range(n):
-
-            # choose current min d
-            def minimal_change_for_index(j):
+                            f'strict_lower_triangular_only_L {strict_lower_triangular_only_L}, '
+                            f'working_dtypes {working_dtypes}, '
+                            f'check_positive_definite {check_positive_definite}.')
+
+        # return exact decomposition if it has the specified properties
+        if check_positive_definite:
+            decomposition = _exact_decomposition(A, p)
+            if decomposition is not None:
+                d = decomposition.d
+                gamma_permuted = gamma[p]
                 if min_diag_B.ndim == 0:
-                    min_diag_B_i = min_diag_B
+                    min_diag_B_permuted = min_diag_B
                 else:
-                    min_diag_B_i = min_diag_B[p[j]]
+                    min_diag_B_permuted = min_diag_B[p]
                 if max_diag_B.ndim == 0:
-                    max_diag_B_i = max_diag_B
+                    max_diag_B_permuted = max_diag_B
                 else:
-                    max_diag_B_i = max_diag_B[p[j]]
+                    max_diag_B_permuted = max_diag_B[p]
                 if min_diag_D is not None:
-                    min_diag_D_i = min_diag_D
+                    min_diag_D_permuted = min_diag_D
                 else:
-                    min_diag_D_i = min(0.5 * min(max(gamma[p[j]], min_diag_B_i), max_diag_B_i), max_diag_D)
-                return _minimal_change(
-                    alpha[p[j]], beta[p[j]], gamma[p[j]], min_diag_D_i, max_diag_D=max_diag_D,
-                    min_diag_B=min_diag_B_i, max_diag_B=max_diag_B_i, min_abs_value_D=min_abs_value_D)
-
-            # determine next value for p, d, omega
-            if permutation_method in (MINIMAL_DIFFERENCE_PERMUTATION_METHOD,
-                                      MAXIMAL_STABILITY_PERMUTATION_METHOD):
+                    min_diag_D_permuted = np.minimum(0.5 * np.minimum(np.maximum(
+                        gamma_permuted, min_diag_B_permuted), max_diag_B_permuted), max_diag_D)
+                if (np.all(d >= np.maximum(min_diag_D_permuted, min_abs_value_D))
+                        and np.all(d <= max_diag_D)
+                        and np.all(gamma >= min_diag_B) and np.all(gamma <= max_diag_B)):
+                    matrix.logger.debug('Exact decomposition has the specified properties.')
+                    result_dtype = np.promote_types(working_dtypes[0], np.float64)
+                    d = d.astype(result_dtype)
+                    omega = np.ones(n, dtype=result_dtype)
+                    delta = np.zeros(n, dtype=result_dtype)
+                    L = decomposition.L
+                    if is_dense:
+                        L = L.astype(L_dtype)
+                        L[np.abs(L) < min_abs_value_L] = 0
+                    else:
+                        L = scipy.sparse.csc_matrix(L, dtype=L_dtype)
+                        L.data[np.abs(L.data) < min_abs_value_L] = 0
+                        L.eliminate_zeros()
+                        L.sort_indices()
+                        if strict_lower_triangular_only_L:
+                            L = scipy.sparse.tril(L, -1, format='csc')
+                    if trace is not None:
+                        for i in range(n):
+                            trace.append(i, p[i], d[i], omega[p[i]], delta[p[i]], 0)
+                    return L, d, p, omega, delta
+                matrix.logger.debug('Exact decomposition does not have the specified properties.')
+
+        # log each iteration only if debug logging is enabled
+        is_debug_logging = matrix.logger.isEnabledFor(logging.DEBUG)
+
+        # choose current min d
+        def minimal_change_for_index(j):
+            if min_diag_B.ndim == 0:
+                min_diag_B_i = min_diag_B
+            else:
+                min_diag_B_i = min_diag_B[p[j]]
+            if max_diag_B.ndim == 0:
+                max_diag_B_i = max_diag_B
+            else:
+                max_diag_B_i = max_diag_B[p[j]]
+            if min_diag_D is not None:
+                min_diag_D_i = min_diag_D
+            else:
+                min_diag_D_i = min(0.5 * min(max(gamma[p[j]], min_diag_B_i), max_diag_B_i), max_diag_D)
+            return _minimal_change(
+                alpha[p[j]], beta[p[j]], gamma[p[j]], min_diag_D_i, max_diag_D=max_diag_D,
+                min_diag_B=min_diag_B_i, max_diag_B=max_diag_B_i, min_abs_value_D=min_abs_value_D)
+
+        # choose current min d for all remaining indices
+        def minimal_changes_for_indices_after(i):
+            p_after_i = p[i:]
+            if min_diag_B.ndim == 0:
+                min_diag_B_after_i = min_diag_B
+            else:
+                min_diag_B_after_i = min_diag_B[p_after_i]
+            if max_diag_B.ndim == 0:
+                max_diag_B_after_i = max_diag_B
+            else:
+                max_diag_B_after_i = max_diag_B[p_after_i]
+            gamma_after_i = gamma[p_after_i]
+            if min_diag_D is not None:
+                min_diag_D_after_i = min_diag_D
+            else:
+                min_diag_D_after_i = np.minimum(0.5 * np.minimum(np.maximum(
+                    gamma_after_i, min_diag_B_after_i), max_diag_B_after_i), max_diag_D)
+            return _minimal_changes(
+                alpha[p_after_i], beta[p_after_i], gamma_after_i, min_diag_D_after_i,
+                max_diag_D=max_diag_D, min_diag_B=min_diag_B_after_i,
+                max_diag_B=max_diag_B_after_i, min_abs_value_D=min_abs_value_D)
+
+        # determine next index (position in p) and values for d and omega
+        is_pivoting = permutation_method in (MINIMAL_DIFFERENCE_PERMUTATION_METHOD,
+                                             MAXIMAL_STABILITY_PERMUTATION_METHOD)
+        if is_pivoting:
+            def next_minimal_change_in_working_precision(i):
+                d_after_i, omega_after_i, f_value_after_i = minimal_changes_for_indices_after(i)
                 if permutation_method == MINIMAL_DIFFERENCE_PERMUTATION_METHOD:
-                    def order(value):
-                        k, d_k, omega_k, f_value_k = value
-                        return f_value_k, -d_k, omega_k, k
+                    k = _argmin_lexicographic(f_value_after_i, -d_after_i, omega_after_i)
                 else:
-                    def order(value):
-                        k, d_k, omega_k, f_value_k = value
-                        return -d_k, f_value_k, omega_k, k
-                all_minimal_changes = ((j, *minimal_change_for_index(j)) for j in range(i, n))
-                (j, d_i, omega_i, f_value_i) = min(all_minimal_changes, key=order)
-                # swap p[i] and p[j]
-                p_i = p[j]
-                p[j] = p[i]
-                p[i] = p_i
-                # swap L[i, :] and L[j, :]
-                if i > 0:
-                    if is_dense or L.format != 'lil':
-                        L_j = L[j, :i].copy()
-                        L[j, :i] = L[i, :i]
-                        L[i, :i] = L_j
-                    else:
-                        for iterable in (L_rows, L_data):
-                            tmp = iterable[i]
-                            iterable[i] = iterable[j]
-                            iterable[j] = tmp
+                    k = _argmin_lexicographic(-d_after_i, f_value_after_i, omega_after_i)
+                return (i + k, d_after_i[k], omega_after_i[k], f_value_after_i[k])
+        else:
+            def next_minimal_change_in_working_precision(i):
+                return (i, *minimal_change_for_index(i))
+
+        # raise error if an overflow occurs and a more precise working dtype is available
+        def next_minimal_change(i):
+            if is_most_precise_working_dtype:
+                return next_minimal_change_in_working_precision(i)
+            if is_pivoting:
+                p_i = p[i:]
             else:
-                (d_i, omega_i, f_value_i) = minimal_change_for_index(i)
                 p_i = p[i]
-
+            if not (np.all(np.isfinite(alpha[p_i])) and np.all(np.isfinite(beta[p_i]))):
+                raise _WorkingPrecisionExceededError(f'Alpha or beta is infinity in iteration {i}.')
+            try:
+                with np.errstate(over='raise'):
+                    return next_minimal_change_in_working_precision(i)
+            except FloatingPointError as original_error:
+                raise _WorkingPrecisionExceededError(
+                    f'Overflow encountered in iteration {i}.') from original_error
+
+        # update d, omega and delta
+        def update_d_omega_delta(i, p_i, d_i, omega_i, f_value_i):
             # update d
             assert math.isfinite(d_i)
             assert (min_diag_D is None and d_i >= 0) or d_i >= min_diag_D
@@ -544,146 +1334,65 @@ def _decomposition(
             assert math.isfinite(delta_i)
             delta[p_i] = delta_i
 
-            # debug info
-            matrix.logger.debug(f'Using permutation index {p_i} with d {d_i}, omega {omega[p_i]}, '
-                                f'delta {delta[p_i]} and additional approximation error {f_value_i}'
-                                f' for iteration {i} of {n - 1}. ({(i + 1) / n:.1%} done.)')
-
-            # update i-th row of L with omega
-            if i > 0:
-                if is_dense:
-                    if omega_i != 0:
-                        if omega_i != 1:
-                            L[i, :i] *= omega_i
-                        L[i, np.where(np.abs(L[i, :i]) < min_abs_value_L)[0]] = 0
-                    else:
-                        L[i, :i] = 0
-                else:
-                    assert L.format == 'lil'
-                    if omega_i != 0:
-                        L_i_rows = []
-                        L_i_data = []
-                        for row, data in zip(L_rows[i], L_data[i]):
-                            data = data * omega_i
-                            if np.abs(data) >= min_abs_value_L:
-                                L_i_rows.append(row)
-                                L_i_data.append(data)
-                        L_rows[i] = L_i_rows
-                        L_data[i] = L_i_data
-                    else:
-                        L_rows[i] = []
-                        L_data[i] = []
+            # trace
+            if trace is not None:
+                trace.append(i, p_i, d_i, omega_i, delta_i, f_value_i)
 
-                assert not is_dense or np.all(np.isfinite(L[i, :i]))
-                assert is_dense or np.all(np.isfinite(L_data[i]))
-
-            # get i-th column of A
-            p_after_i = p[i + 1:]
-            if is_dense:
-                if not overwrite_A:
-                    A_column_i = A[:, p_i]
-                else:
-                    A_column_i = np.concatenate([A[:p_i, p_i], A[p_i, p_i:].conjugate()])
-            else:
-                assert not overwrite_A
-                if A.format in ('csc', 'csr', 'lil'):
-                    A_column_i = np.zeros(n, dtype=A.dtype)
-                    values = A.data[A.indptr[p_i]: A.indptr[p_i + 1]]
-                    if A.format in ('csr', 'lil'):
-                        values = values.conjugate()
-                    indices = A.indices[A.indptr[p_i]: A.indptr[p_i + 1]]
-                    A_column_i[indices] = values
-                else:
-                    A_column_i = A[:, p_i].toarray().reshape(-1)
-            A_column_i = A_column_i[p_after_i]
-            assert np.all(np.isfinite(A_column_i))
+            # debug info
+            if is_debug_logging:
+                matrix.logger.debug(f'Using permutation index {p_i} with d {d_i}, omega {omega[p_i]}, '
+                                    f'delta {delta[p_i]} and additional approximation error '
+                                    f'{f_value_i} for iteration {i} of {n - 1}. '
+                                    f'({(i + 1) / n:.1%} done.)')
+
+        # symbolic analysis for fixed permutation
+        if not is_dense and not is_pivoting:
+            matrix.logger.debug('Calculating symbolic analysis of A.')
+            L_column_counts = matrix.sparse.symbolic.column_counts(A, p=p) - 1
+        else:
+            L_column_counts = None
+
+        # calculate values iteratively with increasing working precision if necessary
+        if is_pivoting:
+            p_initial = p.copy()
+        if trace is not None:
+            trace_length_initial = len(trace)
+        for working_dtype in working_dtypes:
+            is_most_precise_working_dtype = working_dtype == working_dtypes[-1]
+
+            # init L
+            if overwrite_A:
+                L = A
+            elif is_dense:
+                L = np.zeros((n, n), dtype=L_dtype)
 
-            # update beta
-            beta_add = 2 * A_column_i * A_column_i.conjugate()
-            assert np.all(np.isreal(beta_add))
-            beta[p_after_i] += beta_add.real
+            # init other values (results with at least double precision)
+            alpha = np.zeros(n, dtype=working_dtype)
+            beta = np.zeros(n, dtype=working_dtype)
+            result_dtype = np.promote_types(working_dtype, np.float64)
+            delta = np.empty(n, dtype=result_dtype)
+            omega = np.empty(n, dtype=result_dtype)
+            d = np.empty(n, dtype=result_dtype)
 
-            # update alpha and i-th column of L
-            if d_i != 0:
-                # get auxiliary variables for calculation of i-th column of L
+            # calculate values
+            try:
                 if is_dense:
-                    if i > 0:
-                        L_row_i_mul_d = L[i, :i].conjugate() * d[:i]
-                        assert np.all(np.isfinite(L_row_i_mul_d))
-                        L_below_row_i = L[i + 1:, :i]
-                        assert np.all(np.logical_or(np.isfinite(L_below_row_i),
-                                                    np.isinf(L_below_row_i)))
+                    _dense_decomposition(A, L, p, alpha, beta, d, next_minimal_change,
+                                         update_d_omega_delta, min_abs_value_L,
+                                         overwrite_A=overwrite_A)
                 else:
-                    assert L.format == 'lil'
-                    if len(L_rows[i]) > 0:
-                        L_row_i_mul_d = L[i, :].toarray()[0]
-                        L_row_i_mul_d[:i] = L_row_i_mul_d[:i].conjugate() * d[:i]
-                        assert np.all(np.isfinite(L_row_i_mul_d))
-                        L_below_row_i.rows = L_rows[i + 1:]
-                        L_below_row_i.data = L_data[i + 1:]
-                        L_below_row_i._shape = (n - (i + 1), n)
-                        assert np.all((np.all(np.logical_or(np.isfinite(l), np.isinf(l)))
-                                       for l in L_below_row_i.data))
-
-                # calculate i-th column of L
-                if (is_dense and i > 0) or (not is_dense and len(L_rows[i]) > 0):
-                    L_column_i = L_below_row_i @ L_row_i_mul_d
-
-                    # recalculate values where inf * 0 is involved (inf * 0 is nan and should be 0)
-                    L_column_i_nan_mask = np.where(np.isnan(L_column_i))[0]
-                    assert np.all(np.logical_or(
-                        np.isfinite(L_column_i[np.logical_not(np.isnan(L_column_i))]),
-                        np.isinf(L_column_i[np.logical_not(np.isnan(L_column_i))])))
-                    if np.any(L_column_i_nan_mask):
-                        L_row_i_mul_d_zero_mask = L_row_i_mul_d == 0
-                        for j in L_column_i_nan_mask:
-                            L_row_i_j = L_below_row_i[j, :].toarray().reshape(-1)
-                            L_row_i_j[L_row_i_mul_d_zero_mask] = 0
-                            L_coulmn_i_j = np.inner(L_row_i_j, L_row_i_mul_d)
-                            assert np.logical_or(np.isfinite(L_coulmn_i_j), np.isinf(L_coulmn_i_j))
-                            L_column_i[j] = L_coulmn_i_j
-                    assert np.all(np.logical_or(np.isfinite(L_column_i), np.isinf(L_column_i)))
-
-                    L_column_i = A_column_i - L_column_i
-                else:
-                    L_column_i = A_column_i
-
-                assert np.all(np.logical_or(np.isfinite(L_column_i), np.isinf(L_column_i)))
-
-                # remove zero entries if sparse
-                if not is_dense:
-                    L_column_i_non_zero_mask = L_column_i != 0
-                    L_column_i = L_column_i[L_column_i_non_zero_mask]
-                    p_after_i = p_after_i[L_column_i_non_zero_mask]
-                assert np.all(np.logical_or(np.isfinite(L_column_i), np.isinf(L_column_i)))
-
-                # update i-th column of L
-                if len(L_column_i) > 0:
-                    # devide by d_i
-                    assert math.isfinite(d_i)
-                    assert d_i != 0
-                    L_column_i = L_column_i / d_i
-                    assert np.all(np.logical_or(np.isfinite(L_column_i), np.isinf(L_column_i)))
-
-                    # update i-th column of L
-                    if is_dense:
-                        L[i + 1:, i] = L_column_i
-                    else:
-                        assert L.format == 'lil'
-                        for k, L_column_i_k in zip(np.where(L_column_i_non_zero_mask)[0], L_column_i):
-                            j = i + 1 + k
-                            L_rows[j].append(i)
-                            L_data[j].append(L_column_i_k)
-
-                    # update alpha
-                    alpha_add = L_column_i * L_column_i.conjugate() * d_i
-                    assert np.all(np.isreal(alpha_add))
-                    alpha_add = alpha_add.real
-                    assert np.all(np.logical_or(np.isfinite(alpha_add), alpha_add == math.inf))
-                    alpha_add[L_column_i == math.inf] = math.inf
-                    alpha[p_after_i] += alpha_add
-                    assert np.all(np.logical_or(np.isfinite(alpha), alpha == math.inf))
-                    assert np.all(np.logical_or(np.isfinite(L_column_i), alpha[p_after_i] == math.inf))
+                    L = _sparse_decomposition(A, L_dtype, p, alpha, beta, d, next_minimal_change,
+                                              update_d_omega_delta, min_abs_value_L,
+                                              L_column_counts=L_column_counts)
+            except _WorkingPrecisionExceededError as e:
+                matrix.logger.debug(f'Working dtype {working_dtype} is not sufficient: {e} '
+                                    f'Restarting with a more precise working dtype.')
+                if trace is not None:
+                    trace._truncate(trace_length_initial)
+                if is_pivoting:
+                    p = p_initial.copy()
+            else:
+                break
 
         # prepare diagonal and upper triangle of L if needed
         if not strict_lower_triangular_only_L:
@@ -691,9 +1400,7 @@ def _decomposition(
                 for i in range(n):
                     L[i, i] = 1
             else:
-                for i in range(n):
-                    L_rows[i].append(i)
-                    L_data[i].append(1)
+                L = L + scipy.sparse.identity(n, dtype=L.dtype, format='csc')
 
         if not strict_lower_triangular_only_L and overwrite_A:
             assert is_dense
@@ -701,10 +1408,10 @@ def _decomposition(
                 L[i, i + 1:] = 0
 
         # return values
-        assert (min_diag_D is None and d.min() >= 0) or d.min() >= min_diag_D
-        assert d.max() <= max_diag_D
-        assert np.all(np.logical_or(d == 0, np.abs(d) >= min_abs_value_D))
-        assert np.all(omega >= 0)
+        assert not paranoid or (min_diag_D is None and d.min() >= 0) or d.min() >= min_diag_D
+        assert not paranoid or d.max() <= max_diag_D
+        assert not paranoid or np.all(np.logical_or(d == 0, np.abs(d) >= min_abs_value_D))
+        assert not paranoid or np.all(omega >= 0)
         matrix.logger.debug('Approximation of LDL decomposition finished.')
         return L, d, p, omega, delta
 
@@ -712,7 +1419,7 @@ def _decomposition(
 def decomposition(
         A, min_diag_B=None, max_diag_B=None, min_diag_D=None, max_diag_D=None,
         min_abs_value_D=None, min_abs_value_L=None, permutation=None, overwrite_A=False,
-        return_type=None):
+        return_type=None, working_dtype=None, check_positive_definite=False, trace=None):
     """
     Computes an approximative decomposition of a matrix with the specified properties.
 
@@ -766,6 +1473,21 @@ def decomposition(
         The type of the decomposition that should be returned.
         It has to be a value in :const:`matrix.DECOMPOSITION_TYPES`.
         optional, default : The type of the decomposition is chosen by the function itself.
+    working_dtype : numpy.dtype
+        The real floating point data type used for the auxiliary values of the algorithm.
+        Less precise data types like `numpy.float64` or `numpy.float32` are faster and need
+        less memory. If an overflow occurs, the calculation is repeated with a more precise
+        data type.
+        optional, default : numpy.longdouble
+    check_positive_definite : bool
+        Whether to calculate first an exact :math:`LDL^H` decomposition of `A`. If `A` is
+        positive definite and this decomposition has the specified properties, no
+        approximation is calculated. Enabling may result in performance gain if `A` is
+        often positive definite.
+        optional, default : False
+    trace : Trace
+        If passed, a record of each iteration of the algorithm is appended to it.
+        optional, default : No records are collected.
 
     Returns
     -------
@@ -786,7 +1508,8 @@ def decomposition(
                         f'min_diag_D {min_diag_D}, max_diag_D {max_diag_D}, '
                         f'min_abs_value_D {min_abs_value_D}, min_abs_value_L {min_abs_value_L}, '
                         f'permutation {permutation}, overwrite_A {overwrite_A}, '
-                        f'return_type {return_type}.')
+                        f'return_type {return_type}, working_dtype {working_dtype}, '
+                        f'check_positive_definite {check_positive_definite}.')
 
     # check return type
     supported_return_types = matrix.constants.DECOMPOSITION_TYPES
@@ -802,11 +1525,9 @@ def decomposition(
         min_diag_D=min_diag_D, max_diag_D=max_diag_D,
         min_abs_value_D=min_abs_value_D, min_abs_value_L=min_abs_value_L,
         permutation=permutation, overwrite_A=overwrite_A,
-        strict_lower_triangular_only_L=False)
+        strict_lower_triangular_only_L=False, working_dtype=working_dtype,
+        check_positive_definite=check_positive_definite, trace=trace)
 
-    if matrix.sparse.util.is_sparse(L):
-        matrix.logger.debug('Converting L to csr format.')
-        L = L.tocsr(copy=False)
     decomposition = matrix.decompositions.LDL_Decomposition(L=L, d=d, p=p).as_type(return_type)
     decomposition.omega = omega
     decomposition.delta = delta
@@ -818,7 +1539,8 @@ def decomposition(
 
 def positive_semidefinite_matrix(
         A, min_diag_B=None, max_diag_B=None, min_diag_D=None, max_diag_D=None,
-        min_abs_value_D=None, min_abs_value_L=None, permutation=None, overwrite_A=False):
+        min_abs_value_D=None, min_abs_value_L=None, permutation=None, overwrite_A=False,
+        working_dtype=None, check_positive_definite=False, trace=None):
     """
     Computes an approximation of `A` which has a :math:`LDL^H` decomposition with the specified properties.
 
@@ -867,6 +1589,21 @@ def positive_semidefinite_matrix(
     overwrite_A : bool
         Whether it is allowed to overwrite `A`. Enabling may result in performance gain.
         optional, default: False
+    working_dtype : numpy.dtype
+        The real floating point data type used for the auxiliary values of the algorithm.
+        Less precise data types like `numpy.float64` or `numpy.float32` are faster and need
+        less memory. If an overflow occurs, the calculation is repeated with a more precise
+        data type.
+        optional, default : numpy.longdouble
+    check_positive_definite : bool
+        Whether to calculate first an exact :math:`LDL^H` decomposition of `A`. If `A` is
+        positive definite and this decomposition has the specified properties, no
+        approximation is calculated. Enabling may result in performance gain if `A` is
+        often positive definite.
+        optional, default : False
+    trace : Trace
+        If passed, a record of each iteration of the algorithm is appended to it.
+        optional, default : No records are collected.
 
     Returns
     -------
@@ -881,12 +1618,16 @@ def positive_semidefinite_matrix(
         If `A` has complex diagonal values.
     """
 
+    paranoid = matrix.validation.is_paranoid()
+
     # debug info
     matrix.logger.debug(f'Calculating approximation of a matrix with passed values: '
                         f'min_diag_B {min_diag_B}, max_diag_B {max_diag_B}, '
                         f'min_diag_D {min_diag_D}, max_diag_D {max_diag_D}, '
                         f'min_abs_value_D {min_abs_value_D}, min_abs_value_L {min_abs_value_L}, '
-                        f'permutation {permutation}, overwrite_A {overwrite_A}.')
+                        f'permutation {permutation}, overwrite_A {overwrite_A}, '
+                        f'working_dtype {working_dtype}, '
+                        f'check_positive_definite {check_positive_definite}.')
 
     # calculate decomposition
     L, d, p, omega, delta = _decomposition(
@@ -894,99 +1635,89 @@ def positive_semidefinite_matrix(
         min_diag_D=min_diag_D, max_diag_D=max_diag_D,
         min_abs_value_D=min_abs_value_D, min_abs_value_L=min_abs_value_L,
         permutation=permutation, overwrite_A=overwrite_A,
-        strict_lower_triangular_only_L=True)
+        strict_lower_triangular_only_L=True, working_dtype=working_dtype,
+        check_positive_definite=check_positive_definite, trace=trace)
 
-    # init B
+    # init values
     matrix.logger.debug('Calculating approximation matrix B.')
     n = L.shape[0]
     B_dtype = L.dtype
-    if np.all(d != 0):
-        del L
     is_dense = not matrix.sparse.util.is_sparse(A)
-    if overwrite_A:
-        B = A
-    else:
-        if is_dense:
-            B = np.empty((n, n), dtype=B_dtype)
-        else:
-            B = scipy.sparse.lil_matrix((n, n), dtype=B_dtype)
-
-    # populate B
     q = matrix.permute.invert_permutation_vector(p)
+    omega_permuted = omega[p]
+    d_is_zero = d == 0
+    if not np.any(d_is_zero):
+        del L
 
+    # calculate diagonal of B
+    B_diagonal = A.diagonal() + delta
+    assert not paranoid or np.all(np.isreal(B_diagonal))
+    B_diagonal = B_diagonal.real
     if min_diag_B is not None:
-        min_diag_B = np.asarray(min_diag_B)
+        min_diag_B = np.broadcast_to(min_diag_B, n)
+        B_diagonal_mask = B_diagonal < min_diag_B
+        assert not paranoid or np.allclose(B_diagonal[B_diagonal_mask], min_diag_B[B_diagonal_mask])
+        B_diagonal[B_diagonal_mask] = min_diag_B[B_diagonal_mask]
     if max_diag_B is not None:
-        max_diag_B = np.asarray(max_diag_B)
-
-    for i in range(n):
-        # set diagonal entries
-        B_i_i = A[i, i] + delta[i]
-
-        if min_diag_B is not None:
-            if min_diag_B.ndim == 0:
-                min_diag_B_i = min_diag_B
-            else:
-                min_diag_B_i = min_diag_B[i]
-            if B_i_i < min_diag_B_i:
-                assert cmath.isclose(B_i_i, min_diag_B_i)
-                B_i_i = min_diag_B_i
-
-        if max_diag_B is not None:
-            if max_diag_B.ndim == 0:
-                max_diag_B_i = max_diag_B
-            else:
-                max_diag_B_i = max_diag_B[i]
-            if B_i_i > max_diag_B_i:
-                assert cmath.isclose(B_i_i, max_diag_B_i)
-                B_i_i = max_diag_B_i
-
-        assert cmath.isfinite(B_i_i)
-        B[i, i] = B_i_i
-
-        # set upper diagonal entries
-        for j in range(i + 1, n):
-            if q[i] > q[j]:
-                a = j
-                b = i
-            else:
-                a = i
-                b = j
-            assert q[a] < q[b]
-            if d[q[a]] != 0:
-                B_i_j = A[i, j] * omega[b]
-            elif omega[b] == 0:
-                B_i_j = 0
-            else:
-                if q[a] > 0:
-                    r_i = L[q[i], :q[a]]
-                    r_j = L[q[j], :q[a]]
-                    if is_dense:
-                        r_i = r_i * d[:q[a]]
-                        r_j = r_j.conjugate()
-                    else:
-                        r_i = r_i.multiply(d[:q[a]])
-                        r_j = r_j.conjugate(copy=False).transpose(copy=False)
-                    B_i_j = r_i @ r_j
-                    if not is_dense:
-                        assert B_i_j.shape == (1, 1)
-                        B_i_j = B_i_j[0, 0]
-                else:
-                    B_i_j = 0
-            assert cmath.isfinite(B_i_j)
-            B[i, j] = B_i_j
-
-    # set lower diagonal entries
-    for i in range(n):
-        for j in range(i + 1, n):
-            B[j, i] = np.conjugate(B[i, j])
-
-    # return B
-    if not is_dense:
+        max_diag_B = np.broadcast_to(max_diag_B, n)
+        B_diagonal_mask = B_diagonal > max_diag_B
+        assert not paranoid or np.allclose(B_diagonal[B_diagonal_mask], max_diag_B[B_diagonal_mask])
+        B_diagonal[B_diagonal_mask] = max_diag_B[B_diagonal_mask]
+    assert not paranoid or np.all(np.isfinite(B_diagonal))
+
+    # calculate strict upper triangle of permuted B (only the upper triangle of A is used)
+    # entries with d != 0 at the row position are entries of A scaled by omega at the column position
+    # entries with d == 0 at the row position are entries of L D L^H
+    if is_dense:
+        A_upper = np.triu(A, 1).astype(B_dtype, copy=False)
+        A_upper = A_upper + A_upper.conj().T
+        U = np.triu(A_upper[np.ix_(p, p)], 1)
+        del A_upper
+        U *= np.logical_not(d_is_zero)[:, np.newaxis]
+        U *= omega_permuted[np.newaxis, :].astype(U.real.dtype)
+        U_rows = np.where(d_is_zero)[0]
+        if len(U_rows) > 0:
+            L = np.tril(L, -1)    # upper triangle might contain values of A if overwrite_A
+            L_rows = L[U_rows] * d.astype(L.real.dtype)[np.newaxis, :]
+            U_add = L_rows @ L.conj().T
+            del L_rows
+            U_add[np.arange(n)[np.newaxis, :] <= U_rows[:, np.newaxis]] = 0
+            U_add *= (omega_permuted != 0)[np.newaxis, :]
+            U[U_rows] += U_add
+            del U_add
+        B = U + U.conj().T
+        del U
+        B[np.diag_indices(n)] = B_diagonal[p]
+        B = B[np.ix_(q, q)]
+    else:
+        A_upper = scipy.sparse.triu(A, 1, format='csc').astype(B_dtype, copy=False)
+        A_upper = A_upper + A_upper.conj().transpose()
+        U = scipy.sparse.triu(A_upper[p][:, p], 1, format='csc')
+        del A_upper
+        U = (scipy.sparse.diags(np.logical_not(d_is_zero).astype(U.real.dtype))
+             @ U @ scipy.sparse.diags(omega_permuted.astype(U.real.dtype)))
+        if np.any(d_is_zero):
+            L = L.tocsc()
+            L_rows = scipy.sparse.diags(d_is_zero.astype(L.real.dtype)) @ L
+            U_add = L_rows @ scipy.sparse.diags(d.astype(L.real.dtype)) @ L.conj().transpose()
+            del L_rows
+            U_add = scipy.sparse.triu(U_add, 1)
+            U_add = U_add @ scipy.sparse.diags((omega_permuted != 0).astype(L.real.dtype))
+            U = U + U_add
+            del U_add
+        B = U + U.conj().transpose() + scipy.sparse.diags(B_diagonal[p])
+        del U
+        B = B.tocsr()[q][:, q]
+        B.eliminate_zeros()
         B = B.asformat(A.format)
+    assert not paranoid or matrix.util.is_finite(B)
 
-    # return B
-    assert min_diag_B is None or np.all(B.diagonal() >= min_diag_B)
-    assert max_diag_B is None or np.all(B.diagonal() <= max_diag_B)
+    # return B with same dtype as L
+    B = B.astype(B_dtype, copy=False)
+    if overwrite_A and is_dense and A.dtype == B.dtype:
+        A[...] = B
+        B = A
+    assert not paranoid or min_diag_B is None or np.all(B.diagonal() >= min_diag_B)
+    assert not paranoid or max_diag_B is None or np.all(B.diagonal() <= max_diag_B)
     matrix.logger.debug('Approximation matrix B calculated.')
     return B
@@ -2,7 +2,7 @@
 This package provides functions to approximate matrices by positive semidefinite matrices.
 """
 
-from matrix.approximation.positive_semidefinite.Reimer import decomposition, positive_semidefinite_matrix
+from matrix.approximation.positive_semidefinite.Reimer import decomposition, positive_semidefinite_matrix, Trace
 
 from matrix.approximation.positive_semidefinite.Reimer import APPROXIMATION_ONLY_PERMUTATION_METHODS, MAXIMAL_STABILITY_PERMUTATION_METHOD, MINIMAL_DIFFERENCE_PERMUTATION_METHOD
 APPROXIMATION_ONLY_PERMUTATION_METHODS = APPROXIMATION_ONLY_PERMUTATION_METHODS
@@ -12,3 +12,10 @@ MINIMAL_DIFFERENCE_PERMUTATION_METHOD = MINIMAL_DIFFERENCE_PERMUTATION_METHOD
 MAXIMAL_STABILITY_PERMUTATION_METHOD = MAXIMAL_STABILITY_PERMUTATION_METHOD
 """ Permutation method supported by the decomposition and the positive_semidefinite_matrix algorithm. """
 from matrix.approximation.positive_semidefinite.GMW_SE import GMW_81, GMW_T1, GMW_T2, SE_90, SE_99, SE_T1, SE_T2
+from matrix.approximation.positive_semidefinite.GMW_SE import GMW_SE_PERMUTATION_METHODS, MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD, GERSHGORIN_PERMUTATION_METHOD
+GMW_SE_PERMUTATION_METHODS = GMW_SE_PERMUTATION_METHODS
+""" Permutation methods supported by the GMW and SE algorithms. """
+MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD = MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD
+""" Permutation method supported by the GMW and SE algorithms. """
+GERSHGORIN_PERMUTATION_METHOD = GERSHGORIN_PERMUTATION_METHOD
+""" Permutation method supported by the GMW and SE algorithms. """
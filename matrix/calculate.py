@@ -8,7 +8,7 @@ import matrix.sparse.calculate
 import matrix.sparse.util
 
 
-def decompose(A, permutation=None, return_type=None, check_finite=True, overwrite_A=False):
+def decompose(A, permutation=None, return_type=None, check_finite=True, overwrite_A=False, keep_native_factor=False, symbolic=None):
     """
     Computes a decomposition of a matrix.
 
@@ -41,6 +41,17 @@ def decompose(A, permutation=None, return_type=None, check_finite=True, overwrit
         Whether it is allowed to overwrite `A`.
         Enabling may result in performance gain.
         optional, default: False
+    keep_native_factor : bool
+        Whether the factor object of the library which calculates the decomposition
+        is kept in the returned decomposition. It is then used to solve linear systems.
+        This needs additional memory. This is only supported for sparse matrices.
+        optional, default: False
+    symbolic : matrix.sparse.symbolic.SymbolicDecomposition
+        A symbolic decomposition of a sparse matrix with the same sparsity pattern as `A`
+        as returned by :func:`matrix.analyze`. If it is passed, its permutation and its symbolic
+        analysis are reused and `permutation` must not be passed.
+        This is only supported for sparse matrices.
+        optional, default: `A` is analyzed.
 
     Returns
     -------
@@ -55,19 +66,27 @@ def decompose(A, permutation=None, return_type=None, check_finite=True, overwrit
         If `A` is not a square matrix.
     matrix.errors.MatrixNotFiniteError
         If `A` is not a finite matrix and `check_finite` is True.
+    ValueError
+        If `symbolic` is passed and it is not suitable for `A`.
     """
 
     # debug logging
-    matrix.logger.debug('Decomposing matrix with permutation={permutation}, return_type={return_type}, check_finite={check_finite}, overwrite_A={overwrite_A}.'.format(
+    matrix.logger.debug('Decomposing matrix with permutation={permutation}, return_type={return_type}, check_finite={check_finite}, overwrite_A={overwrite_A}, keep_native_factor={keep_native_factor}, symbolic={symbolic}.'.format(
         permutation=permutation,
         return_type=return_type,
         check_finite=check_finite,
-        overwrite_A=overwrite_A))
+        overwrite_A=overwrite_A,
+        keep_native_factor=keep_native_factor,
+        symbolic=symbolic))
 
     # decompose
     if matrix.sparse.util.is_sparse(A):
-        decomposition = matrix.sparse.calculate.decompose(A, permutation=permutation, return_type=return_type, check_finite=check_finite, overwrite_A=overwrite_A)
+        decomposition = matrix.sparse.calculate.decompose(A, permutation=permutation, return_type=return_type, check_finite=check_finite, overwrite_A=overwrite_A, keep_native_factor=keep_native_factor, symbolic=symbolic)
     else:
+        if symbolic is not None:
+            error = ValueError('Symbolic decompositions are only supported for sparse matrices.')
+            matrix.logger.error(error)
+            raise error
         decomposition = matrix.dense.calculate.decompose(A, permutation=permutation, return_type=return_type, check_finite=check_finite, overwrite_A=overwrite_A)
 
     # return
@@ -75,6 +94,56 @@ def decompose(A, permutation=None, return_type=None, check_finite=True, overwrit
     return decomposition
 
 
+def analyze(A, permutation=None):
+    """
+    Computes a symbolic decomposition of a sparse matrix.
+
+    The symbolic decomposition can be passed to :func:`matrix.decompose` to decompose
+    all matrices with the same sparsity pattern without analyzing them again.
+
+    Parameters
+    ----------
+    A : scipy.sparse.spmatrix
+        Matrix to be analyzed. Only its sparsity pattern is used, except for permutation
+        methods which depend on the diagonal values.
+        `A` must be Hermitian.
+    permutation : str or numpy.ndarray
+        The symmetric permutation method that is applied to the matrix before
+        it is decomposed. It has to be a value in
+        :const:`matrix.UNIVERSAL_PERMUTATION_METHODS` or
+        :const:`matrix.SPARSE_ONLY_PERMUTATION_METHODS`.
+        It is also possible to directly pass a permutation vector.
+        optional, default: no permutation
+
+    Returns
+    -------
+    matrix.sparse.symbolic.SymbolicDecomposition
+        A symbolic decomposition of `A`.
+
+    Raises
+    ------
+    matrix.errors.MatrixNotSquareError
+        If `A` is not a square matrix.
+    ValueError
+        If `A` is not sparse.
+    """
+
+    # debug logging
+    matrix.logger.debug('Analyzing matrix with permutation={permutation}.'.format(
+        permutation=permutation))
+
+    # analyze
+    if not matrix.sparse.util.is_sparse(A):
+        error = ValueError('Symbolic decompositions are only supported for sparse matrices.')
+        matrix.logger.error(error)
+        raise error
+    symbolic = matrix.sparse.calculate.analyze(A, permutation=permutation)
+
+    # return
+    matrix.logger.debug('Analyzing matrix finished.')
+    return symbolic
+
+
 def is_positive_semidefinite(A, check_finite=True):
     """
     Returns whether the passed matrix is positive semi-definite.
@@ -253,7 +322,7 @@ def solve(A, b, overwrite_b=False, check_finite=True):
         check_finite=check_finite))
 
     # try to decompose and solve with decomposition
-    decomposition = decompose(A, check_finite=check_finite)
+    decomposition = decompose(A, check_finite=check_finite, keep_native_factor=True)
     try:
         return decomposition.solve(b, overwrite_b=overwrite_b, check_finite=False)
     except matrix.errors.DecompositionSingularError as base_error:
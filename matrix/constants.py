@@ -26,6 +26,14 @@ UNIVERSAL_PERMUTATION_METHODS = (NO_PERMUTATION_METHOD,) + DIAGONAL_VALUES_PERMU
 
 from matrix.sparse.constants import SPARSE_ONLY_PERMUTATION_METHODS, BEST_FILL_REDUCE_PERMUTATION_METHOD, DEFAULT_FILL_REDUCE_PERMUTATION_METHOD
 
+# *** validation levels *** #
+
+PARANOID_VALIDATION_LEVEL = 'paranoid'
+FAST_VALIDATION_LEVEL = 'fast'
+
+VALIDATION_LEVELS = (PARANOID_VALIDATION_LEVEL, FAST_VALIDATION_LEVEL)
+""" Supported validation levels of internal consistency checks. """
+
 # *** save and load *** #
 
 DECOMPOSITION_ATTRIBUTE_FILENAME = 'attribute_{attribute_name}.{file_extension}'
@@ -7,16 +7,19 @@ import copy
 import os
 import tarfile
 import tempfile
-import warnings
+import threading
 
 import numpy as np
 import scipy.sparse
+import scipy.sparse.linalg
 
 import matrix
 import matrix.constants
 import matrix.errors
 import matrix.permute
+import matrix.sparse.util
 import matrix.util
+import matrix.validation
 
 
 class DecompositionBase(metaclass=abc.ABCMeta):
@@ -46,6 +49,208 @@ class DecompositionBase(metaclass=abc.ABCMeta):
         return '{type_str} decomposition of matrix with shape ({n}, {n})'.format(
             type_str=self.type_str, n=self.n)
 
+    # *** threads *** #
+
+    @property
+    def number_of_threads(self):
+        """ :class:`int`: The number of threads which solve blocks of right-hand sides in parallel
+        with sparse decompositions. It is neither saved nor converted."""
+
+        try:
+            return self._number_of_threads
+        except AttributeError:
+            return 1
+
+    @number_of_threads.setter
+    def number_of_threads(self, number_of_threads):
+        number_of_threads = int(number_of_threads)
+        if number_of_threads < 1:
+            error = ValueError(f'The number of threads has to be positive but it is {number_of_threads}.')
+            matrix.logger.error(error)
+            raise error
+        self._number_of_threads = number_of_threads
+
+    # *** cache *** #
+
+    @property
+    def use_cache(self):
+        """ :class:`bool`: Whether derived properties of this decomposition are cached.
+        The cache is cleared each time an attribute of the decomposition is set.
+        If an attribute is modified in place instead, :meth:`clear_cache` has to be called.
+        The arrays of cached dense and sparse matrices are read-only.
+        Disabling clears the cache."""
+
+        try:
+            return self._use_cache
+        except AttributeError:
+            return True
+
+    @use_cache.setter
+    def use_cache(self, use_cache):
+        self._use_cache = bool(use_cache)
+        if not self._use_cache:
+            self.clear_cache()
+
+    def clear_cache(self):
+        """ Removes all cached derived properties of this decomposition to free memory.
+
+        The derived properties are calculated again on their next access.
+        """
+
+        try:
+            del self._cache
+        except AttributeError:
+            pass
+        try:
+            del self._work_buffers
+        except AttributeError:
+            pass
+
+    def _cached(self, name, calculate):
+        """ Returns a cached derived property of this decomposition.
+
+        Parameters
+        ----------
+        name : str
+            The name of the derived property.
+        calculate : callable
+            A function without arguments which calculates the derived property if it is not
+            cached. If it returns a :class:`numpy.ndarray` or a :class:`scipy.sparse.spmatrix`,
+            its arrays are made read-only.
+
+        Returns
+        -------
+        object
+            The value of the derived property.
+        """
+
+        if not self.use_cache:
+            return calculate()
+        try:
+            cache = self._cache
+        except AttributeError:
+            cache = {}
+            self._cache = cache
+        try:
+            value = cache[name]
+        except KeyError:
+            value = calculate()
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+            elif scipy.sparse.issparse(value):
+                for array_name in ('data', 'indices', 'indptr', 'offsets', 'row', 'col'):
+                    array = getattr(value, array_name, None)
+                    if isinstance(array, np.ndarray):
+                        array.flags.writeable = False
+            cache[name] = value
+        return value
+
+    def _attributes_changed(self):
+        """ Removes all cached derived properties and the native factor because an attribute of this decomposition has been changed. """
+
+        self.clear_cache()
+        try:
+            del self._native_factor
+        except AttributeError:
+            pass
+
+    # *** native factor *** #
+
+    @property
+    def native_factor(self):
+        """ :class:`object`: The factor object of the library which has calculated this decomposition or None.
+        It is used to solve linear systems. It is neither saved nor converted and it is removed if an attribute of the decomposition is set."""
+
+        try:
+            return self._native_factor[0]
+        except AttributeError:
+            return None
+
+    def _set_native_factor(self, native_factor, p=None):
+        """ Sets the factor object of the library which has calculated this decomposition.
+
+        Parameters
+        ----------
+        native_factor : object
+            An object with a method `solve_A(b)` which solves `B x = b` regarding `x`,
+            e.g. a :class:`sksparse.cholmod.Factor`.
+        p : numpy.ndarray
+            The permutation vector with `B = A[p[:, np.newaxis], p[np.newaxis, :]]` where `A`
+            is the composed matrix represented by this decomposition.
+            optional, default: `B` is the composed matrix itself.
+        """
+
+        self._native_factor = (native_factor, p)
+
+    def _native_solve(self, b, dtype=None):
+        """ Solves `A x = b` regarding `x` with the native factor.
+
+        Returns
+        -------
+        numpy.ndarray or scipy.sparse.spmatrix or None
+            An `x` so that `A x = b` or None if this decomposition has no native factor.
+        """
+
+        try:
+            native_factor, p = self._native_factor
+        except AttributeError:
+            return None
+        b = matrix.util.as_matrix_or_vector(b, dtype=dtype, copy=False)
+        if p is not None:
+            b = b[p]
+        x = native_factor.solve_A(b)
+        if p is not None:
+            x = x[matrix.permute.invert_permutation_vector(p)]
+        return x
+
+    def __deepcopy__(self, memo):
+        # the native factor is not changed by this library and is shared, work buffers are not copied
+        decomposition = copy.copy(self)
+        memo[id(self)] = decomposition
+        for name, value in self.__dict__.items():
+            if name == '_work_buffers':
+                delattr(decomposition, name)
+            elif name != '_native_factor':
+                setattr(decomposition, name, copy.deepcopy(value, memo))
+        return decomposition
+
+    # *** work buffers *** #
+
+    def _work_buffer(self, shape, dtype):
+        """ Returns a Fortran contiguous array which is reused by subsequent calls in the same thread.
+
+        Each thread keeps one buffer which is enlarged if a larger array is requested.
+        It is freed if the thread ends or if the cache is cleared.
+
+        Parameters
+        ----------
+        shape : tuple
+            The shape of the array.
+        dtype : numpy.dtype
+            The data type of the array.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array with arbitrary values.
+        """
+
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape)) * dtype.itemsize
+        try:
+            work_buffers = self._work_buffers
+        except AttributeError:
+            work_buffers = threading.local()
+            self._work_buffers = work_buffers
+        try:
+            work_buffer = work_buffers.work_buffer
+        except AttributeError:
+            work_buffer = None
+        if work_buffer is None or len(work_buffer) < size:
+            work_buffer = np.empty(size, dtype=np.uint8)
+            work_buffers.work_buffer = work_buffer
+        return work_buffer[:size].view(dtype).reshape(shape, order='F')
+
     # *** permutation *** #
 
     @property
@@ -57,7 +262,7 @@ class DecompositionBase(metaclass=abc.ABCMeta):
         except AttributeError:
             return False
         else:
-            return np.any(p != np.arange(len(p)))
+            return self._cached('is_permuted', lambda: bool(np.any(p != np.arange(len(p)))))
 
     @property
     def p(self):
@@ -74,6 +279,7 @@ class DecompositionBase(metaclass=abc.ABCMeta):
         if p is not None:
             p = matrix.util.as_vector(p)
             self._p = p
+            self._attributes_changed()
         else:
             del self.p
 
@@ -83,12 +289,13 @@ class DecompositionBase(metaclass=abc.ABCMeta):
             del self._p
         except AttributeError:
             pass
+        self._attributes_changed()
 
     @property
     def p_inverse(self):
         """ :class:`numpy.ndarray`: The permutation vector that undoes the permutation."""
 
-        return matrix.permute.invert_permutation_vector(self.p)
+        return self._cached('p_inverse', lambda: matrix.permute.invert_permutation_vector(self.p))
 
     def _apply_previous_permutation(self, p_previous):
         """ Applies a previous permutation to the current permutation.
@@ -104,6 +311,7 @@ class DecompositionBase(metaclass=abc.ABCMeta):
         except AttributeError:
             p_next = None
         self._p = matrix.permute.concatenate_permutation_vectors(p_previous, p_next)
+        self._attributes_changed()
 
     def _apply_succeeding_permutation(self, p_next):
         """ Applies a succeeding permutation to the current permutation.
@@ -119,18 +327,19 @@ class DecompositionBase(metaclass=abc.ABCMeta):
         except AttributeError:
             p_previous = None
         self._p = matrix.permute.concatenate_permutation_vectors(p_previous, p_next)
+        self._attributes_changed()
 
     @property
     def P(self):
-        """ :class:`scipy.sparse.dok_matrix`: The permutation matrix.
+        """ :class:`scipy.sparse.csr_matrix`: The permutation matrix.
         `P @ A @ P.T` is the matrix `A` permuted by the permutation of the decomposition"""
 
-        p = self.p
-        n = len(p)
-        P = scipy.sparse.dok_matrix((n, n), dtype=np.int8)
-        for i in range(n):
-            P[i, p[i]] = 1
-        return P
+        def calculate_P():
+            p = self.p
+            n = len(p)
+            return scipy.sparse.csr_matrix((np.ones(n, dtype=np.int8), p.copy(), np.arange(n + 1)), shape=(n, n))
+
+        return self._cached('P', calculate_P)
 
     def permute_matrix(self, A):
         """ Permutes a matrix by the permutation of the decomposition.
@@ -616,6 +825,161 @@ class DecompositionBase(metaclass=abc.ABCMeta):
 
     # *** multiply *** #
 
+    @abc.abstractmethod
+    def _multiply_factor(self, x, conjugate_transpose=False, dtype=None):
+        """
+        Calculates the product `F @ x` or `F.H @ x` where `F` is the lower triangle factor
+        of this decomposition. The composed matrix represented by this decomposition is
+        `P.T @ F @ D @ F.H @ P` where `P` is the permutation matrix and `D` is the diagonal
+        matrix with the diagonal values :attr:`_factor_diagonal`.
+
+        Parameters
+        ----------
+        x : numpy.ndarray or scipy.sparse.spmatrix
+            Vector or matrix in the product. It may be overwritten.
+        conjugate_transpose : bool
+            Whether `F.H @ x` instead of `F @ x` is calculated.
+            optional, default: False
+        dtype : numpy.dtype
+            Type to use in computation.
+            optional, default: Determined by the method.
+
+        Returns
+        -------
+        numpy.ndarray or scipy.sparse.spmatrix
+            The result of `F @ x` or `F.H @ x`.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _solve_factor(self, x, conjugate_transpose=False, dtype=None):
+        """
+        Solves the equation `F z = x` or `F.H z = x` regarding `z` where `F` is the lower
+        triangle factor of this decomposition as described in :meth:`_multiply_factor`.
+
+        Parameters
+        ----------
+        x : numpy.ndarray or scipy.sparse.spmatrix
+            Right-hand side vector or matrix. It may be overwritten.
+        conjugate_transpose : bool
+            Whether `F.H z = x` instead of `F z = x` is solved.
+            optional, default: False
+        dtype : numpy.dtype
+            Type to use in computation.
+            optional, default: Determined by the method.
+
+        Returns
+        -------
+        numpy.ndarray
+            The solution `z`.
+        """
+        raise NotImplementedError
+
+    def _solve_factors(self, x, conjugate_transpose=False, dtype=None):
+        """
+        Solves the equation `F D F.H z = x` or its conjugate transpose regarding `z` where `F`
+        is the lower triangle factor of this decomposition as described in :meth:`_multiply_factor`
+        and `D` is the diagonal matrix with the diagonal values :attr:`_factor_diagonal`.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Right-hand side vector or matrix. It may be overwritten.
+        conjugate_transpose : bool
+            Whether `F D.H F.H z = x` instead of `F D F.H z = x` is solved.
+            optional, default: False
+        dtype : numpy.dtype
+            Type to use in computation.
+            optional, default: Determined by the method.
+
+        Returns
+        -------
+        numpy.ndarray
+            The solution `z`.
+        """
+
+        x = self._solve_factor(x, dtype=dtype)
+        d = self._factor_diagonal
+        if d is not None:
+            if conjugate_transpose:
+                d = d.conj()
+            if x.ndim > 1:
+                d = d.reshape(-1, 1)
+            if np.can_cast(np.result_type(x.dtype, d.dtype), x.dtype):
+                x = np.divide(x, d, out=x)
+            else:
+                x = x / d
+        return self._solve_factor(x, conjugate_transpose=True, dtype=dtype)
+
+    def _solve_triangular(self, F, x, unit_diagonal=False, conjugate_transpose=False, dtype=None):
+        """
+        Solves the equation `F z = x` or `F.H z = x` regarding `z` where `F` is a lower
+        triangle factor of this decomposition.
+
+        Sparse factors are converted once as long as no attribute is changed into the strict
+        triangle of `F` or `F.H` in CSR format with sorted indices, its diagonal and the
+        dependency levels of its rows. These are reused by subsequent solves which solve all
+        rows of a level at once, or row by row if the levels are small, and blocks of right-hand
+        sides in :attr:`number_of_threads` threads.
+
+        Parameters
+        ----------
+        F : numpy.ndarray or scipy.sparse.spmatrix
+            The lower triangle factor. Only its lower triangle is used.
+        x : numpy.ndarray
+            Right-hand side vector or matrix. It may be overwritten.
+        unit_diagonal : bool
+            Whether the diagonal values of `F` are assumed to be one.
+            optional, default: False
+        conjugate_transpose : bool
+            Whether `F.H z = x` instead of `F z = x` is solved.
+            optional, default: False
+        dtype : numpy.dtype
+            Type to use in computation.
+            optional, default: Determined by the method.
+
+        Returns
+        -------
+        numpy.ndarray
+            The solution `z`.
+        """
+
+        if scipy.sparse.issparse(F):
+            lower = not conjugate_transpose
+
+            def calculate():
+                T, diagonal = matrix.sparse.util.triangular_solve_factor(F, lower=True, unit_diagonal=unit_diagonal, conjugate_transpose=conjugate_transpose)
+                levels = matrix.sparse.util.triangular_solve_levels(T, lower=lower)
+                return T, diagonal, levels
+
+            name = 'triangular_solve_factor_conjugate_transpose' if conjugate_transpose else 'triangular_solve_factor'
+            T, diagonal, levels = self._cached(name, calculate)
+            return matrix.sparse.util.solve_triangular_factor(T, diagonal, x, lower=lower, overwrite_b=True, dtype=dtype, levels=levels, number_of_threads=self.number_of_threads)
+        else:
+            return matrix.util.solve_triangular(F, x, lower=True, unit_diagonal=unit_diagonal, conjugate_transpose=conjugate_transpose, overwrite_b=True, check_finite=False, dtype=dtype)
+
+    def _check_factors_finite(self):
+        """ Checks once as long as no attribute is changed whether the factors of this decomposition are finite.
+
+        Raises
+        -------
+        matrix.errors.DecompositionNotFiniteError
+            If this is a decomposition representing a non-finite matrix.
+        """
+
+        if not self._cached('is_finite', self.is_finite):
+            raise matrix.errors.DecompositionNotFiniteError(self)
+
+    @property
+    def _factor_diagonal(self):
+        """ :class:`numpy.ndarray`: The diagonal values of the diagonal matrix between the factors or None if it is the identity matrix."""
+        return None
+
+    @property
+    def _factor_dtype(self):
+        """ :class:`numpy.dtype`: The data type of the factors of this decomposition."""
+        return np.result_type(*(getattr(self, attribute_name).dtype for attribute_name in self._attribute_names if attribute_name != 'p'))
+
     def matrix_right_side_multiplication(self, x, dtype=None):
         """
         Calculates the right side (matrix-matrix or matrix-vector) product `A @ x`, where `A` is the composed matrix represented by this decomposition.
@@ -637,7 +1001,12 @@ class DecompositionBase(metaclass=abc.ABCMeta):
         """
 
         x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
-        return self.composed_matrix @ x
+        x = self._multiply_factor(x[self.p], conjugate_transpose=True, dtype=dtype)
+        d = self._factor_diagonal
+        if d is not None:
+            x = matrix.util.scale_columns(x.transpose(), d).transpose()
+        x = self._multiply_factor(x, dtype=dtype)
+        return x[self.p_inverse]
 
     def matrix_both_sides_multiplication(self, x, y=None, dtype=None):
         """
@@ -663,15 +1032,19 @@ class DecompositionBase(metaclass=abc.ABCMeta):
         """
 
         x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
+        x = self._multiply_factor(x[self.p], conjugate_transpose=True, dtype=dtype)
         if y is None:
             y = x
         else:
             y = matrix.util.as_matrix_or_vector(y, dtype=dtype, copy=False)
+            y = self._multiply_factor(y[self.p], conjugate_transpose=True, dtype=dtype)
         y = matrix.util.conjugate_transpose(y)
-        return y @ self.matrix_right_side_multiplication(x, dtype=dtype)
+        d = self._factor_diagonal
+        if d is not None:
+            y = matrix.util.scale_columns(y, d)
+        return y @ x
 
-    @abc.abstractmethod
-    def inverse_matrix_right_side_multiplication(self, x, dtype=None):
+    def inverse_matrix_right_side_multiplication(self, x, dtype=None, out=None):
         """
         Calculates the right side (matrix-matrix or matrix-vector) product `B @ x`, where `B` is the matrix inverse of the composed matrix represented by this decomposition.
 
@@ -684,6 +1057,11 @@ class DecompositionBase(metaclass=abc.ABCMeta):
         dtype : numpy.dtype
             Type to use in computation.
             optional, default: Determined by the method.
+        out : numpy.ndarray
+            Array with the shape of `x` and the data type of the result where the result is stored.
+            Together with the work buffer, which is reused by this decomposition, no array is
+            allocated for repeated products with dense matrices.
+            optional, default: A new array is returned.
 
         Returns
         -------
@@ -695,7 +1073,28 @@ class DecompositionBase(metaclass=abc.ABCMeta):
         matrix.errors.DecompositionSingularError
             If this is a decomposition representing a singular matrix.
         """
-        raise NotImplementedError
+
+        x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
+        self.check_invertible()
+        if self.native_factor is not None:
+            z = self._native_solve(x, dtype=dtype)
+            if out is None:
+                return z
+            out[...] = z.toarray() if scipy.sparse.issparse(z) else z
+            return out
+        self._check_factors_finite()
+
+        # permute into work buffer, solve in place and unpermute into result
+        if scipy.sparse.issparse(x):
+            x = x.toarray()
+        dtype = np.result_type(self._factor_dtype, x.dtype, np.float64 if dtype is None else dtype)
+        w = self._work_buffer(x.shape, dtype)
+        if x.dtype == dtype:
+            np.take(x, self.p, axis=0, out=w, mode='clip')
+        else:
+            w[...] = x[self.p]
+        w = self._solve_factors(w, dtype=dtype)
+        return np.take(w, self.p_inverse, axis=0, out=out, mode='clip')
 
     def inverse_matrix_both_sides_multiplication(self, x, y=None, dtype=None):
         """
@@ -726,12 +1125,26 @@ class DecompositionBase(metaclass=abc.ABCMeta):
         """
 
         x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
+        self.check_invertible()
+        if self.native_factor is not None:
+            if y is None:
+                y = x
+            else:
+                y = matrix.util.as_matrix_or_vector(y, dtype=dtype, copy=False)
+            y = matrix.util.conjugate_transpose(y)
+            return y @ self._native_solve(x, dtype=dtype)
+        self._check_factors_finite()
+        x = self._solve_factor(x[self.p], dtype=dtype)
         if y is None:
             y = x
         else:
             y = matrix.util.as_matrix_or_vector(y, dtype=dtype, copy=False)
+            y = self._solve_factor(y[self.p], dtype=dtype)
         y = matrix.util.conjugate_transpose(y)
-        return y @ self.inverse_matrix_right_side_multiplication(x, dtype=dtype)
+        d = self._factor_diagonal
+        if d is not None:
+            y = matrix.util.scale_columns(y, 1 / d)
+        return y @ x
 
     # *** solve systems of linear equations *** #
 
@@ -765,6 +1178,54 @@ class DecompositionBase(metaclass=abc.ABCMeta):
         # solve
         return self.inverse_matrix_right_side_multiplication(b, dtype=dtype)
 
+    # *** linear operators *** #
+
+    def as_linear_operator(self, dtype=None):
+        """
+        Returns the composed matrix represented by this decomposition as linear operator.
+
+        The products are calculated through the factors of this decomposition. Work buffers
+        are allocated for the first product with each number of columns and then reused.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype
+            The data type of the linear operator.
+            optional, default: The data type of the factors, at least float.
+
+        Returns
+        -------
+        scipy.sparse.linalg.LinearOperator
+            The composed matrix as linear operator. It supports `matvec`, `matmat`, `rmatvec`,
+            `rmatmat` and `adjoint`.
+        """
+
+        return _DecompositionLinearOperator(self, inverse=False, dtype=dtype)
+
+    def as_inverse_linear_operator(self, dtype=None):
+        """
+        Returns the matrix inverse of the composed matrix represented by this decomposition as linear operator.
+
+        The products are calculated by solving with the factors of this decomposition. Work
+        buffers are allocated for the first product with each number of columns and then reused.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype
+            The data type of the linear operator.
+            optional, default: The data type of the factors, at least float.
+
+        Returns
+        -------
+        scipy.sparse.linalg.LinearOperator
+            The matrix inverse as linear operator. It supports `matvec`, `matmat`, `rmatvec`,
+            `rmatmat` and `adjoint`. Its products raise a
+            :class:`matrix.errors.DecompositionSingularError` if this decomposition
+            represents a singular matrix.
+        """
+
+        return _DecompositionLinearOperator(self, inverse=True, dtype=dtype)
+
     # *** modify decompostion *** #
 
     @abc.abstractmethod
@@ -848,6 +1309,7 @@ class LDL_Decomposition(DecompositionBase):
                 del self._L
             except AttributeError:
                 pass
+        self._attributes_changed()
 
     @property
     def d(self):
@@ -866,20 +1328,18 @@ class LDL_Decomposition(DecompositionBase):
                 del self._d
             except AttributeError:
                 pass
+        self._attributes_changed()
 
     @property
     def D(self):
         """ :class:`scipy.sparse.dia_matrix`: The permutation matrix."""
-        return scipy.sparse.diags(self.d)
+        return self._cached('D', lambda: scipy.sparse.diags(self.d))
 
     @property
     def LD(self):
         """:class:`numpy.matrix` or :class:`scipy.sparse.spmatrix`: A matrix whose diagonal values are the diagonal values of `D` and whose off-diagonal values are those of `L`."""
-        LD = self.L.copy()
-        d = self.d
-        for i in range(self.n):
-            LD[i, i] = d[i]
-        return LD
+
+        return self._cached('LD', lambda: matrix.util.set_diagonal(self.L, self.d))
 
     # *** compare methods *** #
 
@@ -901,24 +1361,24 @@ class LDL_Decomposition(DecompositionBase):
         p = self.p
 
         # check d for negative entries
-        for i, d_i in enumerate(d):
-            if d_i < 0:
-                p_i = p[i]
-                raise matrix.errors.NoDecompositionPossibleWithProblematicSubdecompositionError(
-                    self, matrix.constants.LL_DECOMPOSITION_TYPE, p_i)
+        negative_indices = np.where(d < 0)[0]
+        if len(negative_indices) > 0:
+            p_i = p[negative_indices[0]]
+            raise matrix.errors.NoDecompositionPossibleWithProblematicSubdecompositionError(
+                self, matrix.constants.LL_DECOMPOSITION_TYPE, p_i)
 
         # compute new d
         d = np.sqrt(d)
 
         # compute new L
-        D = scipy.sparse.diags(d)
-        L = L @ D
+        L = matrix.util.scale_columns(L, d)
 
         # construct new decomposition
         return LL_Decomposition(L, p=p)
 
     def as_LDL_DecompositionCompressed(self):
-        return LDL_DecompositionCompressed(self.LD, p=self.p)
+        # the cached LD is read-only
+        return LDL_DecompositionCompressed(self.LD.copy(), p=self.p)
 
     def as_type(self, type_str, copy=False):
         try:
@@ -958,51 +1418,15 @@ class LDL_Decomposition(DecompositionBase):
 
     # *** multiply *** #
 
-    def matrix_right_side_multiplication(self, x, dtype=None):
-        x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
-        x = x[self.p]
-        x = matrix.util.conjugate_transpose(self.L) @ x
-        x = (self.d * x.transpose()).transpose()
-        x = self.L @ x
-        x = x[self.p_inverse]
-        return x
+    def _multiply_factor(self, x, conjugate_transpose=False, dtype=None):
+        return matrix.util.multiply_triangular(self.L, x, lower=True, unit_diagonal=True, conjugate_transpose=conjugate_transpose, overwrite_x=True, dtype=dtype)
 
-    def matrix_both_sides_multiplication(self, x, y=None, dtype=None):
-        x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
-        x = x[self.p]
-        x = matrix.util.conjugate_transpose(self.L) @ x
-        if y is not None:
-            y = matrix.util.as_matrix_or_vector(y, dtype=dtype, copy=False)
-            y = y[self.p]
-            y = matrix.util.conjugate_transpose(y)
-            y = y @ self.L
-        else:
-            y = matrix.util.conjugate_transpose(x)
-        return (y * self.d) @ x
+    def _solve_factor(self, x, conjugate_transpose=False, dtype=None):
+        return self._solve_triangular(self.L, x, unit_diagonal=True, conjugate_transpose=conjugate_transpose, dtype=dtype)
 
-    def inverse_matrix_right_side_multiplication(self, x, dtype=None):
-        x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
-        self.check_invertible()
-        x = x[self.p]
-        x = matrix.util.solve_triangular(self.L, x, lower=True, unit_diagonal=True, overwrite_b=True, dtype=dtype)
-        x = (x.transpose() / self.d).transpose()
-        x = matrix.util.solve_triangular(matrix.util.conjugate_transpose(self.L), x, lower=False, unit_diagonal=True, overwrite_b=True, dtype=dtype)
-        x = x[self.p_inverse]
-        return x
-
-    def inverse_matrix_both_sides_multiplication(self, x, y=None, dtype=None):
-        x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
-        self.check_invertible()
-        x = x[self.p]
-        x = matrix.util.solve_triangular(self.L, x, lower=True, unit_diagonal=True, overwrite_b=True, dtype=dtype)
-        if y is not None:
-            y = matrix.util.as_matrix_or_vector(y, dtype=dtype, copy=False)
-            y = y[self.p]
-            y = matrix.util.solve_triangular(self.L, y, lower=True, unit_diagonal=True, overwrite_b=True, dtype=dtype)
-        else:
-            y = x
-        y = matrix.util.conjugate_transpose(y)
-        return (y / self.d) @ x
+    @property
+    def _factor_diagonal(self):
+        return self.d
 
     def append_block_decomposition(self, dec):
         dec = self.as_same_type(dec, copy=False)
@@ -1067,32 +1491,33 @@ class LDL_DecompositionCompressed(DecompositionBase):
                 del self._LD
             except AttributeError:
                 pass
+        self._attributes_changed()
 
     @property
     def d(self):
         """:class:`numpy.ndarray`: The diagonal vector of the matrix `D` of the decomposition."""
-        LD = self.LD
-        if not self.is_sparse():
-            LD = np.asarray(LD)
-        d = LD.diagonal()
-        if np.iscomplexobj(d) and np.all(np.isreal(d)):
-            d = d.real
-        return d
+
+        def calculate_d():
+            LD = self.LD
+            if not self.is_sparse():
+                LD = np.asarray(LD)
+            d = LD.diagonal().copy()
+            if np.iscomplexobj(d) and np.all(np.isreal(d)):
+                d = d.real
+            return d
+
+        return self._cached('d', calculate_d)
 
     @property
     def D(self):
         """ :class:`scipy.sparse.dia_matrix`: The permutation matrix."""
-        return scipy.sparse.diags(self.d)
+        return self._cached('D', lambda: scipy.sparse.diags(self.d))
 
     @property
     def L(self):
         """:class:`numpy.matrix` or :class:`scipy.sparse.spmatrix`: The matrix `L` of the decomposition."""
-        L = self.LD.copy()
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore', scipy.sparse.SparseEfficiencyWarning)
-            for i in range(self.n):
-                L[i, i] = 1
-        return L
+
+        return self._cached('L', lambda: matrix.util.set_diagonal(self.LD, 1))
 
     # *** compare methods *** #
 
@@ -1107,7 +1532,8 @@ class LDL_DecompositionCompressed(DecompositionBase):
     # *** convert type *** #
 
     def as_LDL_Decomposition(self):
-        return LDL_Decomposition(self.L, self.d, p=self.p)
+        # the cached L and d are read-only
+        return LDL_Decomposition(self.L.copy(), self.d.copy(), p=self.p)
 
     def as_type(self, type_str, copy=False):
         try:
@@ -1147,17 +1573,18 @@ class LDL_DecompositionCompressed(DecompositionBase):
 
     # *** multiply *** #
 
-    def matrix_right_side_multiplication(self, x, dtype=None):
-        return self.as_LDL_Decomposition().matrix_right_side_multiplication(x, dtype=dtype)
+    # The matrix L is not created. The triangular multiplications and solves use the strict
+    # lower triangle of LD and treat its diagonal as ones.
 
-    def matrix_both_sides_multiplication(self, x, y=None, dtype=None):
-        return self.as_LDL_Decomposition().matrix_both_sides_multiplication(x, y=y, dtype=dtype)
+    def _multiply_factor(self, x, conjugate_transpose=False, dtype=None):
+        return matrix.util.multiply_triangular(self.LD, x, lower=True, unit_diagonal=True, conjugate_transpose=conjugate_transpose, overwrite_x=True, dtype=dtype)
 
-    def inverse_matrix_right_side_multiplication(self, x, dtype=None):
-        return self.as_LDL_Decomposition().inverse_matrix_right_side_multiplication(x, dtype=dtype)
+    def _solve_factor(self, x, conjugate_transpose=False, dtype=None):
+        return self._solve_triangular(self.LD, x, unit_diagonal=True, conjugate_transpose=conjugate_transpose, dtype=dtype)
 
-    def inverse_matrix_both_sides_multiplication(self, x, y=None, dtype=None):
-        return self.as_LDL_Decomposition().inverse_matrix_both_sides_multiplication(x, y=y, dtype=dtype)
+    @property
+    def _factor_diagonal(self):
+        return self.d
 
     def append_block_decomposition(self, dec):
         dec = self.as_same_type(dec, copy=False)
@@ -1221,6 +1648,7 @@ class LL_Decomposition(DecompositionBase):
                 del self._L
             except AttributeError:
                 pass
+        self._attributes_changed()
 
     # *** compare methods *** #
 
@@ -1237,13 +1665,17 @@ class LL_Decomposition(DecompositionBase):
     @property
     def _d(self):
         """:class:`numpy.ndarray`: The diagonal vector of `L`."""
-        L = self.L
-        if not self.is_sparse():
-            L = np.asarray(L)
-        d = L.diagonal()
-        if np.iscomplexobj(d) and np.all(np.isreal(d)):
-            d = d.real
-        return d
+
+        def calculate_d():
+            L = self.L
+            if not self.is_sparse():
+                L = np.asarray(L)
+            d = L.diagonal().copy()
+            if np.iscomplexobj(d) and np.all(np.isreal(d)):
+                d = d.real
+            return d
+
+        return self._cached('_d', calculate_d)
 
     def as_LDL_Decomposition(self):
         L = self.L
@@ -1255,27 +1687,24 @@ class LL_Decomposition(DecompositionBase):
         d_inverse = np.empty_like(d)
         d_inverse[d_zero_mask] = 0
         d_inverse[~d_zero_mask] = 1 / d[~d_zero_mask]
-        assert np.all(np.isfinite(d_inverse[np.isfinite(d)]))
+        assert not matrix.validation.is_paranoid() or np.all(np.isfinite(d_inverse[np.isfinite(d)]))
 
         # check entries where diagonal is zero
-        n = self.n
         if np.any(d_zero_mask):
-            for i in np.where(d_zero_mask)[0]:
-                for j in range(i + 1, n):
-                    if not np.isclose(L[j, i], 0):
-                        raise matrix.errors.NoDecompositionPossibleWithProblematicSubdecompositionError(
-                            self, matrix.constants.LDL_DECOMPOSITION_TYPE, p[i])
+            d_zero_indices = np.where(d_zero_mask)[0]
+            is_zero = matrix.util.is_zero_below_diagonal(L, d_zero_indices)
+            if not np.all(is_zero):
+                i = d_zero_indices[np.where(~is_zero)[0][0]]
+                raise matrix.errors.NoDecompositionPossibleWithProblematicSubdecompositionError(
+                    self, matrix.constants.LDL_DECOMPOSITION_TYPE, p[i])
 
         # compute new L
-        D_inverse = scipy.sparse.diags(d_inverse)
-        L = L @ D_inverse
+        L = matrix.util.scale_columns(L, d_inverse)
 
         # set all diagonal elements to one (due to rounding errors)
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore', scipy.sparse.SparseEfficiencyWarning)
-            for i in range(n):
-                assert np.isclose(L[i, i], 1) or d_zero_mask[i] or not np.isfinite(L[i, i])
-                L[i, i] = 1
+        L_diagonal = L.diagonal()
+        assert not matrix.validation.is_paranoid() or np.all(np.isclose(L_diagonal, 1) | d_zero_mask | ~np.isfinite(L_diagonal))
+        L = matrix.util.set_diagonal(L, 1, overwrite_A=True)
 
         # compute new d
         d = d * d.conj()
@@ -1321,49 +1750,16 @@ class LL_Decomposition(DecompositionBase):
 
     # *** multiply *** #
 
-    def matrix_right_side_multiplication(self, x, dtype=None):
-        x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
-        x = x[self.p]
-        x = matrix.util.conjugate_transpose(self.L) @ x
-        x = self.L @ x
-        x = x[self.p_inverse]
-        return x
+    def _multiply_factor(self, x, conjugate_transpose=False, dtype=None):
+        return matrix.util.multiply_triangular(self.L, x, lower=True, unit_diagonal=False, conjugate_transpose=conjugate_transpose, overwrite_x=True, dtype=dtype)
 
-    def matrix_both_sides_multiplication(self, x, y=None, dtype=None):
-        x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
-        x = x[self.p]
-        x = matrix.util.conjugate_transpose(self.L) @ x
-        if y is not None:
-            y = matrix.util.as_matrix_or_vector(y, dtype=dtype, copy=False)
-            y = y[self.p]
-            y = matrix.util.conjugate_transpose(y)
-            y = y @ self.L
-        else:
-            y = matrix.util.conjugate_transpose(x)
-        return y @ x
+    def _solve_factor(self, x, conjugate_transpose=False, dtype=None):
+        return self._solve_triangular(self.L, x, unit_diagonal=False, conjugate_transpose=conjugate_transpose, dtype=dtype)
 
-    def inverse_matrix_right_side_multiplication(self, x, dtype=None):
-        x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
-        self.check_invertible()
-        x = x[self.p]
-        x = matrix.util.solve_triangular(self.L, x, lower=True, unit_diagonal=False, overwrite_b=True, dtype=dtype)
-        x = matrix.util.solve_triangular(matrix.util.conjugate_transpose(self.L), x, lower=False, unit_diagonal=False, overwrite_b=True, dtype=dtype)
-        x = x[self.p_inverse]
-        return x
-
-    def inverse_matrix_both_sides_multiplication(self, x, y=None, dtype=None):
-        x = matrix.util.as_matrix_or_vector(x, dtype=dtype, copy=False)
-        self.check_invertible()
-        x = x[self.p]
-        x = matrix.util.solve_triangular(self.L, x, lower=True, unit_diagonal=False, overwrite_b=True, dtype=dtype)
-        if y is not None:
-            y = matrix.util.as_matrix_or_vector(y, dtype=dtype, copy=False)
-            y = y[self.p]
-            y = matrix.util.solve_triangular(self.L, y, lower=True, unit_diagonal=False, overwrite_b=True, dtype=dtype)
-        else:
-            y = x
-        y = matrix.util.conjugate_transpose(y)
-        return y @ x
+    def _solve_factors(self, x, conjugate_transpose=False, dtype=None):
+        if self.is_sparse():
+            return super()._solve_factors(x, conjugate_transpose=conjugate_transpose, dtype=dtype)
+        return matrix.util.solve_cholesky(self.L, x, overwrite_b=True, check_finite=False, dtype=dtype)
 
     def append_block_decomposition(self, dec):
         dec = self.as_same_type(dec, copy=False)
@@ -1375,6 +1771,66 @@ class LL_Decomposition(DecompositionBase):
 
 # functions handling decompositions
 
+class _DecompositionLinearOperator(scipy.sparse.linalg.LinearOperator):
+    """ The composed matrix represented by a decomposition or its matrix inverse as linear operator. """
+
+    def __init__(self, decomposition, inverse=False, dtype=None):
+        if dtype is None:
+            dtype = np.result_type(decomposition._factor_dtype, np.float64)
+        n = decomposition.n
+        super().__init__(dtype=np.dtype(dtype), shape=(n, n))
+        self.decomposition = decomposition
+        self.inverse = inverse
+
+    def _product(self, x, conjugate_transpose=False):
+        decomposition = self.decomposition
+        x = np.asarray(x)
+        dtype = np.result_type(self.dtype, x.dtype)
+
+        # native factors are only available for Hermitian matrices
+        if self.inverse:
+            decomposition.check_invertible()
+            if decomposition.native_factor is not None:
+                return decomposition._native_solve(x, dtype=dtype)
+            decomposition._check_factors_finite()
+
+        # permute into work buffer
+        w = decomposition._work_buffer(x.shape, dtype)
+        if x.dtype == dtype:
+            np.take(x, decomposition.p, axis=0, out=w, mode='clip')
+        else:
+            w[...] = x[decomposition.p]
+
+        # multiply or solve with factors
+        if self.inverse:
+            w = decomposition._solve_factors(w, conjugate_transpose=conjugate_transpose, dtype=dtype)
+        else:
+            d = decomposition._factor_diagonal
+            if d is not None:
+                d = d.reshape(-1, 1)
+                if conjugate_transpose:
+                    d = d.conj()
+            w = decomposition._multiply_factor(w, conjugate_transpose=True, dtype=dtype)
+            if d is not None:
+                w = np.multiply(w, d, out=w)
+            w = decomposition._multiply_factor(w, dtype=dtype)
+
+        # unpermute into result
+        return w[decomposition.p_inverse]
+
+    def _matvec(self, x):
+        return self._product(x.reshape(-1, 1))
+
+    def _matmat(self, x):
+        return self._product(x)
+
+    def _rmatvec(self, x):
+        return self._product(x.reshape(-1, 1), conjugate_transpose=True)
+
+    def _rmatmat(self, x):
+        return self._product(x, conjugate_transpose=True)
+
+
 def save(filename, decomposition):
     """ Saves a decomposition.
 
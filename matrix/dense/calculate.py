@@ -1,6 +1,9 @@
 import numpy as np
 import scipy.linalg.lapack
-import scipy.linalg.misc
+try:
+    from scipy.linalg._misc import _datacopied
+except ImportError:
+    from scipy.linalg.misc import _datacopied
 
 import matrix.constants
 import matrix.decompositions
@@ -68,7 +71,7 @@ def _decompose(A, permutation=None, return_type=None,
     # convert matrix to array
     A_original = A
     A = np.asanyarray(A_original)
-    overwrite_A = overwrite_A or scipy.linalg.misc._datacopied(A, A_original)
+    overwrite_A = overwrite_A or _datacopied(A, A_original)
     del A_original
 
     # check matrix A
@@ -115,6 +118,7 @@ def _decompose(A, permutation=None, return_type=None,
     if exit_code > 0:
         bad_index = exit_code - 1
         decomposition.L[bad_index, bad_index] = np.nan
+        decomposition.clear_cache()
         raise matrix.errors.NoDecompositionPossibleWithProblematicSubdecompositionError(
             A, matrix.constants.LL_DECOMPOSITION_TYPE, bad_index, decomposition)
     if exit_code < 0:
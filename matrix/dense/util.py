@@ -1,6 +1,10 @@
 import numpy as np
 import scipy.linalg
+import scipy.linalg.blas
+import scipy.linalg.lapack
+import scipy.sparse
 
+import matrix.dense.util
 import matrix.errors
 
 
@@ -21,9 +25,123 @@ def check_finite(A, check_finite=True):
         raise matrix.errors.MatrixNotFiniteError(A)
 
 
-def solve_triangular(A, b, lower=True, unit_diagonal=False, overwrite_b=False, check_finite=True, dtype=None):
+def set_diagonal(A, d, overwrite_A=False):
+    if not overwrite_A:
+        A = A.copy()
+    A[np.diag_indices(min(A.shape))] = d
+    return A
+
+
+def scale_columns(A, s, overwrite_A=False):
+    if overwrite_A and np.can_cast(np.result_type(A.dtype, s.dtype), A.dtype):
+        return np.multiply(A, s, out=A)
+    else:
+        return np.multiply(A, s)
+
+
+def is_zero_below_diagonal(A, columns):
+    columns = np.asarray(columns, dtype=np.int64)
+    A_columns = np.asarray(A)[:, columns]
+    below_diagonal = np.arange(A.shape[0]).reshape(-1, 1) > columns
+    return ~np.any(below_diagonal & ~np.isclose(A_columns, 0), axis=0)
+
+
+def swap_symmetric_lower(S, i, j):
+    # swaps symmetrically the positions i <= j of a Hermitian matrix whose strict lower
+    # triangle, restricted to the rows and columns greater or equal to i, is stored in S
+    if i != j:
+        assert i < j
+        S_i = S[i + 1:j, i].copy()
+        S[i + 1:j, i] = S[j, i + 1:j].conjugate()
+        S[j, i + 1:j] = S_i.conjugate()
+        S_i = S[j + 1:, i].copy()
+        S[j + 1:, i] = S[j + 1:, j]
+        S[j + 1:, j] = S_i
+        S[j, i] = np.conjugate(S[j, i])
+
+
+def _lapack_triangular_arguments(A, x, lower, conjugate_transpose, overwrite_x, dtype):
+    # A and x as Fortran contiguous arrays of dtype, A may be transposed with its opposite triangle
+    A = np.asarray(A, dtype=dtype)
+    x = np.asarray(x)
+    is_vector = x.ndim == 1
+    if is_vector:
+        x = x.reshape(-1, 1)
+    x = np.array(x, dtype=dtype, order='F', copy=not overwrite_x)
+    conjugate = False
+    if not A.flags.f_contiguous and A.flags.c_contiguous:
+        A = A.T
+        lower = not lower
+        if conjugate_transpose:
+            conjugate = np.iscomplexobj(A)
+            trans = 0
+        else:
+            trans = 1
+    else:
+        trans = 2 if conjugate_transpose else 0
+    if conjugate:
+        x = np.conjugate(x, out=x)
+    return A, x, lower, trans, conjugate, is_vector
+
+
+def _lapack_triangular_result(x, conjugate, is_vector):
+    if conjugate:
+        x = np.conjugate(x, out=x)
+    if is_vector:
+        x = x.reshape(-1)
+    return x
+
+
+def solve_triangular(A, b, lower=True, unit_diagonal=False, conjugate_transpose=False, overwrite_b=False, check_finite=True, dtype=None):
+    # only the triangle of A is used, its diagonal is assumed to be one if unit_diagonal
+    if scipy.sparse.issparse(b):
+        b = b.toarray()
+    if check_finite:
+        matrix.dense.util.check_finite(A)
+        matrix.dense.util.check_finite(b)
     if dtype is None:
-        dtype = np.float
+        dtype = np.float64
     dtype = np.result_type(A.dtype, b.dtype, dtype)
-    b = b.astype(dtype, copy=not overwrite_b)
-    return scipy.linalg.solve_triangular(A, b, lower=lower, unit_diagonal=unit_diagonal, overwrite_b=True, check_finite=check_finite)
+    A, x, lower, trans, conjugate, is_vector = _lapack_triangular_arguments(A, b, lower, conjugate_transpose, overwrite_b, dtype)
+    if A.shape[0] > 0:
+        trtrs = scipy.linalg.lapack.get_lapack_funcs('trtrs', (A, x))
+        x, info = trtrs(A, x, lower=lower, trans=trans, unitdiag=unit_diagonal, overwrite_b=True)
+        if info > 0:
+            raise np.linalg.LinAlgError(f'A is singular: {info - 1}-th diagonal value is zero.')
+        assert info == 0
+    return _lapack_triangular_result(x, conjugate, is_vector)
+
+
+def solve_cholesky(L, b, overwrite_b=False, check_finite=True, dtype=None):
+    # solves L L^H x = b, only the lower triangle of L is used
+    if scipy.sparse.issparse(b):
+        b = b.toarray()
+    if check_finite:
+        matrix.dense.util.check_finite(L)
+        matrix.dense.util.check_finite(b)
+    if dtype is None:
+        dtype = np.float64
+    dtype = np.result_type(L.dtype, b.dtype, dtype)
+    # the transposed factor of a C contiguous L is the upper factor of the conjugated matrix
+    L, x, lower, _, _, is_vector = _lapack_triangular_arguments(L, b, True, False, overwrite_b, dtype)
+    conjugate = not lower and np.iscomplexobj(L)
+    if conjugate:
+        x = np.conjugate(x, out=x)
+    if L.shape[0] > 0:
+        potrs = scipy.linalg.lapack.get_lapack_funcs('potrs', (L, x))
+        x, info = potrs(L, x, lower=lower, overwrite_b=True)
+        assert info == 0
+    return _lapack_triangular_result(x, conjugate, is_vector)
+
+
+def multiply_triangular(A, x, lower=True, unit_diagonal=False, conjugate_transpose=False, overwrite_x=False, dtype=None):
+    # only the triangle of A is used, its diagonal is assumed to be one if unit_diagonal
+    if dtype is None:
+        dtype = np.float64
+    dtype = np.result_type(A.dtype, x.dtype, dtype)
+    if scipy.sparse.issparse(x):
+        x = x.toarray()
+    A, x, lower, trans_a, conjugate, is_vector = _lapack_triangular_arguments(A, x, lower, conjugate_transpose, overwrite_x, dtype)
+    trmm = scipy.linalg.blas.get_blas_funcs('trmm', (A, x))
+    x = trmm(1, A, x, lower=lower, trans_a=trans_a, diag=unit_diagonal, overwrite_b=True)
+    return _lapack_triangular_result(x, conjugate, is_vector)
@@ -8,11 +8,139 @@ import matrix.permute
 import matrix.util
 import matrix.sparse.constants
 import matrix.sparse.permute
+import matrix.sparse.symbolic
 import matrix.sparse.util
+import matrix.validation
+
+
+def _apply_permutation(A, permutation):
+    """
+    Applies a permutation to a sparse matrix or determines the permutation method of CHOLMOD.
+
+    Parameters
+    ----------
+    A : scipy.sparse.spmatrix
+        The matrix that is supposed to be decomposed.
+    permutation : str or numpy.ndarray
+        The symmetric permutation method or a permutation vector.
+        See :func:`decompose`.
+
+    Returns
+    -------
+    A : scipy.sparse.spmatrix
+        `A` permuted by `p`.
+    p : numpy.ndarray or None
+        The permutation vector which has been applied to `A` or None.
+    permutation_method : str
+        The permutation method of CHOLMOD which has to be applied to the returned `A`.
+    """
+
+    if permutation is None:
+        permutation = matrix.constants.NO_PERMUTATION_METHOD
+
+    if isinstance(permutation, str):
+        # check passed permutation method
+        permutation_method = permutation.lower()
+        supported_permutation_methods = matrix.sparse.constants.PERMUTATION_METHODS
+        if permutation_method not in supported_permutation_methods:
+            raise ValueError(('Permutation method {} is unknown. '
+                              'Only the following methods are supported {}.'
+                              '').format(permutation_method, supported_permutation_methods))
+
+        # apply permutation
+        if permutation_method in matrix.constants.UNIVERSAL_PERMUTATION_METHODS:
+            if permutation_method == matrix.constants.NO_PERMUTATION_METHOD:
+                p = None
+            else:
+                p = matrix.permute.permutation_vector(A, permutation_method)
+                A = matrix.sparse.permute.symmetric(A, p)
+                A = A.tocsc()
+            permutation_method = matrix.sparse.constants.CHOLMOD_NO_PERMUTATION_METHOD
+        else:
+            assert permutation_method in matrix.sparse.constants.FILL_REDUCE_PERMUTATION_METHODS
+            assert permutation_method.startswith(
+                matrix.sparse.constants.FILL_REDUCE_PERMUTATION_METHOD_PREFIX)
+            prefix_len = len(matrix.sparse.constants.FILL_REDUCE_PERMUTATION_METHOD_PREFIX)
+            permutation_method = permutation_method[prefix_len:]
+            assert permutation_method in matrix.sparse.constants.CHOLMOD_PERMUTATION_METHODS
+            p = None
+    else:
+        # check permutation vector
+        p = np.asanyarray(permutation)
+        if p.ndim != 1 or p.shape[0] != A.shape[0]:
+            raise ValueError(('Permutation vactor must have same length as the dimensions of A. '
+                              'Its shape is {} and the shape of A is {}.'
+                              ).format(p.shape, A.shape))
+
+        # apply permutation vector
+        A = matrix.sparse.permute.symmetric(A, p)
+        A = A.tocsc()
+        permutation_method = matrix.sparse.constants.CHOLMOD_NO_PERMUTATION_METHOD
+
+    return A, p, permutation_method
+
+
+def _decomposition(A, f, p, cholmod_exception, return_type=None, keep_native_factor=False):
+    """
+    Makes a decomposition from a factor of CHOLMOD.
+
+    Parameters
+    ----------
+    A : scipy.sparse.csc_matrix
+        The matrix that has been decomposed by CHOLMOD.
+    f : sksparse.cholmod.Factor
+        The factor of `A`.
+    p : numpy.ndarray or None
+        The permutation vector which has been applied to `A` before CHOLMOD was called.
+        If it is None, the permutation vector of `f` is used.
+    cholmod_exception : sksparse.cholmod.CholmodNotPositiveDefiniteError or None
+        The exception raised by CHOLMOD or None.
+    return_type : str
+        The type of the decomposition that should be returned.
+        optional, default: the type of the decomposition is chosen by the function itself
+    keep_native_factor : bool
+        Whether `f` is kept in the returned decomposition.
+        optional, default: False
+
+    Returns
+    -------
+    matrix.decompositions.DecompositionBase
+        A decomposition of `A` of type `return_type`.
+
+    Raises
+    ------
+    matrix.errors.NoDecompositionPossibleWithProblematicSubdecompositionError
+        If `cholmod_exception` is not None.
+    """
+
+    # get correct permutation vector
+    if p is None:
+        p = f.P()
+        p_native_factor = None
+    else:
+        assert not matrix.validation.is_paranoid() or np.all(f.P() == np.arange(len(f.P())))
+        p_native_factor = p
+
+    # make docomposition
+    decomposition = matrix.decompositions.LDL_DecompositionCompressed(f.LD(), p=p)
+    if keep_native_factor and cholmod_exception is None:
+        decomposition._set_native_factor(f, p=p_native_factor)
+
+    # check exception
+    if cholmod_exception is not None:
+        bad_index = cholmod_exception.column
+        decomposition.LD[bad_index, bad_index] = np.nan
+        decomposition.clear_cache()
+        raise matrix.errors.NoDecompositionPossibleWithProblematicSubdecompositionError(
+            A, matrix.constants.LDL_DECOMPOSITION_COMPRESSED_TYPE, bad_index,
+            decomposition) from cholmod_exception
+
+    # return
+    return decomposition.as_type(return_type)
 
 
 def _decompose(A, permutation=None, return_type=None, check_finite=True,
-               overwrite_A=False, use_long=None):
+               overwrite_A=False, keep_native_factor=False, use_long=None):
     """
     Computes a decomposition of a sparse matrix.
 
@@ -43,6 +171,11 @@ def _decompose(A, permutation=None, return_type=None, check_finite=True,
         Whether it is allowed to overwrite `A`.
         Enabling may result in performance gain.
         optional, default: False
+    keep_native_factor : bool
+        Whether the factor object of CHOLMOD is kept in the returned decomposition
+        if it is of type :const:`matrix.constants.LDL_DECOMPOSITION_COMPRESSED_TYPE`.
+        It is then used to solve linear systems. This needs additional memory.
+        optional, default: False
     use_long: bool
         Specifies if the long type (64 bit) or the int type (32 bit)
         should be used for the indices of the sparse matrices.
@@ -72,46 +205,7 @@ def _decompose(A, permutation=None, return_type=None, check_finite=True,
     matrix.util.check_square_matrix(A)
 
     # check permutation and calculate permutation vector
-    if permutation is None:
-        permutation = matrix.constants.NO_PERMUTATION_METHOD
-
-    if isinstance(permutation, str):
-        # check passed permutation method
-        permutation_method = permutation.lower()
-        supported_permutation_methods = matrix.sparse.constants.PERMUTATION_METHODS
-        if permutation_method not in supported_permutation_methods:
-            raise ValueError(('Permutation method {} is unknown. '
-                              'Only the following methods are supported {}.'
-                              '').format(permutation_method, supported_permutation_methods))
-
-        # apply permutation
-        if permutation_method in matrix.constants.UNIVERSAL_PERMUTATION_METHODS:
-            if permutation_method == matrix.constants.NO_PERMUTATION_METHOD:
-                p = None
-            else:
-                p = matrix.permute.permutation_vector(A, permutation_method)
-                A = matrix.sparse.permute.symmetric(A, p)
-                A = A.tocsc()
-            permutation_method = matrix.sparse.constants.CHOLMOD_NO_PERMUTATION_METHOD
-        else:
-            assert permutation_method in matrix.sparse.constants.FILL_REDUCE_PERMUTATION_METHODS
-            assert permutation_method.startswith(
-                matrix.sparse.constants.FILL_REDUCE_PERMUTATION_METHOD_PREFIX)
-            prefix_len = len(matrix.sparse.constants.FILL_REDUCE_PERMUTATION_METHOD_PREFIX)
-            permutation_method = permutation_method[prefix_len:]
-            assert permutation_method in matrix.sparse.constants.CHOLMOD_PERMUTATION_METHODS
-    else:
-        # check permutation vector
-        p = np.asanyarray(permutation)
-        if p.ndim != 1 or p.shape[0] != A.shape[0]:
-            raise ValueError(('Permutation vactor must have same length as the dimensions of A. '
-                              'Its shape is {} and the shape of A is {}.'
-                              ).format(p.shape, A.shape))
-
-        # apply permutation vector
-        A = matrix.sparse.permute.symmetric(A, p)
-        A = A.tocsc()
-        permutation_method = matrix.sparse.constants.CHOLMOD_NO_PERMUTATION_METHOD
+    A, p, permutation_method = _apply_permutation(A, permutation)
 
     # check return type
     supported_return_type = matrix.sparse.constants.DECOMPOSITION_TYPES
@@ -141,28 +235,13 @@ def _decompose(A, permutation=None, return_type=None, check_finite=True,
     else:
         cholmod_exception = None
 
-    # get correct permutation vector
-    if permutation_method != matrix.sparse.constants.CHOLMOD_NO_PERMUTATION_METHOD:
-        p = f.P()
-    else:
-        assert np.all(f.P() == np.arange(len(f.P())))
-
     # make docomposition
-    decomposition = matrix.decompositions.LDL_DecompositionCompressed(f.LD(), p=p)
+    return _decomposition(A, f, p, cholmod_exception,
+                          return_type=return_type, keep_native_factor=keep_native_factor)
 
-    # check exception
-    if cholmod_exception is not None:
-        bad_index = cholmod_exception.column
-        decomposition.LD[bad_index, bad_index] = np.nan
-        raise matrix.errors.NoDecompositionPossibleWithProblematicSubdecompositionError(
-            A, matrix.constants.LDL_DECOMPOSITION_COMPRESSED_TYPE, bad_index,
-            decomposition) from cholmod_exception
-
-    # return
-    return decomposition.as_type(return_type)
 
-
-def decompose(A, permutation=None, return_type=None, check_finite=True, overwrite_A=False):
+def decompose(A, permutation=None, return_type=None, check_finite=True, overwrite_A=False,
+              keep_native_factor=False, symbolic=None):
     """
     Computes a decomposition of a sparse matrix.
 
@@ -193,6 +272,16 @@ def decompose(A, permutation=None, return_type=None, check_finite=True, overwrit
         Whether it is allowed to overwrite `A`.
         Enabling may result in performance gain.
         optional, default: False
+    keep_native_factor : bool
+        Whether the factor object of CHOLMOD is kept in the returned decomposition
+        if it is of type :const:`matrix.constants.LDL_DECOMPOSITION_COMPRESSED_TYPE`.
+        It is then used to solve linear systems. This needs additional memory.
+        optional, default: False
+    symbolic : matrix.sparse.symbolic.SymbolicDecomposition
+        A symbolic decomposition of a matrix with the same sparsity pattern as `A` as
+        returned by :func:`analyze`. If it is passed, its permutation is used and
+        `permutation` must not be passed.
+        optional, default: `A` is analyzed.
 
     Returns
     -------
@@ -208,13 +297,221 @@ def decompose(A, permutation=None, return_type=None, check_finite=True, overwrit
         If `A` is not a square matrix.
     matrix.errors.MatrixNotFiniteError
         If `A` is not a finite matrix and `check_finite` is True.
+    ValueError
+        If `symbolic` is not suitable for `A` or if `symbolic` and `permutation` are passed.
     """
 
+    if symbolic is not None:
+        if permutation is not None:
+            error = ValueError('Either a permutation or a symbolic decomposition can be passed, but not both.')
+            matrix.logger.error(error)
+            raise error
+        return refactor(symbolic, A, return_type=return_type, check_finite=check_finite,
+                        overwrite_A=overwrite_A, keep_native_factor=keep_native_factor)
+
     try:
         return _decompose(A, permutation=permutation, return_type=return_type,
-                          check_finite=check_finite, overwrite_A=overwrite_A, use_long=None)
+                          check_finite=check_finite, overwrite_A=overwrite_A,
+                          keep_native_factor=keep_native_factor, use_long=None)
     except matrix.errors.NoDecompositionPossibleTooManyEntriesError as e:
         matrix.logger.warning(('Problem to large for index type {}, '
                                'index type is switched to long.').format(e.matrix_index_type))
         return _decompose(A, permutation=permutation, return_type=return_type,
-                          check_finite=False, overwrite_A=overwrite_A, use_long=True)
+                          check_finite=False, overwrite_A=overwrite_A,
+                          keep_native_factor=keep_native_factor, use_long=True)
+
+
+def _analyze(A, permutation=None, use_long=None):
+    """
+    Computes a symbolic decomposition of a sparse matrix.
+
+    Parameters
+    ----------
+    A : scipy.sparse.spmatrix
+        Matrix to be analyzed.
+    permutation : str or numpy.ndarray
+        The symmetric permutation method that is applied to the matrix before
+        it is decomposed. See :func:`analyze`.
+        optional, default: no permutation
+    use_long: bool
+        Specifies if the long type (64 bit) or the int type (32 bit)
+        should be used for the indices of the sparse matrices.
+        If use_long is None try to estimate if long type is needed.
+        optional, default: None
+
+    Returns
+    -------
+    matrix.sparse.symbolic.SymbolicDecomposition
+        A symbolic decomposition of `A`.
+    """
+
+    # check matrix A
+    matrix.util.check_square_matrix(A)
+    n = A.shape[0]
+    pattern_hash = matrix.sparse.symbolic.pattern_hash(A)
+
+    # check permutation and calculate permutation vector
+    A, p, permutation_method = _apply_permutation(A, permutation)
+
+    # without CHOLMOD only the permutation vector is reused
+    try:
+        import sksparse.cholmod
+    except ImportError:
+        return matrix.sparse.symbolic.SymbolicDecomposition(n, pattern_hash, p=p)
+
+    # convert matrix A
+    A_old = A
+    A = matrix.sparse.util.convert_to_csc(A, sort_indices=True)
+    if use_long:
+        A = matrix.sparse.util.convert_index_dtype(A, np.int64, overwrite_A=A_old is not A)
+
+    # calculate symbolic decomposition
+    try:
+        f = sksparse.cholmod.analyze(A, ordering_method=permutation_method, use_long=use_long)
+    except sksparse.cholmod.CholmodTooLargeError as cholmod_exception:
+        raise matrix.errors.NoDecompositionPossibleTooManyEntriesError(
+            A, matrix.constants.LDL_DECOMPOSITION_COMPRESSED_TYPE) from cholmod_exception
+    native_analysis_is_permuted = p is not None
+    if p is None:
+        p = f.P()
+    return matrix.sparse.symbolic.SymbolicDecomposition(
+        n, pattern_hash, p=p, native_analysis=f,
+        native_analysis_is_permuted=native_analysis_is_permuted)
+
+
+def analyze(A, permutation=None):
+    """
+    Computes a symbolic decomposition of a sparse matrix.
+
+    The symbolic decomposition contains the permutation and, if scikit-sparse is installed,
+    the symbolic analysis of CHOLMOD. It can be used to decompose all matrices with the same
+    sparsity pattern with :func:`refactor` or :func:`decompose`.
+
+    Parameters
+    ----------
+    A : scipy.sparse.spmatrix
+        Matrix to be analyzed. Only its sparsity pattern is used, except for permutation
+        methods which depend on the diagonal values.
+        `A` must be Hermitian.
+    permutation : str or numpy.ndarray
+        The symmetric permutation method that is applied to the matrix before
+        it is decomposed. It has to be a value in
+        :const:`matrix.sparse.constants.PERMUTATION_METHODS`.
+        It is also possible to directly pass a permutation vector.
+        optional, default: no permutation
+
+    Returns
+    -------
+    matrix.sparse.symbolic.SymbolicDecomposition
+        A symbolic decomposition of `A`.
+
+    Raises
+    ------
+    matrix.errors.MatrixNotSquareError
+        If `A` is not a square matrix.
+    """
+
+    try:
+        return _analyze(A, permutation=permutation, use_long=None)
+    except matrix.errors.NoDecompositionPossibleTooManyEntriesError:
+        matrix.logger.warning('Problem to large for index type int, index type is switched to long.')
+        return _analyze(A, permutation=permutation, use_long=True)
+
+
+def refactor(symbolic, A, return_type=None, check_finite=True, overwrite_A=False,
+             keep_native_factor=False):
+    """
+    Computes a decomposition of a sparse matrix with a symbolic decomposition.
+
+    Only the numerical decomposition is calculated. The permutation and the symbolic
+    analysis of `symbolic` are reused.
+
+    Parameters
+    ----------
+    symbolic : matrix.sparse.symbolic.SymbolicDecomposition
+        A symbolic decomposition of a matrix with the same sparsity pattern as `A`
+        as returned by :func:`analyze`.
+    A : scipy.sparse.spmatrix
+        Matrix to be decomposed.
+        `A` must be Hermitian.
+    return_type : str
+        The type of the decomposition that should be calculated.
+        It has to be a value in :const:`matrix.constants.DECOMPOSITION_TYPES`.
+        If return_type is None the type of the returned decomposition is
+        chosen by the function itself.
+        optional, default: the type of the decomposition is chosen by the function itself
+    check_finite : bool
+        Whether to check that the input matrix contains only finite numbers.
+        Disabling may result in problems (crashes, non-termination)
+        if the inputs do contain infinities or NaNs.
+        Disabling gives a performance gain.
+        optional, default: True
+    overwrite_A : bool
+        Whether it is allowed to overwrite `A`.
+        Enabling may result in performance gain.
+        optional, default: False
+    keep_native_factor : bool
+        Whether the factor object of CHOLMOD is kept in the returned decomposition
+        if it is of type :const:`matrix.constants.LDL_DECOMPOSITION_COMPRESSED_TYPE`.
+        It is then used to solve linear systems. This needs additional memory.
+        optional, default: False
+
+    Returns
+    -------
+    matrix.decompositions.DecompositionBase
+        A decomposition of `A`. If `return_type` is not None, the decomposition
+        is of this type.
+
+    Raises
+    ------
+    matrix.errors.NoDecompositionPossibleError
+        If the decomposition of `A` is not possible.
+    matrix.errors.MatrixNotFiniteError
+        If `A` is not a finite matrix and `check_finite` is True.
+    ValueError
+        If the sparsity pattern of `A` does not match `symbolic`.
+    """
+
+    # check symbolic decomposition
+    if not symbolic.is_suitable(A):
+        error = ValueError('The sparsity pattern of the matrix with shape {} does not match the {}.'.format(A.shape, symbolic))
+        matrix.logger.error(error)
+        raise error
+
+    # without native analysis only the permutation vector is reused
+    if symbolic.native_analysis is None:
+        return decompose(A, permutation=symbolic.p, return_type=return_type,
+                         check_finite=check_finite, overwrite_A=overwrite_A,
+                         keep_native_factor=keep_native_factor)
+
+    import sksparse.cholmod
+
+    # check return type
+    supported_return_type = matrix.sparse.constants.DECOMPOSITION_TYPES
+    if return_type is not None and return_type not in supported_return_type:
+        raise ValueError(('Unkown decomposition type {}. Only values in {} are supported.'
+                          '').format(return_type, supported_return_type))
+
+    # convert matrix A
+    if symbolic.native_analysis_is_permuted:
+        p = symbolic.p
+        A = matrix.sparse.permute.symmetric(A, p)
+        A = A.tocsc()
+        overwrite_A = True
+    else:
+        p = None
+    A = matrix.sparse.util.convert_to_csc(A, sort_indices=True, overwrite_A=overwrite_A)
+    matrix.sparse.util.check_finite(A, check_finite)
+
+    # calculate numerical decomposition
+    try:
+        f = symbolic.native_analysis.cholesky(A)
+    except sksparse.cholmod.CholmodNotPositiveDefiniteError as e:
+        cholmod_exception = e
+        f = cholmod_exception.factor
+    else:
+        cholmod_exception = None
+
+    # make docomposition
+    return _decomposition(A, f, p, cholmod_exception,
+                          return_type=return_type, keep_native_factor=keep_native_factor)
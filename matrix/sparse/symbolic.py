@@ -0,0 +1,283 @@
+import hashlib
+
+import numpy as np
+import scipy.sparse
+import scipy.sparse.csgraph
+
+import matrix.permute
+
+
+class SymbolicDecomposition():
+    """ The symbolic analysis of the decomposition of a sparse matrix.
+
+    It is calculated by :func:`matrix.analyze` and it is used by :func:`matrix.decompose`
+    to decompose matrices with the same sparsity pattern without analyzing them again.
+    """
+
+    def __init__(self, n, pattern_hash, p=None, native_analysis=None, native_analysis_is_permuted=False):
+        """
+        Parameters
+        ----------
+        n : int
+            The dimension of the analyzed matrix.
+        pattern_hash : str
+            The hash of the sparsity pattern of the analyzed matrix as returned by :func:`pattern_hash`.
+        p : numpy.ndarray
+            The permutation vector of the decompositions.
+            optional, default: no permutation
+        native_analysis : object
+            The symbolic analysis of the library which decomposes the matrices,
+            e.g. a :class:`sksparse.cholmod.Factor`.
+            optional, default: Only the permutation vector is reused.
+        native_analysis_is_permuted : bool
+            Whether `native_analysis` is the analysis of the matrix permuted by `p`
+            instead of the analysis of the matrix itself.
+            optional, default: False
+        """
+
+        self.n = n
+        self.pattern_hash = pattern_hash
+        self.p = p
+        self.native_analysis = native_analysis
+        self.native_analysis_is_permuted = native_analysis_is_permuted
+
+    def __str__(self):
+        return 'symbolic decomposition of matrix with shape ({n}, {n})'.format(n=self.n)
+
+    def is_suitable(self, A):
+        """
+        Whether this symbolic decomposition can be used to decompose the passed matrix.
+
+        Parameters
+        ----------
+        A : scipy.sparse.spmatrix
+            A square matrix.
+
+        Returns
+        -------
+        bool
+            Whether `A` has the same shape and sparsity pattern as the analyzed matrix.
+        """
+
+        return A.shape == (self.n, self.n) and pattern_hash(A) == self.pattern_hash
+
+
+def pattern_hash(A):
+    """
+    Computes a hash of the sparsity pattern of a matrix.
+
+    Parameters
+    ----------
+    A : scipy.sparse.spmatrix
+        A matrix. Explicitly stored zeros belong to its pattern.
+
+    Returns
+    -------
+    str
+        The hash of the shape and the positions of the stored entries of `A`.
+    """
+
+    A = scipy.sparse.csc_matrix(A)
+    if not A.has_canonical_format:
+        A = A.copy()
+        A.sum_duplicates()
+    h = hashlib.sha256()
+    h.update(np.asarray(A.shape, dtype=np.int64).tobytes())
+    h.update(A.indptr.astype(np.int64, copy=False).tobytes())
+    h.update(A.indices.astype(np.int64, copy=False).tobytes())
+    return h.hexdigest()
+
+
+def _symmetric_pattern(A, p=None):
+    """
+    Returns the symmetric pattern of the (symmetrically permuted) matrix `A` as a CSC matrix.
+
+    Parameters
+    ----------
+    A : scipy.sparse.spmatrix
+        A square matrix. Only its nonzero pattern is used.
+    p : numpy.ndarray
+        A permutation vector. The `i`-th row and column of the returned pattern belong to
+        the `p[i]`-th row and column of `A`.
+        optional, default: No permutation is applied.
+
+    Returns
+    -------
+    scipy.sparse.csc_matrix
+        The pattern of `A + A^T` (permuted by `p`) with sorted indices and values equal to one.
+    """
+
+    A = scipy.sparse.coo_matrix(A)
+    row = A.row
+    col = A.col
+    if p is not None:
+        q = matrix.permute.invert_permutation_vector(np.asarray(p))
+        row = q[row]
+        col = q[col]
+    n = A.shape[0]
+    data = np.ones(2 * len(row), dtype=np.int8)
+    C = scipy.sparse.csc_matrix((data, (np.concatenate((row, col)), np.concatenate((col, row)))),
+                                shape=(n, n))
+    C.sum_duplicates()
+    C.sort_indices()
+    return C
+
+
+def elimination_tree(A, p=None):
+    """
+    Computes the elimination tree of a symmetric matrix.
+
+    The elimination tree is the tree of the column dependencies of the Cholesky factor `L`
+    of the (symmetrically permuted) matrix `A` if no numerical cancellation occurs.
+    The parent of the `j`-th column is the row index of the first off-diagonal nonzero
+    entry in the `j`-th column of `L`.
+
+    Parameters
+    ----------
+    A : scipy.sparse.spmatrix
+        A square matrix. Only the nonzero pattern of `A + A^T` is used.
+    p : numpy.ndarray
+        A permutation vector which is applied symmetrically to `A`.
+        optional, default: No permutation is applied.
+
+    Returns
+    -------
+    numpy.ndarray
+        The parent of each column or -1 for roots.
+    """
+
+    C = _symmetric_pattern(A, p=p)
+    n = C.shape[0]
+    indptr = C.indptr.tolist()
+    indices = C.indices.tolist()
+
+    parent = [-1] * n
+    ancestor = [-1] * n
+    for k in range(n):
+        for i in indices[indptr[k]:indptr[k + 1]]:
+            # traverse from i to the root of its subtree with path compression
+            while i != -1 and i < k:
+                i_next = ancestor[i]
+                ancestor[i] = k
+                if i_next == -1:
+                    parent[i] = k
+                i = i_next
+    return np.array(parent, dtype=np.int64)
+
+
+def postorder(parent):
+    """
+    Computes a postorder of a forest.
+
+    Parameters
+    ----------
+    parent : numpy.ndarray
+        The parent of each node or -1 for roots.
+
+    Returns
+    -------
+    numpy.ndarray
+        The nodes in postorder. Each node is preceded by all its descendants and
+        the descendants of each node are contiguous.
+    """
+
+    # the reverse of a preorder is a postorder, all roots are children of an additional node
+    parent = np.asarray(parent)
+    n = len(parent)
+    children = np.arange(n)
+    parents = np.where(parent >= 0, parent, n)
+    forest = scipy.sparse.csr_matrix((np.ones(n, dtype=np.int8), (parents, children)),
+                                     shape=(n + 1, n + 1))
+    preorder = scipy.sparse.csgraph.depth_first_order(forest, n, directed=True,
+                                                      return_predecessors=False)
+    return preorder[:0:-1].astype(np.int64)
+
+
+def column_counts(A, parent=None, post=None, p=None):
+    """
+    Computes the number of nonzero entries in each column of the Cholesky factor of a symmetric matrix.
+
+    The counts are upper bounds for each column of the factor `L` of an :math:`LL^H` or
+    :math:`LDL^H` decomposition of the (symmetrically permuted) matrix `A`. They are exact
+    if no numerical cancellation occurs. The diagonal entries are included.
+
+    Parameters
+    ----------
+    A : scipy.sparse.spmatrix
+        A square matrix. Only the nonzero pattern of `A + A^T` is used.
+    parent : numpy.ndarray
+        The elimination tree of `A` as returned by :func:`elimination_tree`.
+        optional, default: It is computed.
+    post : numpy.ndarray
+        A postorder of the elimination tree as returned by :func:`postorder`.
+        optional, default: It is computed.
+    p : numpy.ndarray
+        A permutation vector which is applied symmetrically to `A`.
+        optional, default: No permutation is applied.
+
+    Returns
+    -------
+    numpy.ndarray
+        The number of nonzero entries in each column of `L`.
+    """
+
+    # This is the algorithm of Gilbert, Ng and Peyton based on row subtrees and skeleton
+    # matrices as it is implemented in CSparse by Timothy A. Davis.
+
+    C = _symmetric_pattern(A, p=p)
+    n = C.shape[0]
+    if parent is None:
+        parent = elimination_tree(C)
+    if post is None:
+        post = postorder(parent)
+    indptr = C.indptr.tolist()
+    indices = C.indices.tolist()
+    parent = np.asarray(parent).tolist()
+    post = np.asarray(post).tolist()
+
+    # find first descendant of each node and mark leaves
+    first = [-1] * n
+    delta = [0] * n
+    for k in range(n):
+        j = post[k]
+        delta[j] = 1 if first[j] == -1 else 0
+        while j != -1 and first[j] == -1:
+            first[j] = k
+            j = parent[j]
+
+    # count entries of each row subtree
+    ancestor = list(range(n))
+    max_first = [-1] * n
+    previous_leaf = [-1] * n
+    for k in range(n):
+        j = post[k]
+        if parent[j] != -1:
+            delta[parent[j]] -= 1
+        first_j = first[j]
+        for i in indices[indptr[j]:indptr[j + 1]]:
+            # check if j is a leaf of the i-th row subtree
+            if i > j and first_j > max_first[i]:
+                max_first[i] = first_j
+                j_previous = previous_leaf[i]
+                previous_leaf[i] = j
+                delta[j] += 1
+                if j_previous != -1:
+                    # find least common ancestor of j and previous leaf with path compression
+                    q = j_previous
+                    while q != ancestor[q]:
+                        q = ancestor[q]
+                    s = j_previous
+                    while s != q:
+                        s_parent = ancestor[s]
+                        ancestor[s] = q
+                        s = s_parent
+                    delta[q] -= 1
+        if parent[j] != -1:
+            ancestor[j] = parent[j]
+
+    # sum up deltas
+    counts = delta
+    for j in post:
+        if parent[j] != -1:
+            counts[parent[j]] += counts[j]
+    return np.array(counts, dtype=np.int64)
@@ -1,3 +1,4 @@
+import concurrent.futures
 import warnings
 
 import numpy as np
@@ -111,19 +112,216 @@ def convert_index_dtype(A, dtype, overwrite_A=False):
     return A
 
 
-def solve_triangular(A, b, lower=True, overwrite_b=False, check_finite=True, dtype=None):
+def set_diagonal(A, d, overwrite_A=False):
+    if not overwrite_A:
+        A = A.copy()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', scipy.sparse.SparseEfficiencyWarning)
+        A.setdiag(d)
+    return A
+
+
+def _compressed_slices(A):
+    # returns the slice index of each stored entry of a CSC or CSR matrix
+    return np.repeat(np.arange(len(A.indptr) - 1, dtype=A.indices.dtype), np.diff(A.indptr))
+
+
+def scale_columns(A, s, overwrite_A=False):
+    if A.format not in ('csc', 'csr'):
+        A = A.tocsc()
+        overwrite_A = True
+    if A.format == 'csc':
+        data = A.data * np.repeat(s, np.diff(A.indptr))
+    else:
+        data = A.data * s[A.indices]
+    if overwrite_A:
+        indices = A.indices
+        indptr = A.indptr
+    else:
+        indices = A.indices.copy()
+        indptr = A.indptr.copy()
+    return type(A)((data, indices, indptr), shape=A.shape)
+
+
+def is_zero_below_diagonal(A, columns):
+    columns = np.asarray(columns, dtype=np.int64)
+    if A.format not in ('csc', 'csr'):
+        A = A.tocsc()
+    slices = _compressed_slices(A)
+    rows, entry_columns = (A.indices, slices) if A.format == 'csc' else (slices, A.indices)
+    mask = rows > entry_columns
+    mask &= ~np.isclose(A.data, 0)
+    return ~np.isin(columns, entry_columns[mask])
+
+
+def triangular_solve_factor(A, lower=True, unit_diagonal=False, conjugate_transpose=False):
+    # returns the strict triangle of the (conjugate transposed) matrix A as CSR matrix with
+    # sorted indices and its diagonal (None if unit_diagonal), only the triangle of A is used
+    if conjugate_transpose:
+        A = A.conj().transpose()
+        lower = not lower
+    A = A.tocsr()
+    if unit_diagonal:
+        diagonal = None
+    else:
+        diagonal = A.diagonal()
+        zero_diagonal_indices = np.where(diagonal == 0)[0]
+        if len(zero_diagonal_indices) > 0:
+            raise np.linalg.LinAlgError(f'A is singular: {zero_diagonal_indices[0]}-th diagonal value is zero.')
+    if lower:
+        T = scipy.sparse.tril(A, k=-1, format='csr')
+    else:
+        T = scipy.sparse.triu(A, k=1, format='csr')
+    T.sum_duplicates()
+    T.sort_indices()
+    return T, diagonal
+
+
+def triangular_solve_levels(T, lower=True, min_rows_per_level=4):
+    # returns the rows of the strict triangle T as returned by triangular_solve_factor ordered by
+    # their dependency levels, the start of each level in this order and T with rows in this order,
+    # rows of the same level depend only on rows of lower levels, rows of level zero on no rows,
+    # None is returned if the levels have on average less than min_rows_per_level rows
+    # since then solving row by row is faster
+    n = T.shape[0]
+    max_number_of_levels = n / min_rows_per_level
+
+    # rows depending on their neighbour row form a chain whose length bounds the number of levels
+    # from below, this detects banded factors without calculating their levels
+    depends_on_neighbour = np.concatenate(([False], T.diagonal(-1 if lower else 1) != 0, [False]))
+    chain_bounds = np.flatnonzero(np.diff(depends_on_neighbour.astype(np.int8)))
+    if len(chain_bounds) > 0 and np.max(chain_bounds[1::2] - chain_bounds[::2]) + 1 > max_number_of_levels:
+        return None
+
+    # remove levels frontier by frontier
+    number_of_dependencies = np.diff(T.indptr)
+    dependents = T.tocsc()
+    dependents_indptr = dependents.indptr
+    dependents_indices = dependents.indices
+    levels = []
+    level = np.flatnonzero(number_of_dependencies == 0)
+    while len(level) > 0:
+        if len(levels) >= max_number_of_levels:
+            return None
+        levels.append(level)
+        starts = dependents_indptr[level]
+        lengths = dependents_indptr[level + 1] - starts
+        positions = (np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+                     + np.arange(lengths.sum()))
+        rows, counts = np.unique(dependents_indices[positions], return_counts=True)
+        number_of_dependencies[rows] -= counts
+        level = rows[number_of_dependencies[rows] == 0]
+    assert sum(len(level) for level in levels) == n
+
+    order = np.concatenate(levels).astype(np.int64) if n > 0 else np.zeros(0, dtype=np.int64)
+    level_indptr = np.concatenate(([0], np.cumsum([len(level) for level in levels], dtype=np.int64))).astype(np.int64)
+    return order, level_indptr, T[order]
+
+
+def _solve_triangular_rows(T, diagonal, x, lower):
+    n = T.shape[0]
+    indptr = T.indptr.tolist()
+    indices = T.indices
+    data = T.data
+    for i in (range(n) if lower else range(n - 1, -1, -1)):
+        start = indptr[i]
+        stop = indptr[i + 1]
+        if stop > start:
+            x[i] -= data[start:stop] @ x[indices[start:stop]]
+        if diagonal is not None:
+            x[i] /= diagonal[i]
+
+
+def _solve_triangular_levels(levels, diagonal, x):
+    # all rows of a level are solved at once
+    order, level_indptr, T = levels
+    indptr = T.indptr
+    indices = T.indices
+    data = T.data
+    if x.ndim > 1:
+        data = data.reshape(-1, 1)
+        if diagonal is not None:
+            diagonal = diagonal.reshape(-1, 1)
+    level_indptr = level_indptr.tolist()
+    for first, last in zip(level_indptr[:-1], level_indptr[1:]):
+        rows = order[first:last]
+        start = indptr[first]
+        stop = indptr[last]
+        if stop > start:
+            products = data[start:stop] * x[indices[start:stop]]
+            x[rows] -= np.add.reduceat(products, indptr[first:last] - start, axis=0)
+        if diagonal is not None:
+            x[rows] /= diagonal[rows]
+
+
+def solve_triangular_factor(T, diagonal, b, lower=True, overwrite_b=False, dtype=None, levels=None, number_of_threads=1):
+    # solves (T + D) x = b with T and D as returned by triangular_solve_factor,
+    # all columns of b are solved in one pass over the rows of T or over the levels
+    # as returned by triangular_solve_levels, blocks of columns are solved in parallel threads
+    if is_sparse(b):
+        b = b.toarray()
+    if dtype is None:
+        dtype = np.float64
+    dtype = np.result_type(T.dtype, b.dtype, dtype)
+    x = b.astype(dtype, copy=not overwrite_b)
+
+    def solve(x):
+        if levels is None:
+            _solve_triangular_rows(T, diagonal, x, lower)
+        else:
+            _solve_triangular_levels(levels, diagonal, x)
+
+    if number_of_threads > 1 and x.ndim > 1 and x.shape[1] > 1:
+        column_blocks = np.array_split(np.arange(x.shape[1]), min(number_of_threads, x.shape[1]))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(column_blocks)) as executor:
+            # views of contiguous columns are solved in place, exceptions are raised by list
+            list(executor.map(lambda columns: solve(x[:, columns[0]:columns[-1] + 1]), column_blocks))
+    else:
+        solve(x)
+    return x
+
+
+def solve_triangular(A, b, lower=True, unit_diagonal=False, conjugate_transpose=False, overwrite_b=False, check_finite=True, dtype=None):
     if check_finite:
         matrix.sparse.util.check_finite(A)
         if is_sparse(b):
             matrix.sparse.util.check_finite(b)
         else:
             matrix.dense.util.check_finite(b)
-    A = A.tocsr(copy=True)
+    T, diagonal = triangular_solve_factor(A, lower=lower, unit_diagonal=unit_diagonal, conjugate_transpose=conjugate_transpose)
+    return solve_triangular_factor(T, diagonal, b, lower=lower != conjugate_transpose, overwrite_b=overwrite_b, dtype=dtype)
+
+
+def solve_cholesky(L, b, overwrite_b=False, check_finite=True, dtype=None):
+    # solves L L^H x = b, only the lower triangle of L is used
+    x = solve_triangular(L, b, lower=True, overwrite_b=overwrite_b, check_finite=check_finite, dtype=dtype)
+    return solve_triangular(L, x, lower=True, conjugate_transpose=True, overwrite_b=True, check_finite=False, dtype=dtype)
+
+
+def multiply_triangular(A, x, lower=True, unit_diagonal=False, conjugate_transpose=False, overwrite_x=False, dtype=None):
+    # only the triangle of A is used, its diagonal is assumed to be one if unit_diagonal
     if dtype is None:
-        dtype = np.float
-    dtype = np.result_type(A.dtype, b.dtype, dtype)
-    b = b.astype(dtype, copy=not overwrite_b)
-    return scipy.sparse.linalg.spsolve_triangular(A, b, lower=lower, overwrite_A=True, overwrite_b=True)
+        dtype = np.float64
+    dtype = np.result_type(A.dtype, x.dtype, dtype)
+    if A.format not in ('csc', 'csr'):
+        A = A.tocsc()
+
+    # mask entries outside of the triangle without changing the sparsity structure
+    slices = _compressed_slices(A)
+    rows, columns = (A.indices, slices) if A.format == 'csc' else (slices, A.indices)
+    mask = rows > columns if lower else rows < columns
+    if not unit_diagonal:
+        mask |= rows == columns
+    data = np.where(mask, A.data, 0).astype(dtype, copy=False)
+    T = type(A)((data, A.indices, A.indptr), shape=A.shape)
+    if conjugate_transpose:
+        T = T.conj().T
+
+    # multiply
+    y = T @ x
+    if unit_diagonal:
+        y = y + x
+    return y.astype(dtype, copy=False)
 
 
 def compressed_matrix_indices(A, i, A_i_start_index=None, A_i_stop_index=None, A_ii_index=None, A_ii=None):
@@ -122,6 +122,38 @@ def test_dense_equals_sparse(n, complex_values, permutation, min_diag_B, max_dia
     assert decomposition_sparse.is_almost_equal(decomposition_dense)
 
 
+test_sparse_formats_setups = [
+    (n, complex_values, permutation, min_diag_D, matrix_format)
+    for n in (10,)
+    for complex_values in (True, False)
+    for min_diag_D in (None, 0, 1)
+    for matrix_format in ('csr', 'coo', 'lil', 'dok')
+    for permutation in (supported_permutation_methods(False, min_diag_D)
+                        + (matrix.tests.random.permutation_vector(n),))
+]
+
+
+@pytest.mark.parametrize('n, complex_values, permutation, min_diag_D, matrix_format',
+                         test_sparse_formats_setups)
+def test_sparse_formats(n, complex_values, permutation, min_diag_D, matrix_format):
+    # create random hermitian matrix
+    A = matrix.tests.random.hermitian_matrix(n, dense=False, complex_values=complex_values) * 10
+    A = A.tocsc(copy=False)
+
+    # approximate decompositions
+    decomposition = matrix.approximation.positive_semidefinite.decomposition(
+        A, permutation=permutation, min_diag_D=min_diag_D)
+    decomposition_other_format = matrix.approximation.positive_semidefinite.decomposition(
+        A.asformat(matrix_format), permutation=permutation, min_diag_D=min_diag_D)
+
+    # check L
+    for L in (decomposition.L, decomposition_other_format.L):
+        assert L.format == 'csc'
+        assert L.has_sorted_indices
+        assert np.all(L.data != 0)
+    assert decomposition.is_almost_equal(decomposition_other_format)
+
+
 test_decomposition_equals_matrix_setups = [
     (n, dense, complex_values, permutation, min_diag_B, max_diag_B, min_diag_D, max_diag_D)
     for n in (10,)
@@ -278,6 +310,194 @@ def test_infinite_alpha_square():
     matrix.approximation.positive_semidefinite.decomposition(A, permutation='none')
 
 
+test_working_dtype_setups = [
+    (n, dense, complex_values, permutation, min_diag_B, max_diag_B, working_dtype)
+    for n in (10,)
+    for dense in (True, False)
+    for complex_values in (True, False)
+    for min_diag_B in (None, 1)
+    for max_diag_B in (None, np.arange(n) + 1)
+    for working_dtype in (np.float32, np.float64)
+    for permutation in (supported_permutation_methods(dense, 1)
+                        + (matrix.tests.random.permutation_vector(n),))
+]
+
+
+@pytest.mark.parametrize(('n, dense, complex_values, permutation, min_diag_B, max_diag_B,'
+                          'working_dtype'),
+                         test_working_dtype_setups)
+def test_working_dtype(n, dense, complex_values, permutation, min_diag_B, max_diag_B,
+                       working_dtype):
+    # create random hermitian matrix
+    A = matrix.tests.random.hermitian_matrix(n, dense=dense, complex_values=complex_values) * 10
+
+    # approximate decompositions with default and with passed working dtype
+    decompositions = []
+    for working_dtype_i in (None, working_dtype):
+        decomposition = matrix.approximation.positive_semidefinite.decomposition(
+            A, permutation=permutation, min_diag_B=min_diag_B, max_diag_B=max_diag_B,
+            min_diag_D=1, min_abs_value_D=0.01, working_dtype=working_dtype_i)
+        decompositions.append(decomposition)
+
+    # check if decompositions are the same
+    rtol = max(np.finfo(working_dtype).eps**0.5, 1e-04)
+    atol = rtol * 10
+    assert decompositions[1].d.dtype == np.float64
+    assert decompositions[0].is_almost_equal(decompositions[1], rtol=rtol, atol=atol)
+    assert np.allclose(decompositions[0].omega, decompositions[1].omega, rtol=rtol, atol=atol)
+    assert np.allclose(decompositions[0].delta, decompositions[1].delta, rtol=rtol, atol=atol)
+
+    # check approximation matrix
+    B = matrix.approximation.positive_semidefinite.positive_semidefinite_matrix(
+        A, permutation=permutation, min_diag_B=min_diag_B, max_diag_B=max_diag_B,
+        min_diag_D=1, min_abs_value_D=0.01, working_dtype=working_dtype)
+    assert matrix.util.is_almost_equal(B, decompositions[1].composed_matrix, rtol=rtol, atol=atol)
+
+
+@pytest.mark.parametrize('working_dtype', (np.float32, np.float64))
+def test_working_dtype_overflow(working_dtype):
+    m = np.finfo(np.float64).max
+    a = np.sqrt(m)
+    A = np.array([[1, a / 10], [-a / 10, m / 100]])
+    expected_decomposition = matrix.approximation.positive_semidefinite.decomposition(
+        A, permutation='none')
+    trace = matrix.approximation.positive_semidefinite.Trace()
+    decomposition = matrix.approximation.positive_semidefinite.decomposition(
+        A, permutation='none', working_dtype=working_dtype, trace=trace)
+    assert decomposition.d.dtype == expected_decomposition.d.dtype
+    assert decomposition.is_almost_equal(expected_decomposition)
+    assert np.all(trace.records().iteration == np.arange(2))
+
+
+@pytest.mark.parametrize('working_dtype', (np.int64, np.complex128, 'no_dtype'))
+def test_working_dtype_invalid(working_dtype):
+    A = matrix.tests.random.hermitian_matrix(3)
+    with pytest.raises(ValueError):
+        matrix.approximation.positive_semidefinite.decomposition(A, working_dtype=working_dtype)
+
+
+test_check_positive_definite_setups = [
+    (n, dense, complex_values, positive_definite, permutation, min_diag_B, max_diag_B, min_diag_D)
+    for n in (10,)
+    for dense in (True, False)
+    for complex_values in (True, False)
+    for positive_definite in (True, False)
+    for min_diag_B in (None, 1)
+    for max_diag_B in (None, 10)
+    for min_diag_D in (None, 0.5)
+    for permutation in (matrix.constants.NO_PERMUTATION_METHOD,
+                        matrix.tests.random.permutation_vector(n))
+]
+
+
+@pytest.mark.parametrize(('n, dense, complex_values, positive_definite, permutation, '
+                          'min_diag_B, max_diag_B, min_diag_D'),
+                         test_check_positive_definite_setups)
+def test_check_positive_definite(n, dense, complex_values, positive_definite, permutation,
+                                 min_diag_B, max_diag_B, min_diag_D):
+    # create random hermitian matrix
+    A = matrix.tests.random.hermitian_matrix(n, dense=dense, complex_values=complex_values,
+                                             invertible=positive_definite)
+
+    # approximate decompositions with and without check
+    decompositions = []
+    for check_positive_definite in (False, True):
+        decomposition = matrix.approximation.positive_semidefinite.decomposition(
+            A, permutation=permutation, min_diag_B=min_diag_B, max_diag_B=max_diag_B,
+            min_diag_D=min_diag_D, check_positive_definite=check_positive_definite)
+        decompositions.append(decomposition)
+
+    # check if decompositions are the same
+    assert decompositions[0].is_almost_equal(decompositions[1])
+    assert np.allclose(decompositions[0].omega, decompositions[1].omega)
+    assert np.allclose(decompositions[0].delta, decompositions[1].delta)
+
+    # check approximation matrix
+    B = matrix.approximation.positive_semidefinite.positive_semidefinite_matrix(
+        A, permutation=permutation, min_diag_B=min_diag_B, max_diag_B=max_diag_B,
+        min_diag_D=min_diag_D, check_positive_definite=True)
+    assert matrix.util.is_almost_equal(B, decompositions[1].composed_matrix)
+
+
+@pytest.mark.parametrize('dense', (True, False))
+def test_check_positive_definite_unchanged(dense):
+    n = 10
+    A = np.diag(np.arange(n) + 1.0) + np.eye(n, k=1) * 0.1 + np.eye(n, k=-1) * 0.1
+    if not dense:
+        A = scipy.sparse.csc_matrix(A)
+    decomposition = matrix.approximation.positive_semidefinite.decomposition(
+        A, permutation=matrix.constants.NO_PERMUTATION_METHOD, min_diag_D=0.5,
+        check_positive_definite=True)
+    assert np.allclose(decomposition.omega, 1)
+    assert np.allclose(decomposition.delta, 0)
+    assert matrix.util.is_almost_equal(decomposition.composed_matrix, A)
+    B = matrix.approximation.positive_semidefinite.positive_semidefinite_matrix(
+        A, permutation=matrix.constants.NO_PERMUTATION_METHOD, min_diag_D=0.5,
+        check_positive_definite=True)
+    assert matrix.util.is_almost_equal(B, A)
+
+
+@pytest.mark.parametrize('dense', (True, False))
+def test_check_positive_definite_vector_bounds(dense):
+    A = np.array([[10, 2.5], [2.5, 1]])
+    if not dense:
+        A = scipy.sparse.csc_matrix(A)
+    permutation = np.array([1, 0])
+    max_diag_B = np.array([10, 1])
+    decompositions = [matrix.approximation.positive_semidefinite.decomposition(
+        A, permutation=permutation, max_diag_B=max_diag_B,
+        check_positive_definite=check_positive_definite)
+        for check_positive_definite in (False, True)]
+    assert np.allclose(decompositions[0].d, decompositions[1].d)
+    assert np.allclose(decompositions[0].omega, decompositions[1].omega)
+    assert np.allclose(decompositions[0].delta, decompositions[1].delta)
+    assert decompositions[0].is_almost_equal(decompositions[1])
+
+
+test_trace_setups = [
+    (n, dense, complex_values, permutation, check_positive_definite)
+    for n in (10,)
+    for dense in (True, False)
+    for complex_values in (True, False)
+    for check_positive_definite in (False, True)
+    for permutation in (supported_permutation_methods(dense, 1)
+                        + (matrix.tests.random.permutation_vector(n),))
+]
+
+
+@pytest.mark.parametrize('n, dense, complex_values, permutation, check_positive_definite',
+                         test_trace_setups)
+def test_trace(n, dense, complex_values, permutation, check_positive_definite):
+    # create random hermitian matrix
+    A = matrix.tests.random.hermitian_matrix(n, dense=dense, complex_values=complex_values) * 10
+
+    # approximate decomposition with trace
+    trace = matrix.approximation.positive_semidefinite.Trace()
+    decomposition = matrix.approximation.positive_semidefinite.decomposition(
+        A, permutation=permutation, min_diag_D=1, working_dtype=np.float32,
+        check_positive_definite=check_positive_definite, trace=trace)
+
+    # check records
+    records = trace.records()
+    assert len(trace) == n
+    assert records.dtype == matrix.approximation.positive_semidefinite.Reimer.TRACE_DTYPE
+    assert np.all(records.iteration == np.arange(n))
+    assert np.all(records.index == decomposition.p)
+    assert np.allclose(records.d, decomposition.d)
+    assert np.allclose(records.omega, decomposition.omega[decomposition.p])
+    assert np.allclose(records.delta, decomposition.delta[decomposition.p])
+    assert np.all(records.f_value >= 0)
+
+    # check records of approximation matrix are appended
+    matrix.approximation.positive_semidefinite.positive_semidefinite_matrix(
+        A, permutation=permutation, min_diag_D=1, working_dtype=np.float32,
+        check_positive_definite=check_positive_definite, trace=trace)
+    assert len(trace) == 2 * n
+    assert np.all(trace.records()[n:] == records)
+    trace.clear()
+    assert len(trace) == 0
+
+
 test_hermitian_setup = [
     (n, dense, complex_values, permutation, min_diag_B, max_diag_B, min_diag_D, max_diag_D)
     for n in (10,)
@@ -504,3 +724,246 @@ def test_delta_and_omega(n, dense, complex_values, permutation, min_diag_B, max_
         assert np.isclose(B[i, i], A[i, i] + delta[i])
         for j in range(i - 1):
             assert np.isclose(B[p[i], p[j]], A[p[i], p[j]] * omega[p[i]])
+
+
+test_dense_block_size_setups = [
+    (n, complex_values, permutation, min_diag_B, max_diag_B, min_diag_D, block_size)
+    for n in (10,)
+    for complex_values in (True, False)
+    for min_diag_B in (None, 1)
+    for max_diag_B in (None, np.arange(n) + 1)
+    for min_diag_D in (None, 1)
+    for block_size in (1, 3)
+    for permutation in (supported_permutation_methods(True, min_diag_D)
+                        + (matrix.tests.random.permutation_vector(n),))
+]
+
+
+@pytest.mark.parametrize(('n, complex_values, permutation, min_diag_B, max_diag_B,'
+                          'min_diag_D, block_size'),
+                         test_dense_block_size_setups)
+def test_dense_block_size(n, complex_values, permutation, min_diag_B, max_diag_B, min_diag_D,
+                          block_size, monkeypatch):
+    # create random hermitian matrix
+    A = matrix.tests.random.hermitian_matrix(n, dense=True, complex_values=complex_values) * 10
+
+    # approximate decompositions with one and with several panels
+    decompositions = []
+    for block_size_i in (n, block_size):
+        monkeypatch.setattr(matrix.approximation.positive_semidefinite.Reimer,
+                            '_DENSE_BLOCK_SIZE', block_size_i)
+        decomposition = matrix.approximation.positive_semidefinite.decomposition(
+            A, permutation=permutation,
+            min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_diag_D=min_diag_D)
+        decompositions.append(decomposition)
+
+    # check if decompositions are the same
+    assert decompositions[0].is_almost_equal(decompositions[1])
+    assert np.allclose(decompositions[0].omega, decompositions[1].omega)
+    assert np.allclose(decompositions[0].delta, decompositions[1].delta)
+
+
+# *** GMW and SE *** #
+
+GMW_SE_functions = (
+    matrix.approximation.positive_semidefinite.GMW_81,
+    matrix.approximation.positive_semidefinite.GMW_T1,
+    matrix.approximation.positive_semidefinite.GMW_T2,
+    matrix.approximation.positive_semidefinite.SE_90,
+    matrix.approximation.positive_semidefinite.SE_99,
+    matrix.approximation.positive_semidefinite.SE_T1)
+
+test_GMW_SE_setups = [
+    (n, approximation_function, positive_definite, min_diag_B, max_diag_B, min_diag_D,
+     permutation_method)
+    for n in (1, 2, 10)
+    for approximation_function in GMW_SE_functions
+    for positive_definite in (True, False)
+    for min_diag_B in (None, 1)
+    for max_diag_B in (None, 100)
+    for min_diag_D in (None, 0.5)
+    for permutation_method in matrix.approximation.positive_semidefinite.GMW_SE_PERMUTATION_METHODS
+]
+
+
+@pytest.mark.parametrize(('n, approximation_function, positive_definite, min_diag_B, max_diag_B,'
+                          'min_diag_D, permutation_method'),
+                         test_GMW_SE_setups)
+def test_GMW_SE(n, approximation_function, positive_definite, min_diag_B, max_diag_B,
+                min_diag_D, permutation_method):
+    # create random symmetric matrix
+    A = matrix.tests.random.hermitian_matrix(n, dense=True, complex_values=False,
+                                             invertible=positive_definite) * 10
+    A = (A + A.T) / 2
+    A_copy = A.copy()
+
+    # approximate
+    B = approximation_function(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B,
+                               min_diag_D=min_diag_D, permutation_method=permutation_method)
+
+    # check approximation
+    assert np.all(A == A_copy)
+    assert np.allclose(B, B.T)
+    assert np.all(np.linalg.eigvalsh(B) > 0)
+    if min_diag_B is not None:
+        assert np.all(B.diagonal() >= min_diag_B)
+    if max_diag_B is not None:
+        assert np.all(B.diagonal() <= max_diag_B)
+
+
+test_GMW_SE_block_size_setups = [
+    (n, approximation_function, block_size, permutation_method)
+    for n in (10,)
+    for approximation_function in GMW_SE_functions
+    for block_size in (1, 3, 7)
+    for permutation_method in matrix.approximation.positive_semidefinite.GMW_SE_PERMUTATION_METHODS
+]
+
+
+@pytest.mark.parametrize('n, approximation_function, block_size, permutation_method',
+                         test_GMW_SE_block_size_setups)
+def test_GMW_SE_block_size(n, approximation_function, block_size, permutation_method, monkeypatch):
+    # create random symmetric matrix
+    A = matrix.tests.random.hermitian_matrix(n, dense=True, complex_values=False) * 10
+
+    # approximate with one and with several panels
+    B = []
+    for block_size_i in (n, block_size):
+        monkeypatch.setattr(matrix.approximation.positive_semidefinite.GMW_SE,
+                            '_BLOCK_SIZE', block_size_i)
+        B.append(approximation_function(A, permutation_method=permutation_method))
+
+    # check if approximations are the same
+    assert np.allclose(B[0], B[1])
+
+
+@pytest.mark.parametrize('approximation_function', GMW_SE_functions)
+def test_GMW_SE_overwrite(approximation_function):
+    A = matrix.tests.random.hermitian_matrix(10, dense=True, complex_values=False) * 10
+    B = approximation_function(A.copy(), overwrite_A=False)
+    B_overwritten = approximation_function(A.copy(), overwrite_A=True)
+    assert np.allclose(B, B_overwritten)
+
+
+test_GMW_SE_permutation_setups = [
+    (n, approximation_function, permutation_method)
+    for n in (1, 2, 10)
+    for approximation_function in GMW_SE_functions
+    for permutation_method in matrix.approximation.positive_semidefinite.GMW_SE_PERMUTATION_METHODS
+]
+
+
+@pytest.mark.parametrize('n, approximation_function, permutation_method',
+                         test_GMW_SE_permutation_setups)
+def test_GMW_SE_permutation(n, approximation_function, permutation_method, monkeypatch):
+    # create random symmetric matrix
+    A = matrix.tests.random.hermitian_matrix(n, dense=True, complex_values=False) * 10
+
+    # record decompositions
+    decompositions = []
+    modified_LDLt = matrix.approximation.positive_semidefinite.GMW_SE._modified_LDLt
+
+    def modified_LDLt_recorded(*args, **kwargs):
+        decomposition = modified_LDLt(*args, **kwargs)
+        decompositions.append(decomposition)
+        return decomposition
+
+    monkeypatch.setattr(matrix.approximation.positive_semidefinite.GMW_SE,
+                        '_modified_LDLt', modified_LDLt_recorded)
+
+    # approximate
+    B = approximation_function(A, permutation_method=permutation_method)
+
+    # check decomposition
+    assert len(decompositions) == 1
+    decomposition = decompositions[0]
+    p = decomposition.p
+    assert np.all(np.sort(p) == np.arange(n))
+    if permutation_method == matrix.NO_PERMUTATION_METHOD:
+        assert np.all(p == np.arange(n))
+    if permutation_method == (matrix.approximation.positive_semidefinite.
+                              MAXIMAL_ABSOLUTE_DIAGONAL_VALUE_PERMUTATION_METHOD):
+        assert np.abs(A[p[0], p[0]]) == np.abs(A.diagonal()).max()
+    assert np.allclose(decomposition.composed_matrix, B)
+
+
+def test_GMW_SE_permutation_unknown():
+    A = matrix.tests.random.hermitian_matrix(3, dense=True, complex_values=False)
+    with pytest.raises(ValueError):
+        matrix.approximation.positive_semidefinite.SE_99(A, permutation_method='unknown')
+    A = scipy.sparse.csc_matrix(A)
+    with pytest.raises(ValueError):
+        matrix.approximation.positive_semidefinite.SE_99(
+            A, permutation_method=matrix.approximation.positive_semidefinite.GERSHGORIN_PERMUTATION_METHOD)
+
+
+test_GMW_SE_decomposition_setups = [
+    (n, approximation_function, min_diag_B, max_diag_B, permutation_method, return_type,
+     overwrite_A)
+    for n in (1, 2, 10)
+    for approximation_function in GMW_SE_functions
+    for min_diag_B in (None, 1)
+    for max_diag_B in (None, 100)
+    for permutation_method in matrix.approximation.positive_semidefinite.GMW_SE_PERMUTATION_METHODS
+    for return_type in matrix.DECOMPOSITION_TYPES
+    for overwrite_A in (False, True)
+]
+
+
+@pytest.mark.parametrize(('n, approximation_function, min_diag_B, max_diag_B, permutation_method,'
+                          'return_type, overwrite_A'),
+                         test_GMW_SE_decomposition_setups)
+def test_GMW_SE_decomposition(n, approximation_function, min_diag_B, max_diag_B,
+                              permutation_method, return_type, overwrite_A):
+    # create random symmetric matrix
+    A = matrix.tests.random.hermitian_matrix(n, dense=True, complex_values=False) * 10
+    A = (A + A.T) / 2
+
+    # approximate
+    B = approximation_function(A.copy(), min_diag_B=min_diag_B, max_diag_B=max_diag_B,
+                               permutation_method=permutation_method)
+    decomposition = approximation_function(A.copy(), min_diag_B=min_diag_B, max_diag_B=max_diag_B,
+                                           permutation_method=permutation_method,
+                                           overwrite_A=overwrite_A, return_type=return_type)
+
+    # check decomposition
+    assert decomposition.is_type(return_type)
+    assert np.allclose(decomposition.composed_matrix, B)
+    assert decomposition.delta.shape == (n,)
+    if min_diag_B is None and max_diag_B is None:
+        assert np.allclose(A + np.diag(decomposition.delta), B)
+
+
+test_GMW_SE_sparse_setups = [
+    (n, approximation_function, min_diag_B, max_diag_B, return_type)
+    for n in (1, 2, 10, 50)
+    for approximation_function in GMW_SE_functions
+    for min_diag_B in (None, 1)
+    for max_diag_B in (None, 100)
+    for return_type in (None,) + matrix.DECOMPOSITION_TYPES
+]
+
+
+@pytest.mark.parametrize('n, approximation_function, min_diag_B, max_diag_B, return_type',
+                         test_GMW_SE_sparse_setups)
+def test_GMW_SE_sparse(n, approximation_function, min_diag_B, max_diag_B, return_type):
+    # create random symmetric sparse matrix
+    A = matrix.tests.random.hermitian_matrix(n, dense=False, complex_values=False) * 10
+    A = ((A + A.T) / 2).tocsc()
+    A_copy = A.copy()
+
+    # approximate sparse and dense matrix
+    B = approximation_function(A.toarray(), min_diag_B=min_diag_B, max_diag_B=max_diag_B)
+    B_sparse = approximation_function(A, min_diag_B=min_diag_B, max_diag_B=max_diag_B,
+                                      permutation_method=matrix.NO_PERMUTATION_METHOD,
+                                      return_type=return_type)
+
+    # check approximation
+    assert matrix.util.is_equal(A, A_copy)
+    if return_type is None:
+        assert scipy.sparse.isspmatrix_csc(B_sparse)
+        assert np.allclose(B_sparse.toarray(), B)
+    else:
+        assert B_sparse.is_type(return_type)
+        assert B_sparse.is_sparse()
+        assert np.allclose(B_sparse.composed_matrix.toarray(), B)
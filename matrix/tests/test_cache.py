@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+import scipy.sparse
+
+import matrix.constants
+import matrix.errors
+import matrix.permute
+import matrix.tests.random
+import matrix.util
+
+
+# *** cache *** #
+
+def _derived_properties(decomposition):
+    names = ['p_inverse', 'P', 'is_permuted']
+    if decomposition.is_type(matrix.constants.LDL_DECOMPOSITION_TYPE):
+        names += ['D', 'LD']
+    elif decomposition.is_type(matrix.constants.LDL_DECOMPOSITION_COMPRESSED_TYPE):
+        names += ['D', 'L', 'd']
+    elif decomposition.is_type(matrix.constants.LL_DECOMPOSITION_TYPE):
+        names += ['_d']
+    return names
+
+
+test_cache_setups = [
+    (n, dense, type_str)
+    for n in (10,)
+    for dense in (True, False)
+    for type_str in matrix.constants.DECOMPOSITION_TYPES
+]
+
+
+@pytest.mark.parametrize('n, dense, type_str', test_cache_setups)
+def test_cache(n, dense, type_str):
+    decomposition = matrix.tests.random.decomposition(n, type_str=type_str, dense=dense)
+    assert decomposition.use_cache
+
+    # derived properties are calculated only once and their arrays are read-only
+    for name in _derived_properties(decomposition):
+        value = getattr(decomposition, name)
+        assert getattr(decomposition, name) is value
+        if isinstance(value, np.ndarray):
+            assert not value.flags.writeable
+            with pytest.raises(ValueError):
+                value[0] = value[0]
+        elif scipy.sparse.issparse(value):
+            assert not value.data.flags.writeable
+            with pytest.raises(ValueError):
+                value.data[0] = value.data[0]
+            with pytest.raises(ValueError):
+                value *= 2
+
+    # converted decompositions do not share the read-only cached values
+    if decomposition.is_type(matrix.constants.LDL_DECOMPOSITION_TYPE):
+        converted_value = decomposition.as_LDL_DecompositionCompressed().LD
+    elif decomposition.is_type(matrix.constants.LDL_DECOMPOSITION_COMPRESSED_TYPE):
+        converted_value = decomposition.as_LDL_Decomposition().L
+    else:
+        converted_value = None
+    if converted_value is not None:
+        if scipy.sparse.issparse(converted_value):
+            converted_value = converted_value.data
+        assert converted_value.flags.writeable
+
+    # clear cache
+    p_inverse = decomposition.p_inverse
+    decomposition.clear_cache()
+    assert decomposition.p_inverse is not p_inverse
+    assert np.all(decomposition.p_inverse == p_inverse)
+
+    # disable cache
+    decomposition.use_cache = False
+    for name in _derived_properties(decomposition):
+        value = getattr(decomposition, name)
+        if not isinstance(value, bool):
+            assert getattr(decomposition, name) is not value
+    decomposition.use_cache = True
+
+    # setting attributes invalidates cache
+    p = matrix.tests.random.permutation_vector(n)
+    decomposition.p = p
+    assert np.all(decomposition.p_inverse == matrix.permute.invert_permutation_vector(p))
+    if decomposition.is_type(matrix.constants.LDL_DECOMPOSITION_TYPE):
+        D = decomposition.D
+        decomposition.d = decomposition.d * 2
+        assert decomposition.D is not D
+        assert np.all(decomposition.D.diagonal() == decomposition.d)
+    elif decomposition.is_type(matrix.constants.LDL_DECOMPOSITION_COMPRESSED_TYPE):
+        d = decomposition.d
+        decomposition.LD = decomposition.LD * 2
+        assert np.all(decomposition.d == d * 2)
+    elif decomposition.is_type(matrix.constants.LL_DECOMPOSITION_TYPE):
+        d = decomposition._d
+        decomposition.L = decomposition.L * 2
+        assert np.all(decomposition._d == d * 2)
+
+    # copy with cache
+    decomposition_copy = decomposition.copy()
+    assert decomposition_copy == decomposition
+    assert np.all(decomposition_copy.p_inverse == decomposition.p_inverse)
+
+    # attributes modified in place require clearing the cache
+    decomposition = matrix.tests.random.decomposition(n, type_str=type_str, dense=dense, finite=True, invertible=True)
+    b = matrix.tests.random.vector(n)
+    decomposition.solve(b)
+    attribute_name = decomposition._attribute_names[0]
+    attribute_value = getattr(decomposition, attribute_name)
+    if dense:
+        attribute_value[-1, 0] = np.nan
+    else:
+        columns = np.repeat(np.arange(n), np.diff(attribute_value.indptr))
+        attribute_value.data[np.flatnonzero(attribute_value.indices != columns)[0]] = np.nan
+    decomposition.clear_cache()
+    with pytest.raises(matrix.errors.DecompositionNotFiniteError):
+        decomposition.solve(b)
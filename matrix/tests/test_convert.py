@@ -1,7 +1,9 @@
 import pytest
 
 import matrix.constants
+import matrix.errors
 import matrix.tests.random
+import matrix.util
 
 
 # *** convert *** #
@@ -24,3 +26,47 @@ def test_convert(n, dense, complex_values, type_str, copy):
         equal = type_str == convert_type_str
         equal_calculated = decomposition == converted_decomposition
         assert equal == equal_calculated
+
+
+test_convert_not_possible_setups = [
+    (n, dense, complex_values)
+    for n in (10,)
+    for dense in (True, False)
+    for complex_values in (True, False)
+]
+
+
+@pytest.mark.parametrize('n, dense, complex_values', test_convert_not_possible_setups)
+def test_convert_not_possible(n, dense, complex_values):
+    # negative diagonal value
+    decomposition = matrix.tests.random.decomposition(n, type_str=matrix.constants.LDL_DECOMPOSITION_TYPE, dense=dense, complex_values=complex_values, positive_semidefinite=True, invertible=True)
+    p = matrix.tests.random.permutation_vector(n)
+    decomposition.p = p
+    i = n // 2
+    d = decomposition.d.copy()
+    d[i] = -1
+    decomposition.d = d
+    with pytest.raises(matrix.errors.NoDecompositionPossibleWithProblematicSubdecompositionError) as exc_info:
+        decomposition.as_type(matrix.constants.LL_DECOMPOSITION_TYPE)
+    assert exc_info.value.problematic_leading_principal_submatrix_index == p[i]
+
+    # zero diagonal value with non zero values below
+    decomposition = matrix.tests.random.decomposition(n, type_str=matrix.constants.LL_DECOMPOSITION_TYPE, dense=dense, complex_values=complex_values, positive_semidefinite=True, invertible=True)
+    decomposition.p = p
+    L = decomposition.L.copy()
+    if not dense:
+        L_format = L.format
+        L = L.tolil()
+    L[i, i] = 0
+    L[i + 1, i] = 1
+    decomposition.L = L if dense else L.asformat(L_format)
+    with pytest.raises(matrix.errors.NoDecompositionPossibleWithProblematicSubdecompositionError) as exc_info:
+        decomposition.as_type(matrix.constants.LDL_DECOMPOSITION_TYPE)
+    assert exc_info.value.problematic_leading_principal_submatrix_index == p[i]
+
+    # zero diagonal value with zero values below
+    L[i + 1:, i] = 0
+    decomposition.L = L if dense else L.asformat(L_format)
+    converted_decomposition = decomposition.as_type(matrix.constants.LDL_DECOMPOSITION_TYPE)
+    assert converted_decomposition.d[i] == 0
+    assert matrix.util.is_almost_equal(converted_decomposition.composed_matrix, decomposition.composed_matrix)
@@ -50,3 +50,28 @@ def test_decompose(n, dense, complex_values, permutation, check_finite, return_t
         L = L.data
     assert np.all(np.isfinite(L))
     assert complex_values or np.all(np.isreal(L))
+
+
+# *** decompose with symbolic decomposition *** #
+
+test_decompose_symbolic_setups = [
+    (n, complex_values, permutation, return_type)
+    for n in (10,)
+    for complex_values in (True, False)
+    for permutation in (matrix.NO_PERMUTATION_METHOD, matrix.tests.random.permutation_vector(n)) + matrix.SPARSE_ONLY_PERMUTATION_METHODS
+    for return_type in matrix.DECOMPOSITION_TYPES
+]
+
+
+@pytest.mark.parametrize('n, complex_values, permutation, return_type', test_decompose_symbolic_setups)
+def test_decompose_symbolic(n, complex_values, permutation, return_type):
+    # create Hermitian matrices with same pattern
+    A = matrix.tests.random.hermitian_matrix(n, dense=False, complex_values=complex_values, positive_semidefinite=True, invertible=True)
+    B = A.copy()
+    B.data = B.data * 2
+    # analyze and decompose
+    symbolic = matrix.analyze(A, permutation=permutation)
+    for C in (A, B):
+        decomposition = matrix.decompose(C, return_type=return_type, symbolic=symbolic)
+        assert matrix.util.is_almost_equal(decomposition.composed_matrix, C, atol=1e-06)
+        assert np.all(decomposition.p == symbolic.p)
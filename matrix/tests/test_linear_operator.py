@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+import scipy.sparse.linalg
+
+import matrix.constants
+import matrix.errors
+import matrix.tests.random
+
+
+# *** linear operator *** #
+
+test_linear_operator_setups = [
+    (n, dense, complex_values, type_str, inverse, x)
+    for n in (10,)
+    for dense in (True, False)
+    for complex_values in (True, False)
+    for type_str in matrix.constants.DECOMPOSITION_TYPES
+    for inverse in (True, False)
+    for x in (matrix.tests.random.vector(n), matrix.tests.random.vector(n, complex_values=True), matrix.tests.random.universal_matrix(n, 3), matrix.tests.random.universal_matrix(n, 3, complex_values=True))
+]
+
+
+@pytest.mark.parametrize('n, dense, complex_values, type_str, inverse, x', test_linear_operator_setups)
+def test_linear_operator(n, dense, complex_values, type_str, inverse, x):
+    # make random decomposition and linear operator
+    decomposition = matrix.tests.random.decomposition(n, type_str=type_str, dense=dense, complex_values=complex_values, finite=True, invertible=True)
+    A = decomposition.composed_matrix
+    if not dense:
+        A = A.toarray()
+    A = np.asarray(A)
+    if inverse:
+        A = np.linalg.inv(A)
+        operator = decomposition.as_inverse_linear_operator()
+    else:
+        operator = decomposition.as_linear_operator()
+    assert operator.shape == (n, n)
+    # check products, repeated to use work buffers
+    for _ in range(2):
+        assert np.allclose(operator @ x, A @ x)
+        assert np.allclose(operator.H @ x, A.conj().T @ x)
+        if x.ndim == 1:
+            assert np.allclose(operator.matvec(x), A @ x)
+            assert np.allclose(operator.rmatvec(x), A.conj().T @ x)
+        else:
+            assert np.allclose(operator.matmat(x), A @ x)
+            assert np.allclose(operator.rmatmat(x), A.conj().T @ x)
+
+
+test_linear_operator_krylov_setups = [
+    (n, dense, type_str)
+    for n in (10,)
+    for dense in (True, False)
+    for type_str in matrix.constants.DECOMPOSITION_TYPES
+]
+
+
+@pytest.mark.parametrize('n, dense, type_str', test_linear_operator_krylov_setups)
+def test_linear_operator_krylov(n, dense, type_str):
+    decomposition = matrix.tests.random.decomposition(n, type_str=type_str, dense=dense, finite=True, positive_semidefinite=True, invertible=True)
+    b = matrix.tests.random.vector(n)
+    # solve with inverse as preconditioner
+    x, info = scipy.sparse.linalg.cg(decomposition.as_linear_operator(), b, M=decomposition.as_inverse_linear_operator(), atol=0)
+    assert info == 0
+    assert np.allclose(decomposition.matrix_right_side_multiplication(x), b)
+
+
+def test_linear_operator_singular():
+    decomposition = matrix.tests.random.decomposition(10, finite=True, invertible=False)
+    operator = decomposition.as_inverse_linear_operator()
+    with np.testing.assert_raises(matrix.errors.DecompositionSingularError):
+        operator @ matrix.tests.random.vector(10)
@@ -0,0 +1,40 @@
+import math
+
+import numpy as np
+import pytest
+
+import matrix.approximation.positive_semidefinite.Reimer
+
+
+# *** minimal changes *** #
+
+test_minimal_changes_setups = [
+    (min_diag_D, max_diag_D, min_diag_B, max_diag_B, min_abs_value_D)
+    for min_diag_D in (1e-4, 1)
+    for max_diag_D in (math.inf, 10)
+    for min_diag_B in (-math.inf, 1e-3)
+    for max_diag_B in (math.inf, 5)
+    for min_abs_value_D in (1e-8, 1e-2)
+]
+
+
+@pytest.mark.parametrize('min_diag_D, max_diag_D, min_diag_B, max_diag_B, min_abs_value_D',
+                         test_minimal_changes_setups)
+def test_minimal_changes(min_diag_D, max_diag_D, min_diag_B, max_diag_B, min_abs_value_D):
+    np.random.seed(1234)
+    n = 50
+    alpha = np.random.uniform(low=0, high=10, size=n)
+    alpha[:5] = 0
+    beta = np.random.uniform(low=0, high=10, size=n)
+    beta[:5] = 0
+    gamma = np.random.uniform(low=-10, high=10, size=n)
+    d, omega, f_value = matrix.approximation.positive_semidefinite.Reimer._minimal_changes(
+        alpha, beta, gamma, min_diag_D, max_diag_D=max_diag_D,
+        min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_abs_value_D=min_abs_value_D)
+    for i in range(n):
+        d_i, omega_i, f_value_i = matrix.approximation.positive_semidefinite.Reimer._minimal_change(
+            alpha[i], beta[i], gamma[i], min_diag_D, max_diag_D=max_diag_D,
+            min_diag_B=min_diag_B, max_diag_B=max_diag_B, min_abs_value_D=min_abs_value_D)
+        assert np.isclose(d[i], d_i)
+        assert np.isclose(omega[i], omega_i)
+        assert np.isclose(f_value[i], f_value_i)
@@ -4,6 +4,7 @@ import pytest
 import matrix.constants
 import matrix.errors
 import matrix.tests.random
+import matrix.util
 
 
 # *** multiply *** #
@@ -48,3 +49,58 @@ def test_multiply(n, dense, complex_values, type_str, invertible, x, y):
             decomposition.inverse_matrix_right_side_multiplication(x)
         with np.testing.assert_raises(matrix.errors.DecompositionSingularError):
             decomposition.inverse_matrix_both_sides_multiplication(x, y)
+
+
+# *** multiply factored *** #
+
+test_multiply_factored_setups = [
+    (n, dense, type_str)
+    for n in (10,)
+    for dense in (True, False)
+    for type_str in matrix.constants.DECOMPOSITION_TYPES
+]
+
+
+@pytest.mark.parametrize('n, dense, type_str', test_multiply_factored_setups)
+def test_multiply_factored(n, dense, type_str, monkeypatch):
+    decomposition = matrix.tests.random.decomposition(n, type_str=type_str, dense=dense)
+    A = decomposition.composed_matrix
+    if not dense:
+        A = A.toarray()
+    x = matrix.tests.random.vector(n)
+    # composed matrix is not used
+    monkeypatch.setattr(type(decomposition), 'composed_matrix', property(lambda self: pytest.fail('composed_matrix used')))
+    assert np.allclose(decomposition.matrix_right_side_multiplication(x), A @ x)
+    assert np.allclose(decomposition.matrix_both_sides_multiplication(x), x @ A @ x)
+
+
+# *** multiply triangular *** #
+
+test_multiply_triangular_setups = [
+    (n, dense, sparse_format, complex_values, lower, unit_diagonal, conjugate_transpose, x)
+    for n in (10,)
+    for dense, sparse_format in ((True, None), (False, 'csc'), (False, 'csr'))
+    for complex_values in (True, False)
+    for lower in (True, False)
+    for unit_diagonal in (True, False)
+    for conjugate_transpose in (True, False)
+    for x in (matrix.tests.random.vector(n), matrix.tests.random.universal_matrix(n, 2, complex_values=True))
+]
+
+
+@pytest.mark.parametrize('n, dense, sparse_format, complex_values, lower, unit_diagonal, conjugate_transpose, x', test_multiply_triangular_setups)
+def test_multiply_triangular(n, dense, sparse_format, complex_values, lower, unit_diagonal, conjugate_transpose, x):
+    # make random matrix with values outside of the triangle
+    A = matrix.tests.random.universal_matrix(n, n, dense=dense, complex_values=complex_values)
+    if not dense:
+        A = A.asformat(sparse_format)
+    # calculate expected result
+    B = A if dense else A.toarray()
+    B = np.tril(B) if lower else np.triu(B)
+    if unit_diagonal:
+        np.fill_diagonal(B, 1)
+    if conjugate_transpose:
+        B = B.conj().T
+    # multiply
+    y = matrix.util.multiply_triangular(A, x, lower=lower, unit_diagonal=unit_diagonal, conjugate_transpose=conjugate_transpose)
+    assert np.allclose(y, B @ x)
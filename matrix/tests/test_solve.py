@@ -1,9 +1,13 @@
 import numpy as np
 import pytest
+import scipy.sparse
 
 import matrix.constants
+import matrix.decompositions
 import matrix.errors
+import matrix.sparse.util
 import matrix.tests.random
+import matrix.util
 
 
 # *** solve *** #
@@ -33,3 +37,279 @@ def test_solve(n, dense, complex_values, type_str, invertible, b):
     else:
         with np.testing.assert_raises(matrix.errors.DecompositionSingularError):
             decomposition.solve(b)
+
+
+# *** solve triangular *** #
+
+test_solve_triangular_setups = [
+    (n, dense, sparse_format, complex_values, lower, unit_diagonal, conjugate_transpose, b)
+    for n in (10,)
+    for dense, sparse_format in ((True, None), (False, 'csc'), (False, 'csr'))
+    for complex_values in (True, False)
+    for lower in (True, False)
+    for unit_diagonal in (True, False)
+    for conjugate_transpose in (True, False)
+    for b in (matrix.tests.random.vector(n), matrix.tests.random.universal_matrix(n, 2, complex_values=True))
+]
+
+
+@pytest.mark.parametrize('n, dense, sparse_format, complex_values, lower, unit_diagonal, conjugate_transpose, b', test_solve_triangular_setups)
+def test_solve_triangular(n, dense, sparse_format, complex_values, lower, unit_diagonal, conjugate_transpose, b):
+    # make random invertible triangular matrix
+    A = matrix.tests.random.lower_triangle_matrix(n, dense=dense, complex_values=complex_values, invertible=True)
+    if not lower:
+        A = A.T
+    if not dense:
+        A = A.asformat(sparse_format)
+    # calculate solution
+    x = matrix.util.solve_triangular(A, b, lower=lower, unit_diagonal=unit_diagonal, conjugate_transpose=conjugate_transpose)
+    # verify solution
+    B = A if dense else A.toarray()
+    if unit_diagonal:
+        B = B.copy()
+        np.fill_diagonal(B, 1)
+    if conjugate_transpose:
+        B = B.conj().T
+    assert np.allclose(B @ x, b)
+
+
+test_solve_cholesky_setups = [
+    (n, dense, sparse_format, complex_values, b)
+    for n in (10,)
+    for dense, sparse_format in ((True, None), (False, 'csc'), (False, 'csr'))
+    for complex_values in (True, False)
+    for b in (matrix.tests.random.vector(n), matrix.tests.random.universal_matrix(n, 2, complex_values=True))
+]
+
+
+@pytest.mark.parametrize('n, dense, sparse_format, complex_values, b', test_solve_cholesky_setups)
+def test_solve_cholesky(n, dense, sparse_format, complex_values, b):
+    # make random invertible lower triangle matrix
+    L = matrix.tests.random.lower_triangle_matrix(n, dense=dense, complex_values=complex_values, invertible=True)
+    if not dense:
+        L = L.asformat(sparse_format)
+    # calculate solution
+    x = matrix.util.solve_cholesky(L, b)
+    # verify solution
+    B = L if dense else L.toarray()
+    assert np.allclose(B @ B.conj().T @ x, b)
+    # C contiguous factor
+    if dense:
+        x = matrix.util.solve_cholesky(np.ascontiguousarray(L), b)
+        assert np.allclose(B @ B.conj().T @ x, b)
+
+
+test_solve_triangular_levels_setups = [
+    (n, sparse_format, complex_values, lower, unit_diagonal, conjugate_transpose, number_of_threads, b)
+    for n in (10,)
+    for sparse_format in ('csc', 'csr')
+    for complex_values in (True, False)
+    for lower in (True, False)
+    for unit_diagonal in (True, False)
+    for conjugate_transpose in (True, False)
+    for number_of_threads in (1, 2)
+    for b in (matrix.tests.random.vector(n), matrix.tests.random.universal_matrix(n, 3, complex_values=True))
+]
+
+
+@pytest.mark.parametrize('n, sparse_format, complex_values, lower, unit_diagonal, conjugate_transpose, number_of_threads, b', test_solve_triangular_levels_setups)
+def test_solve_triangular_levels(n, sparse_format, complex_values, lower, unit_diagonal, conjugate_transpose, number_of_threads, b):
+    # make random invertible triangular matrix
+    A = matrix.tests.random.lower_triangle_matrix(n, dense=False, complex_values=complex_values, invertible=True)
+    if not lower:
+        A = A.T
+    A = A.asformat(sparse_format)
+    # calculate levels
+    T, diagonal = matrix.sparse.util.triangular_solve_factor(A, lower=lower, unit_diagonal=unit_diagonal, conjugate_transpose=conjugate_transpose)
+    lower = lower != conjugate_transpose
+    order, level_indptr, T_ordered = matrix.sparse.util.triangular_solve_levels(T, lower=lower, min_rows_per_level=1)
+    assert np.all(np.sort(order) == np.arange(n))
+    level = np.empty(n, dtype=np.int64)
+    level[order] = np.repeat(np.arange(len(level_indptr) - 1), np.diff(level_indptr))
+    T = T.tocoo()
+    assert np.all(level[T.row] > level[T.col])
+    # calculate solution
+    x = matrix.sparse.util.solve_triangular_factor(T.tocsr(), diagonal, b, lower=lower, levels=(order, level_indptr, T_ordered), number_of_threads=number_of_threads)
+    # verify solution
+    B = A.toarray()
+    if unit_diagonal:
+        np.fill_diagonal(B, 1)
+    if conjugate_transpose:
+        B = B.conj().T
+    assert np.allclose(B @ x, b)
+
+
+test_solve_deep_triangular_factor_setups = [
+    (n, type_str, number_of_threads)
+    for n in (100,)
+    for type_str in matrix.constants.DECOMPOSITION_TYPES
+    for number_of_threads in (1, 2)
+]
+
+
+@pytest.mark.parametrize('n, type_str, number_of_threads', test_solve_deep_triangular_factor_setups)
+def test_solve_deep_triangular_factor(n, type_str, number_of_threads):
+    # bidiagonal factor whose rows form one chain
+    L = scipy.sparse.eye(n, format='csc') + scipy.sparse.eye(n, k=-1, format='csc') * 0.5
+    d = np.arange(1, n + 1, dtype=np.float64)
+    decomposition = matrix.decompositions.LDL_Decomposition(L=L, d=d).as_type(type_str)
+    decomposition.number_of_threads = number_of_threads
+    # levels are not used
+    T, diagonal = matrix.sparse.util.triangular_solve_factor(L, lower=True, unit_diagonal=True)
+    assert matrix.sparse.util.triangular_solve_levels(T, lower=True) is None
+    T, diagonal = matrix.sparse.util.triangular_solve_factor(L, lower=True, unit_diagonal=True, conjugate_transpose=True)
+    assert matrix.sparse.util.triangular_solve_levels(T, lower=False) is None
+    # solve
+    A = decomposition.composed_matrix.toarray()
+    for b in (matrix.tests.random.vector(n), matrix.tests.random.universal_matrix(n, 3)):
+        x = decomposition.solve(b)
+        assert np.allclose(A @ x, b)
+
+
+# *** solve with work buffer *** #
+
+test_solve_work_buffer_setups = [
+    (n, dense, complex_values, type_str, b)
+    for n in (10,)
+    for dense in (True, False)
+    for complex_values in (True, False)
+    for type_str in matrix.constants.DECOMPOSITION_TYPES
+    for b in (matrix.tests.random.vector(n), matrix.tests.random.universal_matrix(n, 2))
+]
+
+
+@pytest.mark.parametrize('n, dense, complex_values, type_str, b', test_solve_work_buffer_setups)
+def test_solve_work_buffer(n, dense, complex_values, type_str, b):
+    decomposition = matrix.tests.random.decomposition(n, type_str=type_str, dense=dense, complex_values=complex_values, finite=True, invertible=True)
+    A = decomposition.composed_matrix
+    dtype = np.result_type(decomposition._factor_dtype, b.dtype)
+    work_buffer = decomposition._work_buffer(b.shape, dtype)
+
+    # solve repeatedly into passed array
+    out = np.empty(b.shape, dtype=dtype)
+    for _ in range(2):
+        x = decomposition.inverse_matrix_right_side_multiplication(b, out=out)
+        assert x is out
+        assert np.allclose(A @ x, b)
+        assert np.shares_memory(decomposition._work_buffer(b.shape, dtype), work_buffer)
+
+    # one buffer per thread which is enlarged and freed with the cache
+    assert np.shares_memory(decomposition._work_buffer((n,), np.float32), work_buffer)
+    larger_work_buffer = decomposition._work_buffer((n, 5), np.complex128)
+    assert not np.shares_memory(larger_work_buffer, work_buffer)
+    assert np.shares_memory(decomposition._work_buffer(b.shape, dtype), larger_work_buffer)
+    decomposition.clear_cache()
+    assert not np.shares_memory(decomposition._work_buffer(b.shape, dtype), larger_work_buffer)
+
+    # finiteness of factors is checked
+    attribute_name = decomposition._attribute_names[0]
+    attribute_value = getattr(decomposition, attribute_name).copy()
+    if dense:
+        attribute_value[-1, 0] = np.nan
+    else:
+        # stored off-diagonal entry, so the sparsity structure is not changed
+        attribute_value = attribute_value.tocsc()
+        columns = np.repeat(np.arange(n), np.diff(attribute_value.indptr))
+        attribute_value.data[np.flatnonzero(attribute_value.indices != columns)[0]] = np.nan
+    setattr(decomposition, attribute_name, attribute_value)
+    with np.testing.assert_raises(matrix.errors.DecompositionNotFiniteError):
+        decomposition.inverse_matrix_right_side_multiplication(b)
+
+
+# *** solve with cached triangular factors *** #
+
+test_solve_cached_triangular_factors_setups = [
+    (n, complex_values, type_str, number_of_threads, b)
+    for n in (10,)
+    for complex_values in (True, False)
+    for type_str in matrix.constants.DECOMPOSITION_TYPES
+    for number_of_threads in (1, 2)
+    for b in (matrix.tests.random.vector(n), matrix.tests.random.universal_matrix(n, 3))
+]
+
+
+@pytest.mark.parametrize('n, complex_values, type_str, number_of_threads, b', test_solve_cached_triangular_factors_setups)
+def test_solve_cached_triangular_factors(n, complex_values, type_str, number_of_threads, b, monkeypatch):
+    decomposition = matrix.tests.random.decomposition(n, type_str=type_str, dense=False, complex_values=complex_values, finite=True, invertible=True)
+    decomposition.number_of_threads = number_of_threads
+    A = decomposition.composed_matrix.toarray()
+    x = decomposition.solve(b)
+    assert np.allclose(A @ x, b)
+
+    # triangular factors are not converted again
+    def triangular_solve_factor(*args, **kwargs):
+        raise AssertionError('The triangular factor is converted again.')
+    monkeypatch.setattr(matrix.sparse.util, 'triangular_solve_factor', triangular_solve_factor)
+    x = decomposition.solve(b)
+    assert np.allclose(A @ x, b)
+    y = decomposition.inverse_matrix_both_sides_multiplication(b, b)
+    assert np.allclose(y, b.conj().T @ x)
+
+    # setting attributes clears cached triangular factors
+    decomposition.p = decomposition.p
+    with np.testing.assert_raises(AssertionError):
+        decomposition.solve(b)
+
+
+# *** solve with native factor *** #
+
+class _NativeFactor():
+
+    def __init__(self, A):
+        self.A = A
+        self.number_of_solves = 0
+
+    def solve_A(self, b):
+        self.number_of_solves += 1
+        return np.linalg.solve(self.A, b)
+
+
+test_solve_native_factor_setups = [
+    (n, dense, complex_values, type_str, permuted)
+    for n in (10,)
+    for dense in (True, False)
+    for complex_values in (True, False)
+    for type_str in matrix.constants.DECOMPOSITION_TYPES
+    for permuted in (True, False)
+]
+
+
+@pytest.mark.parametrize('n, dense, complex_values, type_str, permuted', test_solve_native_factor_setups)
+def test_solve_native_factor(n, dense, complex_values, type_str, permuted):
+    # make random decomposition with native factor
+    decomposition = matrix.tests.random.decomposition(n, type_str=type_str, dense=dense, complex_values=complex_values, finite=True, positive_semidefinite=True, invertible=True)
+    A = decomposition.composed_matrix
+    if not dense:
+        A = A.toarray()
+    A = np.asarray(A)
+    if permuted:
+        p = matrix.tests.random.permutation_vector(n)
+        native_factor = _NativeFactor(A[p[:, np.newaxis], p[np.newaxis, :]])
+    else:
+        p = None
+        native_factor = _NativeFactor(A)
+    decomposition._set_native_factor(native_factor, p=p)
+    assert decomposition.native_factor is native_factor
+
+    # solve with native factor
+    b = matrix.tests.random.vector(n)
+    x = decomposition.solve(b)
+    assert native_factor.number_of_solves == 1
+    assert np.allclose(A @ x, b)
+    y = decomposition.inverse_matrix_both_sides_multiplication(b)
+    assert native_factor.number_of_solves == 2
+    assert np.allclose(y, b.conj() @ x)
+
+    # copy shares native factor
+    decomposition_copy = decomposition.copy()
+    assert decomposition_copy.native_factor is native_factor
+
+    # native factor is not converted
+    other_type_str = tuple(other_type_str for other_type_str in matrix.constants.DECOMPOSITION_TYPES if other_type_str != type_str)[0]
+    assert decomposition.as_type(other_type_str).native_factor is None
+
+    # setting attributes removes native factor
+    decomposition.p = decomposition.p
+    assert decomposition.native_factor is None
+    assert np.allclose(decomposition.solve(b), x)
+    assert native_factor.number_of_solves == 2
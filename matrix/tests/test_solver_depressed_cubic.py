@@ -25,3 +25,30 @@ def test_solver_depressed_cubic(p, q):
     roots = matrix._util.roots.solver_depressed_cubic(p, q, include_complex_values=False)
     assert 1 <= len(roots) <= 3
     assert all(x.imag == 0 for x in roots)
+
+
+# *** solver_depressed_cubics *** #
+
+@pytest.mark.parametrize('dtype', (np.float64, np.longdouble))
+def test_solver_depressed_cubics(dtype):
+    p, q = np.array(test_solver_depressed_cubic_setups, dtype=dtype).T
+    roots = matrix._util.roots.solver_depressed_cubics(p, q)
+    assert roots.shape == (len(p), 3)
+    assert roots.dtype == dtype
+    for (p_i, q_i, roots_i) in zip(p, q, roots):
+        roots_i = np.sort(roots_i[np.logical_not(np.isnan(roots_i))])
+        expected_roots_i = np.sort(matrix._util.roots.solver_depressed_cubic(
+            p_i, q_i, include_complex_values=False))
+        assert len(roots_i) == len(expected_roots_i)
+        np.testing.assert_allclose(roots_i, expected_roots_i, atol=1e-08)
+
+
+def test_solver_depressed_cubics_extreme_values():
+    p = np.array([-1e300, 1e300, -3, 1e-300])
+    q = np.array([1e300, 1e-300, 0, 0])
+    roots = matrix._util.roots.solver_depressed_cubics(p, q)
+    np.testing.assert_allclose(roots[0], (1e150, 1, -1e150))
+    np.testing.assert_allclose(roots[1, 0], 0, atol=1e-300)
+    np.testing.assert_allclose(roots[2], (3**0.5, 0, - 3**0.5), atol=1e-15)
+    assert roots[3, 0] == 0
+    assert np.all(np.isnan(roots[[1, 3], 1:]))
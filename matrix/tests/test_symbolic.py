@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+import scipy.sparse
+
+import matrix
+import matrix.permute
+import matrix.sparse.symbolic
+import matrix.tests.random
+
+
+def symbolic_factorization(A, p):
+    n = A.shape[0]
+    A = scipy.sparse.coo_matrix(A)
+    q = matrix.permute.invert_permutation_vector(p)
+    pattern = np.zeros((n, n), dtype=bool)
+    pattern[q[A.row], q[A.col]] = True
+    pattern = np.logical_or(pattern, pattern.T)
+    np.fill_diagonal(pattern, True)
+    for j in range(n):
+        rows = np.nonzero(pattern[j + 1:, j])[0] + j + 1
+        pattern[np.ix_(rows, rows)] = True
+    return np.tril(pattern)
+
+
+# *** symbolic analysis *** #
+
+test_symbolic_setups = [(n, density, permute)
+                        for n in (1, 2, 5, 10, 20)
+                        for density in (0.05, 0.2, 0.5)
+                        for permute in (False, True)]
+
+
+@pytest.mark.parametrize('n, density, permute', test_symbolic_setups)
+def test_symbolic(n, density, permute):
+    random_state = np.random.RandomState(matrix.tests.random.RANDOM_STATE)
+    A = scipy.sparse.rand(n, n, density=density, format='csc', random_state=random_state)
+    A = A + A.T
+    if permute:
+        p = random_state.permutation(n)
+    else:
+        p = np.arange(n)
+    L_pattern = symbolic_factorization(A, p)
+    # elimination tree
+    parent = matrix.sparse.symbolic.elimination_tree(A, p=p)
+    for j in range(n):
+        rows = np.nonzero(L_pattern[j + 1:, j])[0]
+        expected_parent = rows[0] + j + 1 if len(rows) > 0 else -1
+        assert parent[j] == expected_parent
+    # postorder
+    post = matrix.sparse.symbolic.postorder(parent)
+    assert np.array_equal(np.sort(post), np.arange(n))
+    position = matrix.permute.invert_permutation_vector(post)
+    assert all(parent[j] == -1 or position[j] < position[parent[j]] for j in range(n))
+    # column counts
+    counts = matrix.sparse.symbolic.column_counts(A, parent=parent, post=post, p=p)
+    assert np.array_equal(counts, L_pattern.sum(axis=0))
+    counts = matrix.sparse.symbolic.column_counts(A, p=p)
+    assert np.array_equal(counts, L_pattern.sum(axis=0))
+
+
+# *** symbolic decomposition *** #
+
+test_symbolic_decomposition_setups = [(n, permutation)
+                                      for n in (10,)
+                                      for permutation in (matrix.NO_PERMUTATION_METHOD, matrix.tests.random.permutation_vector(n))]
+
+
+@pytest.mark.parametrize('n, permutation', test_symbolic_decomposition_setups)
+def test_symbolic_decomposition(n, permutation):
+    A = matrix.tests.random.hermitian_matrix(n, dense=False, positive_semidefinite=True, invertible=True)
+    # pattern hash
+    pattern_hash = matrix.sparse.symbolic.pattern_hash(A)
+    B = A.copy()
+    B.data = B.data * 2
+    assert matrix.sparse.symbolic.pattern_hash(B) == pattern_hash
+    assert matrix.sparse.symbolic.pattern_hash(B.tocoo()) == pattern_hash
+    B = A + scipy.sparse.eye(n, k=n - 1)
+    assert matrix.sparse.symbolic.pattern_hash(B) != pattern_hash
+    # analyze
+    symbolic = matrix.analyze(A, permutation=permutation)
+    assert symbolic.n == n
+    assert symbolic.pattern_hash == pattern_hash
+    assert symbolic.is_suitable(A)
+    assert not symbolic.is_suitable(B)
+    assert not symbolic.is_suitable(A[:-1, :-1])
+    if not isinstance(permutation, str):
+        assert np.all(symbolic.p == permutation)
+    # unsuitable matrices
+    with pytest.raises(ValueError):
+        matrix.decompose(B, symbolic=symbolic)
+    with pytest.raises(ValueError):
+        matrix.decompose(A, permutation=permutation, symbolic=symbolic)
+    with pytest.raises(ValueError):
+        matrix.decompose(A.toarray(), symbolic=symbolic)
+    with pytest.raises(ValueError):
+        matrix.analyze(A.toarray())
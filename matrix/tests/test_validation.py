@@ -0,0 +1,89 @@
+import concurrent.futures
+
+import numpy as np
+import pytest
+
+import matrix
+import matrix.approximation.positive_semidefinite
+import matrix.constants
+import matrix.tests.random
+import matrix.util
+import matrix.validation
+
+
+# *** validation level *** #
+
+@pytest.mark.parametrize('validation_level', matrix.constants.VALIDATION_LEVELS)
+def test_validation_level(validation_level):
+    previous_validation_level = matrix.validation.get_validation_level()
+    with matrix.validation.validation_level(validation_level):
+        assert matrix.validation.get_validation_level() == validation_level
+        assert matrix.validation.is_paranoid() == (
+            validation_level == matrix.constants.PARANOID_VALIDATION_LEVEL)
+    assert matrix.validation.get_validation_level() == previous_validation_level
+
+
+def test_validation_level_restored_after_error():
+    previous_validation_level = matrix.validation.get_validation_level()
+    with pytest.raises(RuntimeError):
+        with matrix.validation.validation_level(matrix.constants.FAST_VALIDATION_LEVEL):
+            raise RuntimeError
+    assert matrix.validation.get_validation_level() == previous_validation_level
+
+
+def test_validation_level_invalid():
+    with pytest.raises(ValueError):
+        matrix.validation.set_validation_level('unknown')
+    with pytest.raises(ValueError):
+        with matrix.validation.validation_level('unknown'):
+            pass
+
+
+def test_validation_level_thread_local():
+    def get_validation_level_in_thread():
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(matrix.validation.get_validation_level).result()
+
+    with matrix.validation.validation_level(matrix.constants.FAST_VALIDATION_LEVEL):
+        assert not matrix.validation.is_paranoid()
+        assert get_validation_level_in_thread() == matrix.constants.PARANOID_VALIDATION_LEVEL
+    assert matrix.validation.is_paranoid()
+
+
+test_approximation_with_validation_level_setups = [
+    (n, dense, complex_values, permutation)
+    for n in (10,)
+    for dense in (True, False)
+    for complex_values in (True, False)
+    for permutation in (matrix.constants.NO_PERMUTATION_METHOD,
+                        matrix.approximation.positive_semidefinite.MAXIMAL_STABILITY_PERMUTATION_METHOD,
+                        matrix.approximation.positive_semidefinite.MINIMAL_DIFFERENCE_PERMUTATION_METHOD)
+]
+
+
+@pytest.mark.parametrize('n, dense, complex_values, permutation',
+                         test_approximation_with_validation_level_setups)
+def test_approximation_with_validation_level(n, dense, complex_values, permutation):
+    A = matrix.tests.random.hermitian_matrix(n, dense=dense, complex_values=complex_values) * 10
+    results = []
+    for validation_level in matrix.constants.VALIDATION_LEVELS:
+        with matrix.validation.validation_level(validation_level):
+            decomposition = matrix.approximation.positive_semidefinite.decomposition(
+                A, permutation=permutation, min_diag_D=1)
+            B = matrix.approximation.positive_semidefinite.positive_semidefinite_matrix(
+                A, permutation=permutation, min_diag_D=1)
+            results.append((decomposition, B))
+    assert results[0][0].is_equal(results[1][0])
+    assert matrix.util.is_equal(results[0][1], results[1][1])
+
+
+@pytest.mark.parametrize('approximation_function', (
+    matrix.approximation.positive_semidefinite.GMW_81,
+    matrix.approximation.positive_semidefinite.SE_99))
+def test_GMW_SE_with_validation_level(approximation_function):
+    A = matrix.tests.random.hermitian_matrix(10, dense=True, complex_values=False)
+    results = []
+    for validation_level in matrix.constants.VALIDATION_LEVELS:
+        with matrix.validation.validation_level(validation_level):
+            results.append(approximation_function(A))
+    assert np.all(results[0] == results[1])
@@ -80,17 +80,59 @@ def check_finite(A, check_finite=True):
         raise matrix.errors.MatrixNotFiniteError(matrix=A)
 
 
-def solve_triangular(A, b, lower=True, unit_diagonal=False, overwrite_b=False, check_finite=True, dtype=None):
+def solve_triangular(A, b, lower=True, unit_diagonal=False, conjugate_transpose=False, overwrite_b=False, check_finite=True, dtype=None):
     if scipy.sparse.issparse(A):
         return matrix.sparse.util.solve_triangular(
-            A, b, lower=lower,
+            A, b, lower=lower, unit_diagonal=unit_diagonal, conjugate_transpose=conjugate_transpose,
             overwrite_b=overwrite_b, check_finite=check_finite, dtype=dtype)
     else:
         return matrix.dense.util.solve_triangular(
-            A, b, lower=lower, unit_diagonal=unit_diagonal,
+            A, b, lower=lower, unit_diagonal=unit_diagonal, conjugate_transpose=conjugate_transpose,
             overwrite_b=overwrite_b, check_finite=check_finite, dtype=dtype)
 
 
+def solve_cholesky(L, b, overwrite_b=False, check_finite=True, dtype=None):
+    if scipy.sparse.issparse(L):
+        return matrix.sparse.util.solve_cholesky(
+            L, b, overwrite_b=overwrite_b, check_finite=check_finite, dtype=dtype)
+    else:
+        return matrix.dense.util.solve_cholesky(
+            L, b, overwrite_b=overwrite_b, check_finite=check_finite, dtype=dtype)
+
+
+def multiply_triangular(A, x, lower=True, unit_diagonal=False, conjugate_transpose=False, overwrite_x=False, dtype=None):
+    if scipy.sparse.issparse(A):
+        return matrix.sparse.util.multiply_triangular(
+            A, x, lower=lower, unit_diagonal=unit_diagonal, conjugate_transpose=conjugate_transpose,
+            overwrite_x=overwrite_x, dtype=dtype)
+    else:
+        return matrix.dense.util.multiply_triangular(
+            A, x, lower=lower, unit_diagonal=unit_diagonal, conjugate_transpose=conjugate_transpose,
+            overwrite_x=overwrite_x, dtype=dtype)
+
+
+def set_diagonal(A, d, overwrite_A=False):
+    if scipy.sparse.issparse(A):
+        return matrix.sparse.util.set_diagonal(A, d, overwrite_A=overwrite_A)
+    else:
+        return matrix.dense.util.set_diagonal(A, d, overwrite_A=overwrite_A)
+
+
+def scale_columns(A, s, overwrite_A=False):
+    s = np.asarray(s)
+    if scipy.sparse.issparse(A):
+        return matrix.sparse.util.scale_columns(A, s, overwrite_A=overwrite_A)
+    else:
+        return matrix.dense.util.scale_columns(A, s, overwrite_A=overwrite_A)
+
+
+def is_zero_below_diagonal(A, columns):
+    if scipy.sparse.issparse(A):
+        return matrix.sparse.util.is_zero_below_diagonal(A, columns)
+    else:
+        return matrix.dense.util.is_zero_below_diagonal(A, columns)
+
+
 def set_nearly_zero_to_zero(A, min_abs_value=None):
     # determine dtype resolution
     dtype_resolution = np.finfo(A.dtype).resolution
@@ -0,0 +1,110 @@
+"""
+This module controls how thoroughly the algorithms of this package check their internal consistency.
+
+With the validation level :const:`matrix.constants.PARANOID_VALIDATION_LEVEL` all checks
+are performed. With the validation level :const:`matrix.constants.FAST_VALIDATION_LEVEL`
+only checks with constant costs are performed, whereas checks whose costs grow with the
+size of the matrix (e.g. checking finiteness of vectors in each iteration) are skipped.
+
+The validation level is stored in a context variable. Thus setting it affects only the
+current thread (and the current asynchronous task) and new threads start with the
+validation level :const:`matrix.constants.PARANOID_VALIDATION_LEVEL`.
+"""
+
+import contextlib
+import contextvars
+
+import matrix
+import matrix.constants
+
+
+_validation_level = contextvars.ContextVar('validation_level',
+                                           default=matrix.constants.PARANOID_VALIDATION_LEVEL)
+
+
+def _check_validation_level(validation_level):
+    if validation_level not in matrix.constants.VALIDATION_LEVELS:
+        error = ValueError(f'Unknown validation level {validation_level}. Only values in '
+                           f'{matrix.constants.VALIDATION_LEVELS} are supported.')
+        matrix.logger.error(error)
+        raise error
+
+
+def get_validation_level():
+    """
+    Returns the current validation level.
+
+    Returns
+    -------
+    str
+        The current validation level. It is a value in :const:`matrix.constants.VALIDATION_LEVELS`.
+    """
+
+    return _validation_level.get()
+
+
+def set_validation_level(validation_level):
+    """
+    Sets the validation level of the current thread.
+
+    Parameters
+    ----------
+    validation_level : str
+        The new validation level. It has to be a value in
+        :const:`matrix.constants.VALIDATION_LEVELS`.
+
+    Raises
+    ------
+    ValueError
+        If `validation_level` is unknown.
+    """
+
+    _check_validation_level(validation_level)
+    matrix.logger.debug(f'Setting validation level to {validation_level}.')
+    _validation_level.set(validation_level)
+
+
+@contextlib.contextmanager
+def validation_level(validation_level):
+    """
+    Context manager which sets the validation level of the current thread inside its context.
+
+    The previous validation level is restored on exit.
+
+    Parameters
+    ----------
+    validation_level : str
+        The validation level inside the context. It has to be a value in
+        :const:`matrix.constants.VALIDATION_LEVELS`.
+
+    Raises
+    ------
+    ValueError
+        If `validation_level` is unknown.
+
+    Examples
+    --------
+    >>> with matrix.validation.validation_level(matrix.constants.FAST_VALIDATION_LEVEL):
+    ...     B = matrix.approximation.positive_semidefinite.positive_semidefinite_matrix(A)
+    """
+
+    _check_validation_level(validation_level)
+    matrix.logger.debug(f'Setting validation level to {validation_level}.')
+    token = _validation_level.set(validation_level)
+    try:
+        yield
+    finally:
+        _validation_level.reset(token)
+
+
+def is_paranoid():
+    """
+    Returns whether all consistency checks should be performed.
+
+    Returns
+    -------
+    bool
+        Whether the current validation level is :const:`matrix.constants.PARANOID_VALIDATION_LEVEL`.
+    """
+
+    return _validation_level.get() == matrix.constants.PARANOID_VALIDATION_LEVEL